@@ -1,4 +1,18 @@
 import random
+from itertools import chain
+
+# .dat 출력 형식 / 생성 규칙 버전 (바뀌면 올려서, 미리 만들어 둔 커스텀 미로 캐시가 다시 생성되도록)
+MAZE_FORMAT_VERSION = 1
+
+# export_to_dat: 박스 하나의 정점 8개 / 면 6개 출력 형식과 면의 정점 순서 (박스의 첫 정점 기준)
+_BOX_VERTEX_FORMAT = "%.6f %.6f %.6f\n" * 8
+_BOX_FACE_FORMAT = "4 %d %d %d %d\n" * 6
+_BOX_FACE_INDICES = (0, 3, 2, 1,  # Bottom
+                     4, 5, 6, 7,  # Top
+                     0, 1, 5, 4,  # Front
+                     1, 2, 6, 5,  # Right
+                     2, 3, 7, 6,  # Back
+                     3, 0, 4, 7)  # Left
 
 class Maze:
     """
@@ -149,8 +163,7 @@ class Maze:
             wall_thickness (float): 벽 두께 (0.1~1.0, 기본값 1.0).
             wall_height (float): 벽 높이 (기본값 1.0).
         """
-        vertices = []
-        faces = []
+        boxes = []  # (x0, x1, y0, y1, z0, z1) - 박스 하나당 정점 8개, 면 6개 (파일 쓸 때 한 번에 전개)
 
         # 미로 스케일 및 오프셋 설정 (중앙 정렬)
         scale = 1.0  # 그리드 셀 간격 (고정)
@@ -163,57 +176,15 @@ class Maze:
         offset_x = -(self.width * scale) / 2
         offset_z = -(self.height * scale) / 2
 
-        vertex_count = 0
         floor_thickness = 0.1  # 바닥 두께
 
         def add_box(x0, x1, z0, z1):
-            """박스(큐브) 하나를 vertices와 faces에 추가"""
-            nonlocal vertex_count
-            # Bottom (y=0)
-            v_bottom = [
-                (x0, 0, z0), (x1, 0, z0),
-                (x1, 0, z1), (x0, 0, z1)
-            ]
-            # Top (y=height)
-            v_top = [
-                (x0, height, z0), (x1, height, z0),
-                (x1, height, z1), (x0, height, z1)
-            ]
-            vertices.extend(v_bottom + v_top)
-
-            base = vertex_count
-            faces.append((base+0, base+3, base+2, base+1))  # Bottom
-            faces.append((base+4, base+5, base+6, base+7))  # Top
-            faces.append((base+0, base+1, base+5, base+4))  # Front
-            faces.append((base+1, base+2, base+6, base+5))  # Right
-            faces.append((base+2, base+3, base+7, base+6))  # Back
-            faces.append((base+3, base+0, base+4, base+7))  # Left
-            vertex_count += 8
+            """벽 박스(y=0 ~ height) 하나를 추가"""
+            boxes.append((x0, x1, 0, height, z0, z1))
 
         def add_floor_box(x0, x1, z0, z1, floor_top_y=0.0):
-            """바닥 박스를 vertices와 faces에 추가 (아래면 고정, 윗면만 높아짐)"""
-            nonlocal vertex_count
-            floor_bottom_y = -floor_thickness  # 아래면 항상 고정
-            # Bottom (y=-floor_thickness, 고정)
-            v_bottom = [
-                (x0, floor_bottom_y, z0), (x1, floor_bottom_y, z0),
-                (x1, floor_bottom_y, z1), (x0, floor_bottom_y, z1)
-            ]
-            # Top (y=floor_top_y, 가변 - 높이 변화 시 두께가 증가)
-            v_top = [
-                (x0, floor_top_y, z0), (x1, floor_top_y, z0),
-                (x1, floor_top_y, z1), (x0, floor_top_y, z1)
-            ]
-            vertices.extend(v_bottom + v_top)
-
-            base = vertex_count
-            faces.append((base+0, base+3, base+2, base+1))  # Bottom
-            faces.append((base+4, base+5, base+6, base+7))  # Top
-            faces.append((base+0, base+1, base+5, base+4))  # Front
-            faces.append((base+1, base+2, base+6, base+5))  # Right
-            faces.append((base+2, base+3, base+7, base+6))  # Back
-            faces.append((base+3, base+0, base+4, base+7))  # Left
-            vertex_count += 8
+            """바닥 박스를 추가 (아래면 y=-floor_thickness 고정, 윗면만 높아짐)"""
+            boxes.append((x0, x1, -floor_thickness, floor_top_y, z0, z1))
 
         for y in range(self.height):
             for x in range(self.width):
@@ -277,28 +248,29 @@ class Maze:
                 # 2. 경로 데이터 (0개 - SOR 생성 방지)
                 f.write("0\n")
 
-                # 3. 3D 정점 데이터
-                f.write(f"{len(vertices)}\n")
-                for v in vertices:
-                    f.write(f"{v[0]:.6f} {v[1]:.6f} {v[2]:.6f}\n")
+                # 3. 3D 정점 데이터 (박스마다 아래면 4개 → 윗면 4개)
+                # 줄마다 포맷/쓰기를 반복하지 않고, 블록별로 % 연산 한 번에 문자열을 만들어 씀
+                f.write(f"{len(boxes) * 8}\n")
+                f.write(_BOX_VERTEX_FORMAT * len(boxes) % tuple(chain.from_iterable(
+                    (x0, y0, z0, x1, y0, z0, x1, y0, z1, x0, y0, z1,
+                     x0, y1, z0, x1, y1, z0, x1, y1, z1, x0, y1, z1)
+                    for x0, x1, y0, y1, z0, z1 in boxes)))
 
-                # 4. 면 데이터
-                f.write(f"{len(faces)}\n")
-                for face in faces:
-                    f.write(f"4 {face[0]} {face[1]} {face[2]} {face[3]}\n")
+                # 4. 면 데이터 (박스마다 Bottom, Top, Front, Right, Back, Left)
+                f.write(f"{len(boxes) * 6}\n")
+                f.write(_BOX_FACE_FORMAT * len(boxes) % tuple(chain.from_iterable(
+                    [base + i for i in _BOX_FACE_INDICES] for base in range(0, len(boxes) * 8, 8))))
 
                 # 5. 바닥 높이 데이터 (v7 전용)
                 if self.enable_height_variation and self.floor_heights:
                     f.write(f"{len(self.floor_heights)}\n")
-                    for (gx, gz), h in self.floor_heights.items():
-                        f.write(f"{gx} {gz} {h:.2f}\n")
+                    f.write("".join(f"{gx} {gz} {h:.2f}\n" for (gx, gz), h in self.floor_heights.items()))
                 else:
                     f.write("0\n")
 
                 # 6. 미로 그리드 데이터 (v7 전용)
                 f.write(f"{self.width} {self.height}\n")
-                for row in self.grid:
-                    f.write("".join(str(cell) for cell in row) + "\n")
+                f.write("".join("".join(map(str, row)) + "\n" for row in self.grid))
 
             print(f"미로가 성공적으로 내보내졌습니다: {filename}")
         except Exception as e:
@@ -3,17 +3,19 @@
 Miro Game OpenGL Widget - 1인칭 미로 게임
 """
 
+import ctypes
 import math
 import os
 import glob
 import random
 import numpy as np
 from PyQt5.QtWidgets import QOpenGLWidget
-from PyQt5.QtCore import Qt, QTimer, pyqtSignal, QPoint
-from PyQt5.QtGui import QCursor, QImage
+from PyQt5.QtCore import Qt, QTimer, pyqtSignal, QPoint, QRect
+from PyQt5.QtGui import QCursor, QImage, QPainter
 
 from OpenGL.GL import *
 from OpenGL.GLU import *
+from OpenGL.GL.EXT.texture_compression_s3tc import GL_COMPRESSED_RGBA_S3TC_DXT5_EXT
 from miro_weather import WeatherSystem
 from resource_path import get_resource_path, get_user_data_path
 
@@ -22,6 +24,7 @@ PLAYER_HEIGHT = 0.8       # 눈높이
 PLAYER_RADIUS = 0.25      # 충돌 반경
 MOVE_SPEED = 0.08         # 이동 속도
 MOUSE_SENSITIVITY = 0.15  # 마우스 감도
+MAX_PITCH = math.radians(89)  # 상하 시점 제한
 GAME_TICK_MS = 16         # ~60 FPS
 
 # 점프 물리 상수
@@ -29,6 +32,27 @@ GRAVITY = -15.0           # 중력 가속도 (units/sec^2)
 JUMP_VELOCITY = 5.0       # 점프 초기 속도
 MAX_STEP_HEIGHT = 0.3     # 점프 없이 오를 수 있는 최대 높이
 
+# 키 입력 상수 (이벤트마다 Qt 속성 조회/튜플 생성 방지)
+KEY_W = int(Qt.Key_W)
+KEY_A = int(Qt.Key_A)
+KEY_S = int(Qt.Key_S)
+KEY_D = int(Qt.Key_D)
+KEY_SPACE = int(Qt.Key_Space)
+KEY_ESCAPE = int(Qt.Key_Escape)
+KEY_SHIFT = int(Qt.Key_Shift)
+KEY_1 = int(Qt.Key_1)
+KEY_2 = int(Qt.Key_2)
+KEY_3 = int(Qt.Key_3)
+KEY_4 = int(Qt.Key_4)
+KEY_5 = int(Qt.Key_5)
+KEY_6 = int(Qt.Key_6)
+
+# 이동 키 비트마스크 (W=1, S=2, A=4, D=8)
+MOVE_KEY_BITS = {KEY_W: 1, KEY_S: 2, KEY_A: 4, KEY_D: 8}
+# 마스크 조합별 (전진, 측면) 이동 계수: 전진 = W - S, 측면 = A - D
+MOVE_TABLE = tuple(((mask & 1) - ((mask >> 1) & 1), ((mask >> 2) & 1) - ((mask >> 3) & 1))
+                   for mask in range(16))
+
 # 아이템 상수
 ITEM_COUNT = 3
 ITEM_PICKUP_RADIUS = 0.5
@@ -37,12 +61,45 @@ ITEM_BOB_SPEED = 3.0         # radians per second
 ITEM_BOB_AMPLITUDE = 0.15    # world units
 ITEM_HEIGHT = 0.5            # base height above floor
 ITEM_TARGET_SIZE_RATIO = 0.8 # 타일 크기 대비 아이템 크기 비율
+ITEM_SPAWN_CLEARANCE = 1.5   # 시작점/골로부터 최소 스폰 거리
+ITEM_SPAWN_CLEARANCE_SQ = ITEM_SPAWN_CLEARANCE * ITEM_SPAWN_CLEARANCE
+ITEM_PICKUP_RADIUS_SQ = ITEM_PICKUP_RADIUS * ITEM_PICKUP_RADIUS
+
+# 목표 지점 기둥 상수
+GOAL_PILLAR_RADIUS = 0.3
+GOAL_PILLAR_HEIGHT = 2.0
+GOAL_PILLAR_SEGMENTS = 16
+GOAL_RADIUS = 0.5              # 도달 판정 반경
+GOAL_RADIUS_SQ = GOAL_RADIUS * GOAL_RADIUS
 
 # 그림자 상수
 SHADOW_SEGMENTS = 16           # 원형 그림자 세그먼트 수
 SHADOW_BASE_RADIUS = 0.5       # 기본 그림자 반지름
 SHADOW_BASE_ALPHA = 0.4        # 기본 그림자 투명도
 SHADOW_Y_OFFSET = 0.01         # z-fighting 방지용 오프셋
+# 원형 그림자/플레이어 마커용 단위원 (cos, sin) 테이블 (프레임마다 삼각함수 재계산 방지)
+CIRCLE_TABLE = tuple((math.cos(2.0 * math.pi * i / SHADOW_SEGMENTS), math.sin(2.0 * math.pi * i / SHADOW_SEGMENTS))
+                     for i in range(SHADOW_SEGMENTS + 1))
+
+# 지오메트리 조립용 정점 배열: [x, y, z, nx, ny, nz, u, v] (float32)
+VERTEX_FLOATS = 8
+# 인터리브 VBO 업로드 레이아웃: 위치/UV는 float32, 법선은 정규화 int8 (+패딩 1바이트로 4바이트 정렬)
+VERTEX_DTYPE = np.dtype([('position', np.float32, 3), ('normal', np.int8, 4), ('uv', np.float32, 2)])
+VERTEX_STRIDE = VERTEX_DTYPE.itemsize                                      # 24 bytes
+VERTEX_NORMAL_OFFSET = ctypes.c_void_p(VERTEX_DTYPE.fields['normal'][1])   # 12 bytes
+VERTEX_UV_OFFSET = ctypes.c_void_p(VERTEX_DTYPE.fields['uv'][1])           # 16 bytes
+
+# 절두체 컬링: 배치를 XZ 평면의 정사각 타일로 나눠 타일 단위로 가시성 판정
+CULL_TILE_SIZE = 4.0           # 타일 한 변 길이 (world units)
+
+# 원거리 LOD: 안개 계수 exp(-(density*d)^2)가 1/255 미만인 깊이부터는 벽이 안개색으로만 보이므로
+# 벽 런(run)을 병합한 저해상도 메시를 텍스처 없이 그림 (LOD 깊이 = LOD_FOG_DEPTH / fog_density)
+LOD_FOG_DEPTH = math.sqrt(math.log(255.0))
+
+# 텍스처 아틀라스 (벽 텍스처를 한 장으로 합쳐 단일 배치로 렌더링)
+ATLAS_MAX_SIZE = 4096          # 아틀라스 한 변 최대 크기 (px)
+ATLAS_MAX_MIP_LEVEL = 4        # 아틀라스 밉맵 최대 레벨 (작은 밉에서 인접 타일 색 번짐 제한)
+TEXTURE_PBO_COUNT = 2          # 텍스처 업로드용 PBO 개수 (번갈아 사용해 직전 전송과 겹치지 않도록)
 
 # 테마 설정
 THEMES = {
@@ -52,6 +109,78 @@ THEMES = {
     "Developer": "theme_developer"
 }
 
+def _look_at_matrix(eye, forward, up):
+    """
+    gluLookAt과 같은 뷰 행렬을 열 우선(column-major) 16개 float 리스트로 생성 (glLoadMatrixf용).
+    forward는 단위 벡터여야 합니다.
+    """
+    fx, fy, fz = forward
+    ux, uy, uz = up
+    # side = normalize(forward × up)
+    sx, sy, sz = fy * uz - fz * uy, fz * ux - fx * uz, fx * uy - fy * ux
+    inv_len = 1.0 / math.sqrt(sx * sx + sy * sy + sz * sz)
+    sx, sy, sz = sx * inv_len, sy * inv_len, sz * inv_len
+    # up' = side × forward
+    ux, uy, uz = sy * fz - sz * fy, sz * fx - sx * fz, sx * fy - sy * fx
+    ex, ey, ez = eye
+    return [sx, ux, -fx, 0.0,
+            sy, uy, -fy, 0.0,
+            sz, uz, -fz, 0.0,
+            -(sx * ex + sy * ey + sz * ez), -(ux * ex + uy * ey + uz * ez), fx * ex + fy * ey + fz * ez, 1.0]
+
+
+def _pack_vertices(data):
+    """(..., 8) float32 조립 배열 → VERTEX_DTYPE 업로드 배열 (법선은 [-127, 127] 정수로 양자화)"""
+    flat = data.reshape(-1, VERTEX_FLOATS)
+    packed = np.zeros(len(flat), dtype=VERTEX_DTYPE)
+    packed['position'] = flat[:, 0:3]
+    packed['normal'][:, 0:3] = np.rint(flat[:, 3:6] * 127.0)
+    packed['uv'] = flat[:, 6:8]
+    return packed
+
+
+def _pack_grid_rows(grid):
+    """(H, W) 그리드의 벽(1) 셀을 행마다 파이썬 int 비트마스크로 묶음 (비트 gx = 열 gx)"""
+    if grid.size == 0:
+        return ()
+    packed = np.packbits(grid == 1, axis=1, bitorder='little')
+    return tuple(int.from_bytes(row.tobytes(), 'little') for row in packed)
+
+
+def _make_grid_blocked(row_bits, grid_width, min_x, min_z, inv_scale, radius=PLAYER_RADIUS):
+    """
+    로드된 그리드에 특화된 충돌 검사 함수 blocked(x, z) 생성.
+    그리드 파라미터를 클로저 지역 변수로 묶어 호출마다 속성 조회를 하지 않습니다.
+
+    blocked(x, z)는 (x, z) 중심의 반경 3x3 샘플 지점 중 벽(1) 또는 그리드 밖이 있으면 True.
+    샘플 좌표의 셀 인덱스는 단조 증가하고 반경이 한 칸 이하라 샘플이 덮는 셀은
+    [lo, hi] 연속 구간과 같으므로, 행마다 구간 비트마스크와 AND 한 번으로 검사합니다.
+    """
+    # 반경이 한 칸을 넘으면 샘플 사이에 건너뛰는 셀이 생겨 구간 검사와 결과가 달라짐
+    if radius * inv_scale > 1.0:
+        raise ValueError(f"충돌 반경 {radius}이(가) 그리드 한 칸({1.0 / inv_scale})보다 큼")
+    grid_height = len(row_bits)
+
+    def blocked(x, z):
+        gx_lo = int((x - radius - min_x) * inv_scale)
+        gx_hi = int((x + radius - min_x) * inv_scale)
+        gz_lo = int((z - radius - min_z) * inv_scale)
+        gz_hi = int((z + radius - min_z) * inv_scale)
+
+        # 범위 밖 = 충돌 (미로 밖으로 나갈 수 없음)
+        if gx_lo < 0 or gz_lo < 0 or gx_hi >= grid_width or gz_hi >= grid_height:
+            return True
+
+        # 벽 충돌: 열 구간 [gx_lo, gx_hi] 비트마스크
+        span = ((2 << (gx_hi - gx_lo)) - 1) << gx_lo
+        for gz in range(gz_lo, gz_hi + 1):
+            if row_bits[gz] & span:
+                return True
+        return False
+
+    return blocked
+
+
 class MiroOpenGLWidget(QOpenGLWidget):
     """
     1인칭 미로 게임을 위한 OpenGL 위젯.
@@ -83,32 +212,37 @@ class MiroOpenGLWidget(QOpenGLWidget):
         self.player_pos = [0.0, PLAYER_HEIGHT, 0.0]  # x, y, z
         self.player_yaw = 0.0      # 좌우 회전 (라디안)
         self.player_pitch = 0.0    # 상하 회전 (라디안)
+        self._sin_yaw = 0.0        # yaw 삼각함수 캐시 (yaw 변경 시에만 갱신)
+        self._cos_yaw = 1.0
+        self._look_dir = (0.0, 0.0, 1.0)  # 시선 방향 캐시 (yaw/pitch 변경 시에만 갱신)
 
         # 수직 물리 상태
         self.player_velocity_y = 0.0    # 수직 속도
         self.is_grounded = True         # 지면 접촉 여부
         self.floor_height_map = {}      # (gx, gz) -> height
 
-        # 키 입력 상태
-        self.keys_pressed = set()
+        # 키 입력 상태 (이동 키 비트마스크, MOVE_KEY_BITS 참고)
+        self.key_mask = 0
 
         # 미로 데이터 (기존 유지)
-        self.maze_vertices = []
+        self.maze_vertices = np.zeros((0, 3), dtype=np.float32)  # (N, 3) float32
         self.maze_faces = []
-        self.wall_faces = []   # 벽 면 데이터 보관
-        self.floor_faces = []  # 바닥 면 데이터 보관
-        self.maze_normals = []
+        self.maze_face_matrix = np.zeros((0, 0), dtype=np.int32)  # (F, Kmax) 패딩된 면 인덱스
+        self.maze_face_mask = np.zeros((0, 0), dtype=bool)        # 패딩 칸은 False
+        self.maze_wall_mask = np.zeros(0, dtype=bool)  # 면별 벽 여부 (False면 바닥)
+        self.maze_normals = np.zeros((0, 3), dtype=np.float32)  # (F, 3) 면 법선
         self.maze_width = 0
         self.maze_height = 0
-        self.maze_grid = []
+        self.maze_grid = np.zeros((0, 0), dtype=np.uint8)  # (H, W) 0=통로, 1=벽
         self.grid_min_x = 0.0
         self.grid_min_z = 0.0
         self.grid_scale = 1.0
+        self.grid_inv_scale = 1.0    # 1 / grid_scale (충돌 검사에서 나눗셈 대신 곱셈)
+        self._grid_blocked = None    # 현재 그리드에 특화된 충돌 검사 함수 (_make_grid_blocked)
 
         # 시작/목표 위치 (기존 유지)
         self.start_pos = [0.0, 0.0]
         self.goal_pos = [0.0, 0.0]
-        self.goal_radius = 0.5
 
         # 게임 상태
         self.game_active = False
@@ -124,23 +258,35 @@ class MiroOpenGLWidget(QOpenGLWidget):
         # 게임 루프 타이머
         self.game_timer = QTimer(self)
         self.game_timer.timeout.connect(self._update_game)
+        self._last_frame_state = None  # 마지막으로 그린 프레임의 상태 (변화 없으면 재렌더링 생략)
 
         # 키보드 포커스 설정
         self.setFocusPolicy(Qt.StrongFocus)
 
         # VBO IDs (Batch Rendering용 리스트 구조로 변경 예정 - 초기화는 None)
-        self.wall_batches = []  # [{'texture_id': id, 'vbo_v': v, 'vbo_uv': uv, 'vbo_n': n, 'count': c}, ...]
+        self.wall_batches = []  # [{'texture_id': id, 'vbo': 인터리브 VBO, 'ibo': 인덱스 버퍼, 'index_count': c}, ...]
         self.floor_batches = []
         self.trap_batches = []  # 함정 타일 (검은색)
+        self.wall_far_batches = []  # 원거리 LOD용 병합 벽 (텍스처 없음)
+        # 배치별 공간 타일: 'tile_bounds' (T, 2, 3) AABB, 'tile_offsets' (T+1,) 인덱스 오프셋,
+        #                  'tile_lod_bounds' (T, 2, 3) 타일 격자 칸 전체 박스 (배치 간 동일 → LOD 판정 일치)
+        self._frustum_planes = None  # (6, 4) 현재 프레임 절두체 평면
+        self._lod_depth = None       # 현재 프레임 LOD 전환 깊이 (None이면 LOD 미사용)
+        self._lod_eye = None         # 현재 프레임 눈 위치 / 시선 방향 (float32, 배치마다 재변환 방지)
+        self._lod_look = None
         
         # 텍스처 ID 관리 (리스트)
         self.theme_textures = {
-            'walls': [],
+            'walls': [],   # 벽은 아틀라스 텍스처 1장
             'floors': []
         }
-        
-        # Wireframe VBO (Cleanup 시 필요)
-        self.vbo_wireframe_indices = None
+        self.wall_atlas_tiles = np.zeros((0, 4), dtype=np.float32)  # 타일별 (u_off, v_off, u_scale, v_scale)
+        self.texture_internal_format = None  # 바닥 타일용 압축 포맷, 첫 업로드 시 결정 (DXT5 또는 RGB5_A1)
+        self.texture_pbos = []               # 텍스처 업로드용 픽셀 언팩 버퍼 (TEXTURE_PBO_COUNT개, 번갈아 사용)
+        self.texture_pbo_index = 0
+        self.texture_upload_queue = []       # [(texture_id, file_path)] 프레임마다 하나씩 업로드
+        self.texture_substitutes = {}        # 업로드 대기 중인 텍스처 ID → 그동안 대신 쓸 업로드된 텍스처 ID
+        self.texture_upload_scheduled = False
 
         # VBO 메타데이터
         self.vbo_initialized = False
@@ -154,12 +300,13 @@ class MiroOpenGLWidget(QOpenGLWidget):
         # 날씨 시스템
         self.weather = WeatherSystem()
 
-        # 캐싱된 Quadric (목표 지점 렌더링용)
-        self.goal_quadric = None
+        # 목표 지점 기둥 VBO (initializeGL에서 한 번 생성)
+        self.goal_vbo = None
+        self.goal_vertex_count = 0
 
         # 스카이돔
         self.skydome_texture = None
-        self.skydome_quadric = None
+        self.skydome_list = None  # 구 테셀레이션을 담은 디스플레이 리스트
 
         # 아이템 시스템
         self.items = []              # [{'pos': [x, z], 'rotation': float, 'bob_phase': float, 'model_idx': int}]
@@ -290,13 +437,11 @@ class MiroOpenGLWidget(QOpenGLWidget):
         glLightfv(GL_LIGHT0, GL_AMBIENT, [0.4, 0.4, 0.4, 1.0]) # 조금 더 밝게
         glLightfv(GL_LIGHT0, GL_DIFFUSE, [0.7, 0.7, 0.7, 1.0])
 
-        # 캐싱된 Quadric 생성 (목표 지점 렌더링용)
-        self.goal_quadric = gluNewQuadric()
-        gluQuadricNormals(self.goal_quadric, GLU_SMOOTH)
+        # 목표 지점 기둥 VBO 생성 (매 프레임 GLU 테셀레이션 제거)
+        self._create_goal_vbo()
 
         # 스카이돔 초기화
-        self.skydome_quadric = gluNewQuadric()
-        gluQuadricNormals(self.skydome_quadric, GLU_SMOOTH)
+        self._create_skydome_list()
         self._load_skydome_texture()
 
         # 아이템 모델 로드 (이미 설정된 경우 스킵)
@@ -307,9 +452,9 @@ class MiroOpenGLWidget(QOpenGLWidget):
         self._load_textures()
 
         # 지연된 VBO 생성 (데이터는 로드되었으나 VBO가 없는 경우)
-        if self.maze_vertices and not self.vbo_initialized:
+        if len(self.maze_vertices) and not self.vbo_initialized:
             self.makeCurrent()
-            self._create_vbos(self.wall_faces, self.floor_faces)
+            self._create_vbos()
             self.doneCurrent()
 
         # 아이템 그림자 VBO 생성 (High 품질용)
@@ -323,9 +468,11 @@ class MiroOpenGLWidget(QOpenGLWidget):
     def _load_textures(self):
         """현재 테마에 맞는 텍스처 로드"""
         
-        # 기존 텍스처 삭제
+        # 기존 텍스처 삭제 (대기 중인 업로드도 취소)
         for t_id in self.theme_textures['walls'] + self.theme_textures['floors']:
             if t_id: glDeleteTextures([t_id])
+        self.texture_upload_queue = []
+        self.texture_substitutes = {}
             
         self.theme_textures['walls'] = []
         self.theme_textures['floors'] = []
@@ -338,23 +485,109 @@ class MiroOpenGLWidget(QOpenGLWidget):
 
         theme_prefix = THEMES.get(self.current_theme, "theme_810")
 
-        # 벽 텍스처 로드 (glob 사용)
+        # 벽 텍스처 로드 (glob 사용) - 한 장의 아틀라스로 합쳐 업로드
         wall_pattern = os.path.join(assets_path, f"{theme_prefix}_wall_*.png")
         wall_files = sorted(glob.glob(wall_pattern))
-        for f in wall_files:
-            t_id = self._create_texture(f)
+        atlas_image, self.wall_atlas_tiles = self._build_texture_atlas(wall_files)
+        if atlas_image is not None:
+            t_id = self._upload_texture(atlas_image, GL_CLAMP_TO_EDGE, ATLAS_MAX_MIP_LEVEL)
             if t_id: self.theme_textures['walls'].append(t_id)
 
-        # 바닥 텍스처 로드
+        # 바닥 텍스처: 첫 장은 바로 업로드하고, 나머지는 ID만 먼저 할당해 업로드를 다음 프레임들로 분산
+        # (업로드 전까지는 첫 장으로 대신 그려 바닥이 텍스처 없이 깜빡이지 않도록)
         floor_pattern = os.path.join(assets_path, f"{theme_prefix}_floor_*.png")
         floor_files = sorted(glob.glob(floor_pattern))
+        first_floor = None
         for f in floor_files:
-            t_id = self._create_texture(f)
-            if t_id: self.theme_textures['floors'].append(t_id)
+            if first_floor is None:
+                first_floor = self._create_texture(f, internal_format=self._get_texture_internal_format())
+                if first_floor:
+                    self.theme_textures['floors'].append(first_floor)
+                continue
+            t_id = glGenTextures(1)
+            self.theme_textures['floors'].append(t_id)
+            self.texture_upload_queue.append((t_id, f))
+            if first_floor:
+                self.texture_substitutes[t_id] = first_floor
+        self._schedule_texture_upload()
             
-        print(f"Theme '{self.current_theme}' loaded: {len(self.theme_textures['walls'])} walls, {len(self.theme_textures['floors'])} floors")
+        print(f"Theme '{self.current_theme}' loaded: {len(self.wall_atlas_tiles)} walls (atlas), {len(self.theme_textures['floors'])} floors ({len(self.texture_upload_queue)} queued)")
+
+    def _schedule_texture_upload(self):
+        """대기 중인 텍스처 업로드를 다음 이벤트 루프 턴에 예약"""
+        if self.texture_upload_queue and not self.texture_upload_scheduled:
+            self.texture_upload_scheduled = True
+            QTimer.singleShot(0, self._upload_next_texture)
+
+    def _upload_next_texture(self):
+        """대기열에서 텍스처 하나를 로드/업로드 (한 번에 하나씩 처리해 프레임 정지 방지)"""
+        self.texture_upload_scheduled = False
+        if not self.texture_upload_queue or not self.isValid():
+            return
+
+        texture_id, file_path = self.texture_upload_queue.pop(0)
+        image = QImage(file_path)
+        if image.isNull():
+            print(f"Failed to load image: {file_path}") # 대체 텍스처로 계속 그림
+        else:
+            self.texture_substitutes.pop(texture_id, None)
+            self.makeCurrent()
+            self._upload_texture(image, texture_id=texture_id,
+                                 internal_format=self._get_texture_internal_format())
+            self.doneCurrent()
+            self.update()
+
+        self._schedule_texture_upload()
 
-    def _create_texture(self, file_path):
+    def _build_texture_atlas(self, file_paths):
+        """
+        여러 텍스처 이미지를 격자 형태의 아틀라스 이미지 한 장으로 합칩니다.
+
+        Returns:
+            (QImage 또는 None, (N, 4) float32 타일 UV 영역 배열)
+        """
+        images = []
+        for file_path in file_paths:
+            image = QImage(file_path)
+            if image.isNull():
+                print(f"Failed to load image: {file_path}")
+                continue
+            images.append(image)
+
+        if not images:
+            return None, np.zeros((0, 4), dtype=np.float32)
+
+        # 격자 크기: 정사각형에 가깝게 배치
+        cols = math.ceil(math.sqrt(len(images)))
+        rows = math.ceil(len(images) / cols)
+
+        # 타일 크기: 가장 큰 이미지 기준, 아틀라스가 최대 크기를 넘지 않도록 축소
+        tile_w = max(image.width() for image in images)
+        tile_h = max(image.height() for image in images)
+        max_size = min(ATLAS_MAX_SIZE, glGetIntegerv(GL_MAX_TEXTURE_SIZE))
+        scale = min(1.0, max_size / (cols * tile_w), max_size / (rows * tile_h))
+        tile_w = max(2, int(tile_w * scale))
+        tile_h = max(2, int(tile_h * scale))
+        atlas_w = cols * tile_w
+        atlas_h = rows * tile_h
+
+        atlas = QImage(atlas_w, atlas_h, QImage.Format_ARGB32_Premultiplied)
+        atlas.fill(Qt.transparent)
+        tiles = np.empty((len(images), 4), dtype=np.float32)
+
+        painter = QPainter(atlas)
+        painter.setRenderHint(QPainter.SmoothPixmapTransform)
+        for i, image in enumerate(images):
+            col, row = i % cols, i // cols
+            painter.drawImage(QRect(col * tile_w, row * tile_h, tile_w, tile_h), image)
+            # 반 텍셀 안쪽으로 UV 범위 축소 (선형 필터링 시 인접 타일 번짐 방지)
+            tiles[i] = ((col * tile_w + 0.5) / atlas_w, (row * tile_h + 0.5) / atlas_h,
+                        (tile_w - 1) / atlas_w, (tile_h - 1) / atlas_h)
+        painter.end()
+
+        return atlas, tiles
+
+    def _create_texture(self, file_path, internal_format=GL_RGBA8):
         """단일 텍스처 생성 헬퍼"""
         if not os.path.exists(file_path):
             print(f"Texture not found: {file_path}")
@@ -364,25 +597,73 @@ class MiroOpenGLWidget(QOpenGLWidget):
         if image.isNull():
             print(f"Failed to load image: {file_path}")
             return None
-            
+
+        return self._upload_texture(image, internal_format=internal_format)
+
+    def _get_texture_internal_format(self):
+        """
+        반복 타일 바닥 텍스처용 포맷: S3TC 지원 시 DXT5 압축, 아니면 16비트 RGB5_A1.
+        (큰 아틀라스/스카이돔은 압축 비용과 그라데이션 밴딩을 피하려고 GL_RGBA8 유지)
+        """
+        if self.texture_internal_format is None:
+            extensions = glGetString(GL_EXTENSIONS) or b''
+            if b'GL_EXT_texture_compression_s3tc' in extensions:
+                self.texture_internal_format = GL_COMPRESSED_RGBA_S3TC_DXT5_EXT
+            else:
+                self.texture_internal_format = GL_RGB5_A1
+        return self.texture_internal_format
+
+    def _upload_texture(self, image, wrap_mode=GL_REPEAT, max_mip_level=None, texture_id=None,
+                        internal_format=GL_RGBA8):
+        """QImage를 GL 텍스처로 업로드 (PBO 경유, internal_format 지정 가능 + 밉맵)"""
         # OpenGL 호환 포맷으로 변환
         image = image.convertToFormat(QImage.Format_RGBA8888)
         width = image.width()
         height = image.height()
-        ptr = image.bits()
+        # 픽셀 버퍼를 복사 없이 numpy 뷰로 공유 (image가 업로드 끝까지 살아 있어야 함)
+        ptr = image.constBits()
         ptr.setsize(image.byteCount())
-        data = ptr.asstring()
+        data = np.frombuffer(ptr, dtype=np.uint8).reshape(height, width, 4)
         
-        texture_id = glGenTextures(1)
+        if texture_id is None:
+            texture_id = glGenTextures(1)
         glBindTexture(GL_TEXTURE_2D, texture_id)
         
-        # 텍스처 파라미터 설정 (반복, 선형 필터링)
-        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_S, GL_REPEAT)
-        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_T, GL_REPEAT)
-        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_LINEAR)
+        # 텍스처 파라미터 설정 (반복/가장자리 고정, 트라이리니어 필터링)
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_S, wrap_mode)
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_T, wrap_mode)
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_LINEAR_MIPMAP_LINEAR)
         glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_LINEAR)
-        
-        glTexImage2D(GL_TEXTURE_2D, 0, GL_RGBA, width, height, 0, GL_RGBA, GL_UNSIGNED_BYTE, data)
+        if max_mip_level is not None:
+            glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAX_LEVEL, max_mip_level)
+
+        # 밉맵 생성: GL 3.0 glGenerateMipmap, 없으면 GL 1.4 자동 생성 플래그
+        use_generate_mipmap = bool(glGenerateMipmap)
+        if not use_generate_mipmap:
+            glTexParameteri(GL_TEXTURE_2D, GL_GENERATE_MIPMAP, GL_TRUE)
+
+        # 픽셀 언팩 버퍼에 매핑 복사 후 업로드 (드라이버가 DMA로 비동기 전송)
+        # PBO를 번갈아 써서, 직전 업로드의 전송이 끝나기를 기다리지 않고 다음 버퍼를 매핑
+        if not self.texture_pbos:
+            self.texture_pbos = [int(pbo) for pbo in np.atleast_1d(glGenBuffers(TEXTURE_PBO_COUNT))]
+        pbo = self.texture_pbos[self.texture_pbo_index]
+        self.texture_pbo_index = (self.texture_pbo_index + 1) % len(self.texture_pbos)
+        glBindBuffer(GL_PIXEL_UNPACK_BUFFER, pbo)
+        glBufferData(GL_PIXEL_UNPACK_BUFFER, data.nbytes, None, GL_STREAM_DRAW)  # 이전 저장소 분리(orphan)
+        mapped = glMapBuffer(GL_PIXEL_UNPACK_BUFFER, GL_WRITE_ONLY)
+        if mapped:
+            ctypes.memmove(mapped, data.ctypes.data, data.nbytes)
+            glUnmapBuffer(GL_PIXEL_UNPACK_BUFFER)
+            pixels = None  # 바인딩된 PBO의 오프셋 0
+        else:
+            glBindBuffer(GL_PIXEL_UNPACK_BUFFER, 0)
+            pixels = data
+
+        glTexImage2D(GL_TEXTURE_2D, 0, internal_format, width, height, 0, GL_RGBA, GL_UNSIGNED_BYTE, pixels)
+        glBindBuffer(GL_PIXEL_UNPACK_BUFFER, 0)
+
+        if use_generate_mipmap:
+            glGenerateMipmap(GL_TEXTURE_2D)
 
         return texture_id
 
@@ -395,9 +676,22 @@ class MiroOpenGLWidget(QOpenGLWidget):
         else:
             print(f"Failed to load skydome texture: {skydome_path}")
 
+    def _create_skydome_list(self):
+        """스카이돔 구(안쪽 면, 텍스처 좌표 포함)를 디스플레이 리스트로 한 번만 컴파일 (매 프레임 GLU 테셀레이션 제거)"""
+        quadric = gluNewQuadric()
+        gluQuadricNormals(quadric, GLU_SMOOTH)
+        gluQuadricTexture(quadric, GL_TRUE)
+        gluQuadricOrientation(quadric, GLU_INSIDE)
+
+        self.skydome_list = glGenLists(1)
+        glNewList(self.skydome_list, GL_COMPILE)
+        gluSphere(quadric, 90.0, 64, 32)
+        glEndList()
+        gluDeleteQuadric(quadric)
+
     def _draw_skydome(self):
         """스카이돔 배경 렌더링 (테마에 따라 다르게 표시)"""
-        if not self.skydome_quadric:
+        if not self.skydome_list:
             return
 
         glPushAttrib(GL_ENABLE_BIT | GL_DEPTH_BUFFER_BIT | GL_CURRENT_BIT)
@@ -417,7 +711,6 @@ class MiroOpenGLWidget(QOpenGLWidget):
             # 810-Gwan 테마: 베이지색 단색 배경
             glDisable(GL_TEXTURE_2D)
             glColor4f(0.96, 0.93, 0.85, 1.0)  # 베이지색
-            gluQuadricTexture(self.skydome_quadric, GL_FALSE)
         else:
             # 다른 테마: 스카이돔 텍스처
             if not self.skydome_texture:
@@ -429,10 +722,9 @@ class MiroOpenGLWidget(QOpenGLWidget):
             glColor4f(1.0, 1.0, 1.0, 1.0)
             glRotatef(90, 1, 0, 0)       # 구체 방향 보정
             glRotatef(180, 0, 0, 1)      # 텍스처 상하 반전 보정
-            gluQuadricTexture(self.skydome_quadric, GL_TRUE)
 
-        gluQuadricOrientation(self.skydome_quadric, GLU_INSIDE)
-        gluSphere(self.skydome_quadric, 90.0, 64, 32)
+        # 텍스처가 꺼져 있으면 리스트 안의 텍스처 좌표는 무시됨
+        glCallList(self.skydome_list)
 
         glPopMatrix()
         glPopAttrib()
@@ -448,6 +740,9 @@ class MiroOpenGLWidget(QOpenGLWidget):
 
     def paintGL(self):
         """렌더링"""
+        # 이번 프레임이 그리는 상태 기록 (다른 경로의 update()로 그려진 프레임도 반영)
+        self._last_frame_state = self._frame_state()
+
         # 이글아이 모드: 테마별 배경색 설정
         if self.cheat_eagle_eye:
             if self.current_theme == "810-Gwan":
@@ -472,6 +767,7 @@ class MiroOpenGLWidget(QOpenGLWidget):
 
         # 1인칭 카메라 설정
         self._setup_camera()
+        self._frustum_planes = self._extract_frustum_planes()
 
         # 스카이돔 렌더링 (가장 먼저, 깊이 버퍼에 쓰지 않음)
         self._draw_skydome()
@@ -499,30 +795,85 @@ class MiroOpenGLWidget(QOpenGLWidget):
         self._draw_minimap()
 
     def _setup_camera(self):
-        """1인칭 카메라 설정"""
+        """1인칭 카메라 설정 (뷰 행렬을 직접 만들어 glLoadMatrixf로 적재)"""
         if self.cheat_eagle_eye:
             # 이글아이 (탑뷰): 플레이어 위 15유닛에서 아래를 내려다봄
-            eye_x = self.player_pos[0]
-            eye_y = self.player_pos[1] + 15.0
-            eye_z = self.player_pos[2]
-            gluLookAt(eye_x, eye_y, eye_z,
-                      self.player_pos[0], self.player_pos[1], self.player_pos[2],
-                      0.0, 0.0, -1.0)  # up = -Z (북쪽 방향)
+            eye_x, eye_y, eye_z = self.player_pos
+            view = _look_at_matrix((eye_x, eye_y + 15.0, eye_z),
+                                   (0.0, -1.0, 0.0),
+                                   (0.0, 0.0, -1.0))  # up = -Z (북쪽 방향)
         else:
             # 기존 1인칭 카메라
-            # 시선 방향 계산
-            dir_x = math.cos(self.player_pitch) * math.sin(self.player_yaw)
-            dir_y = math.sin(self.player_pitch)
-            dir_z = math.cos(self.player_pitch) * math.cos(self.player_yaw)
+            # 시선 방향 (마우스 입력 시 갱신된 캐시 사용)
+            view = _look_at_matrix(self.player_pos, self._look_dir, (0.0, 1.0, 0.0))
+
+        glLoadMatrixf(view)
+
+    def _update_view_trig(self):
+        """yaw/pitch 삼각함수와 시선 방향 캐시 갱신 (시점 변경 시에만 호출)"""
+        self._sin_yaw = math.sin(self.player_yaw)
+        self._cos_yaw = math.cos(self.player_yaw)
+        cos_pitch = math.cos(self.player_pitch)
+        self._look_dir = (cos_pitch * self._sin_yaw,
+                          math.sin(self.player_pitch),
+                          cos_pitch * self._cos_yaw)
+
+    def _extract_frustum_planes(self):
+        """현재 투영/모델뷰 행렬에서 절두체 6평면 추출 (Gribb-Hartmann)"""
+        # glGetFloatv는 열 우선(column-major) 배열 → clip = (MV · P)ᵀ
+        modelview = np.asarray(glGetFloatv(GL_MODELVIEW_MATRIX), dtype=np.float32).reshape(4, 4)
+        projection = np.asarray(glGetFloatv(GL_PROJECTION_MATRIX), dtype=np.float32).reshape(4, 4)
+        clip = (modelview @ projection).T
+        return np.stack([
+            clip[3] + clip[0], clip[3] - clip[0],   # left, right
+            clip[3] + clip[1], clip[3] - clip[1],   # bottom, top
+            clip[3] + clip[2], clip[3] - clip[2],   # near, far
+        ])
+
+    def _draw_visible_tiles(self, batch, lod_far=None):
+        """
+        절두체와 겹치는 타일만 그리기 (연속된 가시 타일은 한 구간으로 병합, 구간들은 glMultiDrawElements 한 번으로 제출)
 
-            eye_x, eye_y, eye_z = self.player_pos
-            center_x = eye_x + dir_x
-            center_y = eye_y + dir_y
-            center_z = eye_z + dir_z
+        Args:
+            lod_far: None이면 LOD 무시, True/False면 LOD 깊이 너머/이내 타일만 그림
+        """
+        offsets = batch['tile_offsets']
+        planes = self._frustum_planes
+        if planes is None and lod_far is None:
+            glDrawElements(GL_TRIANGLES, batch['index_count'], GL_UNSIGNED_INT, None)
+            return
 
-            gluLookAt(eye_x, eye_y, eye_z,
-                      center_x, center_y, center_z,
-                      0.0, 1.0, 0.0)
+        visible = np.ones(len(offsets) - 1, dtype=bool)
+        if planes is not None:
+            # 평면별 p-vertex(법선 방향으로 가장 먼 AABB 꼭짓점)가 평면 뒤에 있으면 완전히 바깥
+            bounds = batch['tile_bounds']
+            p_vertex = np.where(planes[None, :, :3] >= 0, bounds[:, None, 1], bounds[:, None, 0])
+            dist = (p_vertex * planes[None, :, :3]).sum(axis=2) + planes[None, :, 3]
+            visible = (dist >= 0).all(axis=1)
+
+        if lod_far is not None:
+            # 타일 칸에서 시선 방향으로 가장 가까운 점의 깊이 (안개는 시선 깊이 기준)
+            look = self._lod_look
+            lod_bounds = batch['tile_lod_bounds']
+            n_vertex = np.where(look >= 0, lod_bounds[:, 0], lod_bounds[:, 1])
+            depth = (n_vertex - self._lod_eye) @ look
+            visible &= (depth > self._lod_depth) == lod_far
+
+        # 가시 타일 구간 [start, end) 찾기
+        edges = np.flatnonzero(np.diff(np.concatenate(([0], visible.view(np.int8), [0]))))
+        firsts = offsets[edges[::2]]
+        counts = (offsets[edges[1::2]] - firsts).astype(np.int32)
+        if len(counts) == 0:
+            return
+
+        if len(counts) > 1 and bool(glMultiDrawElements):
+            # 여러 구간을 한 번의 호출로 제출 (IBO 바인딩 상태이므로 포인터는 바이트 오프셋)
+            pointers = (ctypes.c_void_p * len(counts))(*(firsts * 4).tolist())
+            glMultiDrawElements(GL_TRIANGLES, counts, GL_UNSIGNED_INT, pointers, len(counts))
+            return
+
+        for first, count in zip(firsts.tolist(), counts.tolist()):
+            glDrawElements(GL_TRIANGLES, count, GL_UNSIGNED_INT, ctypes.c_void_p(first * 4))
 
     def _draw_maze(self):
         """VBO를 사용한 텍스처 미로 렌더링 (배치 렌더링)"""
@@ -540,25 +891,47 @@ class MiroOpenGLWidget(QOpenGLWidget):
 
         glColor3f(1.0, 1.0, 1.0) # 텍스처 색상 혼합 방지 (흰색)
 
+        # 원거리 LOD: 1인칭 + 안개 켜짐 상태에서만 (안개 없이 보이는 모드에서는 원본 유지)
+        use_lod = (self.wall_far_batches and self.fog_enabled and self.fog_density > 0
+                   and not self.cheat_eagle_eye and not self.cheat_xray)
+        self._lod_depth = LOD_FOG_DEPTH / self.fog_density if use_lod else None
+        if use_lod:
+            self._lod_eye = np.array(self.player_pos, dtype=np.float32)
+            self._lod_look = np.array(self._look_dir, dtype=np.float32)
+        wall_lod = False if use_lod else None
+
         # 헬퍼 함수: 배치 그리기
-        def draw_batches(batches):
+        def draw_batches(batches, lod_far=None):
             for batch in batches:
-                if batch['count'] > 0 and batch['texture_id']:
-                    glBindTexture(GL_TEXTURE_2D, batch['texture_id'])
+                if batch['index_count'] > 0 and batch['texture_id']:
+                    # 아직 업로드 중인 텍스처는 이미 올라간 대체 텍스처로 그림
+                    texture_id = batch['texture_id']
+                    glBindTexture(GL_TEXTURE_2D, self.texture_substitutes.get(texture_id, texture_id))
 
-                    glBindBuffer(GL_ARRAY_BUFFER, batch['vbo_vertices'])
-                    glVertexPointer(3, GL_FLOAT, 0, None)
+                    # 인터리브 VBO 한 번 바인딩 후 stride/offset으로 속성 지정
+                    glBindBuffer(GL_ARRAY_BUFFER, batch['vbo'])
+                    glVertexPointer(3, GL_FLOAT, VERTEX_STRIDE, None)
+                    glNormalPointer(GL_BYTE, VERTEX_STRIDE, VERTEX_NORMAL_OFFSET)
+                    glTexCoordPointer(2, GL_FLOAT, VERTEX_STRIDE, VERTEX_UV_OFFSET)
 
-                    glBindBuffer(GL_ARRAY_BUFFER, batch['vbo_normals'])
-                    glNormalPointer(GL_FLOAT, 0, None)
+                    glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, batch['ibo'])
+                    self._draw_visible_tiles(batch, lod_far)
 
-                    glBindBuffer(GL_ARRAY_BUFFER, batch['vbo_uvs'])
-                    glTexCoordPointer(2, GL_FLOAT, 0, None)
+        # 1. 벽 렌더링 (LOD 사용 시 가까운 타일만)
+        draw_batches(self.wall_batches, wall_lod)
 
-                    glDrawArrays(GL_QUADS, 0, batch['count'])
-
-        # 1. 벽 렌더링
-        draw_batches(self.wall_batches)
+        # 1-1. 원거리 벽 (병합 메시, 안개에 완전히 덮이므로 텍스처 생략)
+        if use_lod:
+            glDisable(GL_TEXTURE_2D)
+            for batch in self.wall_far_batches:
+                glBindBuffer(GL_ARRAY_BUFFER, batch['vbo'])
+                glVertexPointer(3, GL_FLOAT, VERTEX_STRIDE, None)
+                glNormalPointer(GL_BYTE, VERTEX_STRIDE, VERTEX_NORMAL_OFFSET)
+                glTexCoordPointer(2, GL_FLOAT, VERTEX_STRIDE, VERTEX_UV_OFFSET)
+
+                glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, batch['ibo'])
+                self._draw_visible_tiles(batch, True)
+            glEnable(GL_TEXTURE_2D)
 
         # 2. 바닥 렌더링
         draw_batches(self.floor_batches)
@@ -568,13 +941,12 @@ class MiroOpenGLWidget(QOpenGLWidget):
             glDisable(GL_TEXTURE_2D)
             glColor3f(0.0, 0.0, 0.0)  # 검은색
             for batch in self.trap_batches:
-                glBindBuffer(GL_ARRAY_BUFFER, batch['vbo_vertices'])
-                glVertexPointer(3, GL_FLOAT, 0, None)
+                glBindBuffer(GL_ARRAY_BUFFER, batch['vbo'])
+                glVertexPointer(3, GL_FLOAT, VERTEX_STRIDE, None)
+                glNormalPointer(GL_BYTE, VERTEX_STRIDE, VERTEX_NORMAL_OFFSET)
 
-                glBindBuffer(GL_ARRAY_BUFFER, batch['vbo_normals'])
-                glNormalPointer(GL_FLOAT, 0, None)
-
-                glDrawArrays(GL_QUADS, 0, batch['count'])
+                glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, batch['ibo'])
+                self._draw_visible_tiles(batch)
             glColor3f(1.0, 1.0, 1.0)  # 색상 복원
             glEnable(GL_TEXTURE_2D)
 
@@ -590,20 +962,43 @@ class MiroOpenGLWidget(QOpenGLWidget):
         if self.cheat_xray:
             glPolygonMode(GL_FRONT_AND_BACK, GL_FILL)
 
+    def _create_goal_vbo(self):
+        """목표 지점 기둥(뚜껑 없는 원통) 정점을 GL_TRIANGLE_STRIP용 VBO로 생성"""
+        angles = np.linspace(0.0, 2.0 * math.pi, GOAL_PILLAR_SEGMENTS + 1, dtype=np.float32)
+        xs = GOAL_PILLAR_RADIUS * np.cos(angles)
+        zs = GOAL_PILLAR_RADIUS * np.sin(angles)
+
+        # 아래(y=0) / 위(y=height) 정점을 번갈아 배치
+        strip = np.zeros((len(angles), 2, 3), dtype=np.float32)
+        strip[:, :, 0] = xs[:, None]
+        strip[:, :, 2] = zs[:, None]
+        strip[:, 1, 1] = GOAL_PILLAR_HEIGHT
+        strip = strip.reshape(-1, 3)
+
+        self.goal_vbo = glGenBuffers(1)
+        glBindBuffer(GL_ARRAY_BUFFER, self.goal_vbo)
+        glBufferData(GL_ARRAY_BUFFER, strip.nbytes, strip, GL_STATIC_DRAW)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+        self.goal_vertex_count = len(strip)
+
     def _draw_goal(self):
-        """목표 지점 표시 (빛나는 기둥) - 캐싱된 Quadric 사용"""
+        """목표 지점 표시 (빛나는 기둥) - 미리 생성된 VBO 사용"""
         glPushMatrix()
         glTranslatef(self.goal_pos[0], 0.0, self.goal_pos[1])
-        glRotatef(-90, 1, 0, 0)  # X축 기준 -90도 회전 (Z축→Y축 방향으로)
 
         # 반투명 효과를 위해 조명/텍스처 끄기
         glDisable(GL_LIGHTING)
         glDisable(GL_TEXTURE_2D)
         glColor3f(0.0, 1.0, 0.3)  # 녹색 빛
 
-        # 캐싱된 Quadric 사용 (매 프레임 생성/삭제 제거)
-        if self.goal_quadric:
-            gluCylinder(self.goal_quadric, 0.3, 0.3, 2.0, 16, 1)
+        # 정적 VBO 한 번의 draw call (조명이 꺼져 있으므로 법선 불필요)
+        if self.goal_vbo:
+            glBindBuffer(GL_ARRAY_BUFFER, self.goal_vbo)
+            glEnableClientState(GL_VERTEX_ARRAY)
+            glVertexPointer(3, GL_FLOAT, 0, None)
+            glDrawArrays(GL_TRIANGLE_STRIP, 0, self.goal_vertex_count)
+            glDisableClientState(GL_VERTEX_ARRAY)
+            glBindBuffer(GL_ARRAY_BUFFER, 0)
 
         glEnable(GL_TEXTURE_2D)
         glEnable(GL_LIGHTING)
@@ -623,14 +1018,10 @@ class MiroOpenGLWidget(QOpenGLWidget):
 
         # 원 그리기 (GL_TRIANGLE_FAN)
         radius = 0.3
-        segments = 16
         glBegin(GL_TRIANGLE_FAN)
         glVertex3f(0.0, 0.0, 0.0)  # 중심점
-        for i in range(segments + 1):
-            angle = 2.0 * math.pi * i / segments
-            x = radius * math.cos(angle)
-            z = radius * math.sin(angle)
-            glVertex3f(x, 0.0, z)
+        for cos_a, sin_a in CIRCLE_TABLE:
+            glVertex3f(radius * cos_a, 0.0, radius * sin_a)
         glEnd()
 
         glEnable(GL_LIGHTING)
@@ -638,7 +1029,7 @@ class MiroOpenGLWidget(QOpenGLWidget):
 
     def _draw_minimap(self):
         """미니맵 렌더링 (우상단 2D 오버레이)"""
-        if not self.cheat_minimap or not self.maze_grid:
+        if not self.cheat_minimap or self.maze_grid.size == 0:
             return
 
         # 현재 행렬 저장
@@ -662,8 +1053,9 @@ class MiroOpenGLWidget(QOpenGLWidget):
         # 미니맵 크기/위치
         map_size = 150
         margin = 10
-        cell_w = map_size / len(self.maze_grid[0])
-        cell_h = map_size / len(self.maze_grid)
+        rows, cols = self.maze_grid.shape
+        cell_w = map_size / cols
+        cell_h = map_size / rows
 
         # 반투명 배경
         glEnable(GL_BLEND)
@@ -677,8 +1069,6 @@ class MiroOpenGLWidget(QOpenGLWidget):
         glEnd()
 
         # 미로 그리드 렌더링 (180도 회전)
-        rows = len(self.maze_grid)
-        cols = len(self.maze_grid[0])
         for gz, row in enumerate(self.maze_grid):
             for gx, cell in enumerate(row):
                 # 180도 회전: (gx, gz) -> (cols-1-gx, rows-1-gz)
@@ -698,8 +1088,8 @@ class MiroOpenGLWidget(QOpenGLWidget):
                 glEnd()
 
         # 골 표시 (초록) - 180도 회전 적용
-        goal_gx = int((self.goal_pos[0] - self.grid_min_x) / self.grid_scale)
-        goal_gz = int((self.goal_pos[1] - self.grid_min_z) / self.grid_scale)
+        goal_gx = int((self.goal_pos[0] - self.grid_min_x) * self.grid_inv_scale)
+        goal_gz = int((self.goal_pos[1] - self.grid_min_z) * self.grid_inv_scale)
         glColor3f(0.0, 1.0, 0.3)
         gx_px = w - map_size - margin + (cols - 1 - goal_gx) * cell_w
         gz_px = margin + (rows - 1 - goal_gz) * cell_h
@@ -726,9 +1116,8 @@ class MiroOpenGLWidget(QOpenGLWidget):
         glColor4f(0.0, 0.0, 0.0, alpha)
         glBegin(GL_TRIANGLE_FAN)
         glVertex3f(cx, SHADOW_Y_OFFSET, cz)
-        for i in range(SHADOW_SEGMENTS + 1):
-            angle = 2.0 * math.pi * i / SHADOW_SEGMENTS
-            glVertex3f(cx + radius * math.cos(angle), SHADOW_Y_OFFSET, cz + radius * math.sin(angle))
+        for cos_a, sin_a in CIRCLE_TABLE:
+            glVertex3f(cx + radius * cos_a, SHADOW_Y_OFFSET, cz + radius * sin_a)
         glEnd()
 
     def _make_shadow_matrix(self, light, plane):
@@ -919,60 +1308,40 @@ class MiroOpenGLWidget(QOpenGLWidget):
                 # 정점 파싱
                 num_v = int(lines[idx].strip())
                 idx += 1
-                self.maze_vertices = []
-                for _ in range(num_v):
-                    coords = list(map(float, lines[idx].strip().split()))
-                    self.maze_vertices.append(coords)
-                    idx += 1
+                # N줄을 한 번에 float32 (N, 3) 배열로 변환 (정점별 리스트 생성 제거)
+                vertex_text = ' '.join(lines[idx:idx + num_v])
+                self.maze_vertices = np.array(vertex_text.split(), dtype=np.float32).reshape(-1, 3)
+                idx += num_v
 
                 # 면 파싱 및 분류 (벽 vs 바닥)
                 num_f = int(lines[idx].strip())
                 idx += 1
-                self.maze_faces = [] # 원본 유지 (충돌 감지용)
-                wall_faces = []
-                floor_faces = []
+                self.maze_faces = self._parse_face_block(lines[idx:idx + num_f], num_v) # 원본 유지 (충돌 감지용)
+                idx += num_f
+                self.maze_face_matrix, self.maze_face_mask = self._pad_faces(self.maze_faces)
 
-                for _ in range(num_f):
-                    parts = list(map(int, lines[idx].strip().split()))
-                    face_indices = parts[1:]
-                    self.maze_faces.append(face_indices)
-                    idx += 1
-
-                    # 면 분류: 정점의 최대 Y 좌표로 분류
-                    # - 바닥 면(윗면+옆면): 최대 Y가 낮음 (높이 변화 최대 0.5)
-                    # - 벽 면: 최대 Y가 높음 (벽 높이 1.0 이상)
-                    max_y = 0.0
-                    for v_idx in face_indices:
-                        if v_idx < len(self.maze_vertices):
-                            max_y = max(max_y, self.maze_vertices[v_idx][1])
+                # 면 분류: 정점의 최대 Y 좌표로 분류 (전체 면을 한 번에 마스크로 계산)
+                # - 바닥 면(윗면+옆면): 최대 Y가 낮음 (높이 변화 최대 0.5)
+                # - 벽 면: 최대 Y가 높음 (벽 높이 1.0 이상)
+                face_ys = np.where(self.maze_face_mask, self.maze_vertices[self.maze_face_matrix, 1], 0.0)
+                max_y = face_ys.max(axis=1, initial=0.0)
 
-                    # 최대 Y가 0.6 미만이면 바닥 (바닥 높이 변화 범위: 0.0~0.5)
-                    is_wall = max_y >= 0.6
-
-                    if is_wall:
-                        wall_faces.append(face_indices)
-                    else:
-                        floor_faces.append(face_indices)
+                # 최대 Y가 0.6 미만이면 바닥 (바닥 높이 변화 범위: 0.0~0.5)
+                # 분류 결과는 마스크로 보관해 VBO 생성 시 면 행렬에서 바로 선택 (면 리스트 복사 없음)
+                self.maze_wall_mask = max_y >= 0.6
 
                 # 바닥 높이 데이터 파싱 (v7 전용)
                 self.floor_height_map = {}
                 if idx < len(lines):
                     num_heights = int(lines[idx].strip())
                     idx += 1
-                    for _ in range(num_heights):
-                        if idx < len(lines):
-                            h_parts = lines[idx].strip().split()
-                            gx, gz, h = int(h_parts[0]), int(h_parts[1]), float(h_parts[2])
-                            self.floor_height_map[(gx, gz)] = h
-                            idx += 1
-
-                # 높이 맵 통계 출력
-                if self.floor_height_map:
-                    heights = list(self.floor_height_map.values())
-                    # print(f"[HEIGHT_MAP] count={len(heights)}, min={min(heights):.2f}, max={max(heights):.2f}")
-                    # 높이가 다른 타일 몇 개 출력
-                    high_tiles = [(k, v) for k, v in self.floor_height_map.items() if v > 0.1]
-                    # print(f"[HEIGHT_MAP] high tiles (h>0.1): {len(high_tiles)} tiles, samples: {high_tiles[:5]}")
+                    height_lines = lines[idx:idx + num_heights]
+                    idx += len(height_lines)
+                    if height_lines:
+                        # "gx gz h" 줄들을 한 번에 (N, 3) 배열로 변환
+                        h_data = np.array(' '.join(height_lines).split(), dtype=np.float64).reshape(-1, 3)
+                        cells = zip(h_data[:, 0].astype(int).tolist(), h_data[:, 1].astype(int).tolist())
+                        self.floor_height_map = dict(zip(cells, h_data[:, 2].tolist()))
 
                 # 미로 그리드 데이터 파싱 (v7 전용)
                 self.original_maze_grid = None
@@ -984,16 +1353,13 @@ class MiroOpenGLWidget(QOpenGLWidget):
                         self.original_maze_width = int(size_parts[0])
                         self.original_maze_height = int(size_parts[1])
                         idx += 1
-                        self.original_maze_grid = []
+                        rows = []
                         for _ in range(self.original_maze_height):
                             if idx < len(lines):
-                                row = [int(c) for c in lines[idx].strip()]
-                                self.original_maze_grid.append(row)
+                                # '0'/'1' 문자열 → uint8 행 (문자 단위 int 변환 루프 제거)
+                                rows.append(np.frombuffer(lines[idx].strip().encode('ascii'), dtype=np.uint8) - ord('0'))
                                 idx += 1
-
-            # 멤버 변수에 저장 (재생성/지연생성 위해)
-            self.wall_faces = wall_faces
-            self.floor_faces = floor_faces
+                        self.original_maze_grid = np.array(rows, dtype=np.uint8)
 
             # 법선 계산 (원본 면 기준)
             self._calculate_normals()
@@ -1007,11 +1373,12 @@ class MiroOpenGLWidget(QOpenGLWidget):
             
             if self.isValid() and self.theme_textures['walls']:
                 self.makeCurrent()
-                self._create_vbos(self.wall_faces, self.floor_faces)
+                self._create_vbos()
                 self.doneCurrent()
             
+            num_walls = int(np.count_nonzero(self.maze_wall_mask))
             print(f"미로 로드 완료: {file_path}")
-            print(f"정점: {len(self.maze_vertices)}, 벽 면: {len(wall_faces)}, 바닥 면: {len(floor_faces)}")
+            print(f"정점: {len(self.maze_vertices)}, 벽 면: {num_walls}, 바닥 면: {len(self.maze_wall_mask) - num_walls}")
             print(f"시작: {self.start_pos}, 목표: {self.goal_pos}")
 
             self.update()
@@ -1021,36 +1388,68 @@ class MiroOpenGLWidget(QOpenGLWidget):
             import traceback
             traceback.print_exc()
 
+    def _parse_face_block(self, face_lines, num_v):
+        """
+        면 블록("K i0 i1 ... iK-1" 줄들)을 정수 인덱스 리스트로 파싱합니다.
+        모든 면의 정점 수가 같으면 (F, K+1) 배열 한 번으로 처리하고, 섞여 있으면 줄 단위로 파싱합니다.
+        """
+        data = np.array(' '.join(face_lines).split(), dtype=np.int64)
+        k = int(data[0]) if data.size else 0
+        if data.size == len(face_lines) * (k + 1) and (data[::k + 1] == k).all():
+            faces = data.reshape(-1, k + 1)[:, 1:]
+            # 정점 인덱스 유효성은 로드 시 한 번만 검사 (이후 루프에서는 범위 검사 생략)
+            bad = np.flatnonzero(((faces < 0) | (faces >= num_v)).any(axis=1))
+            if len(bad):
+                raise ValueError(f"잘못된 정점 인덱스 (면 {bad[0]}): {faces[bad[0]].tolist()}")
+            return faces.tolist()
+
+        faces = []
+        for line in face_lines:
+            face_indices = list(map(int, line.split()))[1:]
+            if face_indices and (min(face_indices) < 0 or max(face_indices) >= num_v):
+                raise ValueError(f"잘못된 정점 인덱스 (면 {len(faces)}): {face_indices}")
+            faces.append(face_indices)
+        return faces
+
+    def _pad_faces(self, faces):
+        """가변 길이 면 리스트를 (F, Kmax) 인덱스 행렬과 유효 칸 마스크로 변환"""
+        face_sizes = np.fromiter((len(face) for face in faces), dtype=np.int32, count=len(faces))
+        if len(faces) == 0 or (face_sizes == face_sizes[0]).all():
+            matrix = np.array(faces, dtype=np.int32).reshape(len(faces), face_sizes[0] if len(faces) else 0)
+            return matrix, np.ones(matrix.shape, dtype=bool)
+
+        mask = np.arange(face_sizes.max()) < face_sizes[:, None]
+        matrix = np.zeros(mask.shape, dtype=np.int32)
+        matrix[mask] = np.concatenate([np.asarray(face, dtype=np.int32) for face in faces])
+        return matrix, mask
+
     def _calculate_normals(self):
-        """면 법선 계산"""
-        self.maze_normals = []
-        for face in self.maze_faces:
-            if len(face) >= 3:
-                v0 = self.maze_vertices[face[0]]
-                v1 = self.maze_vertices[face[1]]
-                v2 = self.maze_vertices[face[2]]
+        """면 법선 계산 (NumPy 벡터화: 면별 첫 삼각형의 외적을 한 번에 계산)"""
+        num_faces = len(self.maze_faces)
+        # 기본값: 위쪽 법선 (정점이 3개 미만이거나 퇴화된 면)
+        normals = np.tile(np.array([0.0, 1.0, 0.0], dtype=np.float32), (num_faces, 1))
+        if num_faces == 0 or len(self.maze_vertices) == 0:
+            self.maze_normals = normals
+            return
 
-                # 두 변 벡터
-                u = [v1[i] - v0[i] for i in range(3)]
-                v = [v2[i] - v0[i] for i in range(3)]
+        # 로드 시 만든 패딩 면 행렬에서 첫 삼각형 인덱스를 바로 슬라이싱 (면 리스트 재순회 없음)
+        verts = self.maze_vertices
+        face_idx, face_mask = self.maze_face_matrix, self.maze_face_mask
+        if face_idx.shape[1] < 3:
+            self.maze_normals = normals
+            return
+        valid = face_mask[:, 2]
+        tri_idx = face_idx[valid, :3]
 
-                # 외적
-                n = [
-                    u[1]*v[2] - u[2]*v[1],
-                    u[2]*v[0] - u[0]*v[2],
-                    u[0]*v[1] - u[1]*v[0]
-                ]
+        # (F, 3, 3) 삼각형 정점 → 두 변 벡터의 외적
+        tri = verts[tri_idx]
+        n = np.cross(tri[:, 1] - tri[:, 0], tri[:, 2] - tri[:, 0])
 
-                # 정규화
-                length = math.sqrt(sum(x*x for x in n))
-                if length > 0:
-                    n = [x/length for x in n]
-                else:
-                    n = [0, 1, 0]
+        # 정규화 (길이 0인 면은 기본 법선 유지)
+        length = np.linalg.norm(n, axis=1, keepdims=True)
+        normals[valid] = np.divide(n, length, out=normals[valid], where=length > 0)
 
-                self.maze_normals.append(n)
-            else:
-                self.maze_normals.append([0, 1, 0])
+        self.maze_normals = normals
 
     def _cleanup_vbos(self):
         """VBO 리소스 정리 (배치 포함)"""
@@ -1060,26 +1459,18 @@ class MiroOpenGLWidget(QOpenGLWidget):
             self.wall_batches = []
             self.floor_batches = []
             self.trap_batches = []
-            self.vbo_wireframe_indices = None
+            self.wall_far_batches = []
             self.vbo_initialized = False
-            self.wireframe_index_count = 0
             return
 
         # GL 호출 전 컨텍스트 활성화
         self.makeCurrent()
 
         # 배치가 생성된 경우 리스트 순회
-        all_batches = self.wall_batches + self.floor_batches + self.trap_batches
-        for batch in all_batches:
-            buffers = [batch['vbo_vertices'], batch['vbo_normals']]
-            if 'vbo_uvs' in batch:
-                buffers.append(batch['vbo_uvs'])
-            if glDeleteBuffers:  # 추가 안전 검사
-                glDeleteBuffers(len(buffers), buffers)
-
-        if self.vbo_wireframe_indices:
-            if glDeleteBuffers:
-                glDeleteBuffers(1, [self.vbo_wireframe_indices])
+        all_batches = self.wall_batches + self.floor_batches + self.trap_batches + self.wall_far_batches
+        buffers = [buf for batch in all_batches for buf in (batch['vbo'], batch['ibo'])]
+        if buffers and glDeleteBuffers:  # 추가 안전 검사
+            glDeleteBuffers(len(buffers), buffers)
 
         # 아이템 그림자 VBO 정리
         self._cleanup_item_shadow_vbos()
@@ -1087,10 +1478,9 @@ class MiroOpenGLWidget(QOpenGLWidget):
         self.wall_batches = []
         self.floor_batches = []
         self.trap_batches = []
-        self.vbo_wireframe_indices = None
+        self.wall_far_batches = []
 
         self.vbo_initialized = False
-        self.wireframe_index_count = 0
 
         self.doneCurrent()
 
@@ -1104,24 +1494,33 @@ class MiroOpenGLWidget(QOpenGLWidget):
 
         # OpenGL 컨텍스트 유효성 검사
         if not self.isValid():
-            self.goal_quadric = None
-            self.skydome_quadric = None
+            self.goal_vbo = None
+            self.skydome_list = None
             self.skydome_texture = None
             self.item_models = []
             self.theme_textures['walls'] = []
             self.theme_textures['floors'] = []
+            self.texture_pbos = []
+            self.texture_upload_queue = []
+            self.texture_substitutes = {}
             return
 
         self.makeCurrent()
 
-        if self.goal_quadric:
-            gluDeleteQuadric(self.goal_quadric)
-            self.goal_quadric = None
+        if self.goal_vbo:
+            glDeleteBuffers(1, [self.goal_vbo])
+            self.goal_vbo = None
+
+        if self.texture_pbos:
+            glDeleteBuffers(len(self.texture_pbos), self.texture_pbos)
+            self.texture_pbos = []
+        self.texture_upload_queue = []
+        self.texture_substitutes = {}
 
         # 스카이돔 리소스 정리
-        if self.skydome_quadric:
-            gluDeleteQuadric(self.skydome_quadric)
-            self.skydome_quadric = None
+        if self.skydome_list:
+            glDeleteLists(self.skydome_list, 1)
+            self.skydome_list = None
 
         if self.skydome_texture:
             glDeleteTextures([self.skydome_texture])
@@ -1140,195 +1539,240 @@ class MiroOpenGLWidget(QOpenGLWidget):
 
         self.doneCurrent()
 
-    def _create_vbos(self, wall_faces, floor_faces):
+    def _create_vbos(self):
         """벽과 바닥을 텍스처별로 그룹화하여 VBO 배치 생성"""
-        if not self.maze_vertices:
+        if len(self.maze_vertices) == 0:
             return
 
+        verts = self.maze_vertices
+
         # 벽의 전체 높이 계산 (텍스처 수직 스케일링용)
         # 모든 정점 중 Y 최대값 찾기 (최소값은 0이라 가정)
-        all_ys = [v[1] for v in self.maze_vertices]
-        max_wall_height = max(all_ys) if all_ys else 1.0
-        if max_wall_height < 1.0: max_wall_height = 1.0
+        max_wall_height = max(float(verts[:, 1].max()), 1.0)
 
         self.wall_batches = []
         self.floor_batches = []
         self.trap_batches = []
+        self.wall_far_batches = []
 
         # 함정 타일 분리: floor_height_map에서 낮은 높이(< 0.1) 타일을 함정으로
         TRAP_THRESHOLD = 0.1
-        trap_faces = []
-        normal_floor_faces = []
+        face_idx, face_mask = self.maze_face_matrix, self.maze_face_mask
+        is_floor = ~self.maze_wall_mask
+        if face_idx.shape[1] >= 4:
+            # 사각형 이상인 면만 렌더링 대상
+            is_floor &= face_mask[:, 3]
+        else:
+            is_floor[:] = False
+        floor_quads = face_idx[is_floor, :4]
+        is_trap = np.zeros(len(floor_quads), dtype=bool)
 
         if self.floor_height_map and self.original_maze_width and self.original_maze_height:
-            offset_x = -self.original_maze_width / 2.0
-            offset_z = -self.original_maze_height / 2.0
+            trap_cells = np.array([key for key, h in self.floor_height_map.items() if h < TRAP_THRESHOLD],
+                                  dtype=np.int64).reshape(-1, 2)
+            if len(trap_cells):
+                offset_x = -self.original_maze_width / 2.0
+                offset_z = -self.original_maze_height / 2.0
+
+                # 면의 중심점 계산 (사각형 이상인 면의 모든 정점 평균, float64)
+                matrix, mask = face_idx[is_floor], face_mask[is_floor]
+                counts = mask.sum(axis=1)
+                cx = np.where(mask, verts[matrix, 0], 0.0).sum(axis=1, dtype=np.float64) / counts
+                cz = np.where(mask, verts[matrix, 2], 0.0).sum(axis=1, dtype=np.float64) / counts
+
+                # 그리드 좌표로 변환 후 함정 칸 집합과 대조 ((gx, gz) 쌍을 정수 하나로 묶어 비교)
+                gx = np.trunc(cx - offset_x).astype(np.int64)
+                gz = np.trunc(cz - offset_z).astype(np.int64)
+                is_trap = np.isin((gx << 32) | (gz & 0xFFFFFFFF),
+                                  (trap_cells[:, 0] << 32) | (trap_cells[:, 1] & 0xFFFFFFFF))
+
+        normal_floor_quads = floor_quads[~is_trap]
+        trap_quads = floor_quads[is_trap]
+
+        # 헬퍼 함수: VBO 생성 및 등록
+        def create_buffer(data, target=GL_ARRAY_BUFFER):
+            vbo = glGenBuffers(1)
+            glBindBuffer(target, vbo)
+            glBufferData(target, data.nbytes, data, GL_STATIC_DRAW)
+            return vbo
 
-            for face in floor_faces:
-                if len(face) < 4:
-                    normal_floor_faces.append(face)
-                    continue
+        # 사각형 하나를 삼각형 두 개 (0,1,2), (0,2,3)로 분할하는 인덱스 패턴
+        quad_pattern = np.array([0, 1, 2, 0, 2, 3], dtype=np.uint32)
+
+        # 컬링 타일 격자 (미로 전체 XZ 범위 기준)
+        tile_origin = verts.min(axis=0)
+        tiles_x = int((verts[:, 0].max() - tile_origin[0]) // CULL_TILE_SIZE) + 1
+
+        def sort_by_tile(quads, vertex_array=verts):
+            """
+            (N, 4) 면 인덱스를 면 중심이 속한 컬링 타일 순으로 정렬합니다.
+            정점 데이터(면당 128바이트)가 아닌 인덱스(면당 16바이트)를 정렬해 복사량을 줄입니다.
+
+            Returns:
+                (정렬된 면 인덱스, 타일별 시작 면 번호 배열, 타일 번호 배열)
+            """
+            centers_xz = vertex_array[quads][:, :, [0, 2]].mean(axis=1)
+            tile_xz = ((centers_xz - tile_origin[[0, 2]]) // CULL_TILE_SIZE).astype(np.int64)
+            tile_keys = tile_xz[:, 1] * tiles_x + tile_xz[:, 0]
+            order = np.argsort(tile_keys, kind='stable')
+            tile_keys = tile_keys[order]
+            starts = np.flatnonzero(np.concatenate(([True], tile_keys[1:] != tile_keys[:-1])))
+            return quads[order], starts, tile_keys[starts]
+
+        def create_quad_batch(data, starts, tile_keys):
+            """
+            타일 순으로 정렬된 인터리브 정점 데이터 (N, 4, 8)로 VBO + 삼각형 인덱스 버퍼 생성.
+            타일마다 연속된 인덱스 구간과 AABB를 기록합니다.
+            """
+            num_quads = len(data)
+
+            # 타일 경계 (면 단위) 및 타일별 AABB
+            points = data[:, :, 0:3]
+            tile_bounds = np.stack([np.minimum.reduceat(points.min(axis=1), starts),
+                                    np.maximum.reduceat(points.max(axis=1), starts)], axis=1)
+            tile_offsets = np.append(starts, num_quads) * len(quad_pattern)
+
+            # LOD 판정용 타일 격자 칸 박스 (XZ는 타일 칸, Y는 미로 전체 높이 범위)
+            tile_lod_bounds = np.empty((len(tile_keys), 2, 3), dtype=np.float32)
+            tile_lod_bounds[:, 0, 0] = tile_origin[0] + (tile_keys % tiles_x) * CULL_TILE_SIZE
+            tile_lod_bounds[:, 0, 2] = tile_origin[2] + (tile_keys // tiles_x) * CULL_TILE_SIZE
+            tile_lod_bounds[:, 1, [0, 2]] = tile_lod_bounds[:, 0, [0, 2]] + CULL_TILE_SIZE
+            tile_lod_bounds[:, 0, 1] = tile_origin[1]
+            tile_lod_bounds[:, 1, 1] = verts[:, 1].max()
+
+            indices = (quad_pattern[None, :] + (np.arange(num_quads, dtype=np.uint32) * 4)[:, None]).ravel()
+            return {
+                'vbo': create_buffer(_pack_vertices(data).view(np.uint8)),
+                'ibo': create_buffer(indices, GL_ELEMENT_ARRAY_BUFFER),
+                'index_count': len(indices),
+                'tile_bounds': tile_bounds,
+                'tile_offsets': tile_offsets,
+                'tile_lod_bounds': tile_lod_bounds
+            }
+
+        def build_geometry(quads, vertex_array=verts):
+            """
+            (N, 4) 면 인덱스 → 인터리브 (N, 4, 8) float32 배열.
+            위치/법선/UV를 미리 할당한 출력 배열의 각 열 구간에 직접 기록합니다 (중간 배열 최소화).
+            """
+            out = np.empty((len(quads), 4, VERTEX_FLOATS), dtype=np.float32)
+            points = out[:, :, 0:3]
+            points[...] = vertex_array[quads]
+
+            # 법선 계산 (면별 첫 삼각형의 외적)
+            n_cross = np.cross(points[:, 1] - points[:, 0], points[:, 2] - points[:, 0])
+            length = np.linalg.norm(n_cross, axis=1, keepdims=True)
+            normals = np.tile(np.array([0.0, 1.0, 0.0], dtype=np.float32), (len(quads), 1))
+            np.divide(n_cross, length, out=normals, where=length > 0)
+            out[:, :, 3:6] = normals[:, None, :]
+
+            # UV 계산 (Face-Relative, Aspect Preserved, Y-Flipped)
+            # 배치가 벽만/바닥만으로 이루어진 경우 필요 없는 쪽 투영은 계산하지 않음
+            is_floor = (np.abs(normals[:, 1]) > 0.9)[:, None]
+            any_floor = bool(is_floor.any())
+            all_floor = any_floor and bool(is_floor.all())
+            xs = points[:, :, 0]
+            ys = points[:, :, 1]
+            zs = points[:, :, 2]
+            u = out[:, :, 6]
+            v = out[:, :, 7]
+
+            # 벽 (수직)
+            # [UV 매핑 로직 설명]
+            # 1. 수직 텍스처 통합 (One Long Vertical Texture):
+            #    벽의 높이가 1.0을 넘더라도 (예: 전체 미로 높이), 텍스처가 타일링(반복)되지 않고
+            #    바닥(Y=0)에서 천장(Y=max_height)까지 한 번만 늘어나도록 V좌표를 계산합니다.
+            #    Formula: v = 1.0 - (p[1] / max_wall_height)
+            # 2. 상하 반전 해결 (Fix Upside Down):
+            #    이미지 좌표계(Top-Left=0,0)와 OpenGL 텍스처 좌표계(Bottom-Left=0,0)의 차이로 인해,
+            #    World Top(Y=MAX)을 V=0(Image Top), World Bottom(Y=0)을 V=1(Image Bottom)으로 매핑합니다.
+            # 3. 좌우 반전 해결 (Fix Left-Right Flip):
+            #    가로(U) 좌표를 max_dim - val 로 계산하여 좌우를 뒤집어 매핑합니다.
+            #    YZ 평면 (Normal X)은 Z축, XY 평면 (Normal Z)은 X축이 가로
+            if not all_floor:
+                horiz = np.where((np.abs(normals[:, 0]) > 0.5)[:, None], zs, xs)
+                np.subtract(horiz.max(axis=1, keepdims=True), horiz, out=u)
+                np.divide(ys, max_wall_height, out=v)
+                np.subtract(1.0, v, out=v)
+
+            # 바닥 (XZ 평면): 면 내 로컬 좌표 (0.0 ~ Width/Height) 로 덮어쓰기
+            if all_floor:
+                np.subtract(xs, xs.min(axis=1, keepdims=True), out=u)
+                np.subtract(zs, zs.min(axis=1, keepdims=True), out=v)
+            elif any_floor:
+                np.copyto(u, xs - xs.min(axis=1, keepdims=True), where=is_floor)
+                np.copyto(v, zs - zs.min(axis=1, keepdims=True), where=is_floor)
+            return out
+
+        def process_atlas_faces(quads, texture_ids, tiles, batches_list):
+            """아틀라스 텍스처 한 장을 쓰는 (N, 4) 면들을 단일 배치로 생성"""
+            if not texture_ids or len(tiles) == 0:
+                return
 
-                # 면의 중심점 계산
-                cx = sum(self.maze_vertices[v_idx][0] for v_idx in face) / len(face)
-                cz = sum(self.maze_vertices[v_idx][2] for v_idx in face) / len(face)
+            if len(quads) == 0:
+                return
 
-                # 그리드 좌표로 변환
-                gx = int(cx - offset_x)
-                gz = int(cz - offset_z)
+            quads, starts, tile_keys = sort_by_tile(quads)
+            data = build_geometry(quads)
 
-                # 해당 셀의 높이 확인
-                h = self.floor_height_map.get((gx, gz), 0.5)
-                if h < TRAP_THRESHOLD:
-                    trap_faces.append(face)
-                else:
-                    normal_floor_faces.append(face)
-        else:
-            normal_floor_faces = floor_faces
+            # 면별 무작위 타일 배정 후 로컬 UV [0, 1]을 해당 타일 영역으로 변환 (제자리 연산)
+            face_tiles = tiles[np.random.randint(0, len(tiles), size=len(quads), dtype=np.int32)][:, None, :]
+            uv = data[:, :, 6:8]
+            np.clip(uv, 0.0, 1.0, out=uv)
+            uv *= face_tiles[:, :, 2:4]
+            uv += face_tiles[:, :, 0:2]
 
-        # 헬퍼 함수: VBO 생성 및 등록
-        def create_buffer(data):
-            vbo = glGenBuffers(1)
-            glBindBuffer(GL_ARRAY_BUFFER, vbo)
-            glBufferData(GL_ARRAY_BUFFER, data.nbytes, data, GL_STATIC_DRAW)
-            return vbo
+            batch = create_quad_batch(data, starts, tile_keys)
+            batch['texture_id'] = texture_ids[0]
+            batches_list.append(batch)
 
-        def process_faces(faces, texture_ids, batches_list, is_wall=True):
+        def process_faces(quads, texture_ids, batches_list):
             if not texture_ids:
                 return
 
             # 1. 텍스처 인덱스별로 면 분류 (Grouping)
-            grouped_faces = {i: [] for i in range(len(texture_ids))}
-            for face in faces:
-                idx = random.randint(0, len(texture_ids) - 1)
-                grouped_faces[idx].append(face)
+            #    무작위 배정은 한 번의 NumPy 호출로, 그룹은 안정 정렬 + 구간 분할로 생성
+            num_textures = len(texture_ids)
+            assign = np.random.randint(0, num_textures, size=len(quads), dtype=np.int32)
+            order = np.argsort(assign, kind='stable')
+            bounds = np.concatenate(([0], np.cumsum(np.bincount(assign, minlength=num_textures))))
 
             # 2. 각 그룹별 지오메트리 생성 및 VBO 생성
-            for idx, group in grouped_faces.items():
-                if not group: continue
-                
-                v_list = []
-                uv_list = []
-                n_list = []
-                
-                for face in group:
-                    if len(face) < 4: continue
-                    # 면 정점 좌표 (배열 변환)
-                    p0 = np.array(self.maze_vertices[face[0]])
-                    p1 = np.array(self.maze_vertices[face[1]])
-                    p2 = np.array(self.maze_vertices[face[2]])
-                    p3 = np.array(self.maze_vertices[face[3]])
-                    
-                    # 법선 계산
-                    u_vec = p1 - p0
-                    v_vec = p2 - p0
-                    n_cross = np.cross(u_vec, v_vec)
-                    length = np.linalg.norm(n_cross)
-                    if length > 0:
-                        normal = n_cross / length
-                    else:
-                        normal = np.array([0.0, 1.0, 0.0])
-                    
-                    # 정점 및 법선 추가
-                    v_list.extend(p0.tolist() + p1.tolist() + p2.tolist() + p3.tolist())
-                    n_list_val = normal.tolist()
-                    for _ in range(4): n_list.extend(n_list_val)
-                        
-                    # UV 계산 (Face-Relative, Aspect Preserved, Y-Flipped)
-                    local_uvs = []
-                    points = [p0, p1, p2, p3]
-                    
-                    if abs(normal[1]) > 0.9: # 바닥 (XZ 평면)
-                        # X, Z 좌표 추출
-                        xs = [p[0] for p in points]
-                        zs = [p[2] for p in points]
-                        min_x, min_z = min(xs), min(zs)
-                        
-                        # 로컬 좌표 (0.0 ~ Width/Height)
-                        for p in points:
-                            u = p[0] - min_x
-                            v = p[2] - min_z
-                            local_uvs.extend([u, v])
-                            
-                    else: # 벽 (수직)
-                        # [UV 매핑 로직 설명]
-                        # 1. 수직 텍스처 통합 (One Long Vertical Texture):
-                        #    벽의 높이가 1.0을 넘더라도 (예: 전체 미로 높이), 텍스처가 타일링(반복)되지 않고
-                        #    바닥(Y=0)에서 천장(Y=max_height)까지 한 번만 늘어나도록 V좌표를 계산합니다.
-                        #    Formula: v = 1.0 - (p[1] / max_wall_height)
-                        
-                        # 2. 상하 반전 해결 (Fix Upside Down):
-                        #    이미지 좌표계(Top-Left=0,0)와 OpenGL 텍스처 좌표계(Bottom-Left=0,0)의 차이로 인해,
-                        #    일반적인 매핑(v=y) 시 이미지가 뒤집힙니다.
-                        #    따라서 World Top(Y=MAX)을 V=0(Image Top), World Bottom(Y=0)을 V=1(Image Bottom)으로 매핑합니다.
-                        
-                        # 3. 좌우 반전 해결 (Fix Left-Right Flip):
-                        #    가로(U) 좌표를 max_dim - val 로 계산하여 좌우를 뒤집어 매핑합니다.
-
-                        # 가로(U) 범위 계산
-                        if abs(normal[0]) > 0.5: # YZ 평면 (Normal X) -> Z축이 가로
-                             dim_vals = [p[2] for p in points]
-                        else: # XY 평면 (Normal Z) -> X축이 가로
-                             dim_vals = [p[0] for p in points]
-                        
-                        min_dim = min(dim_vals)
-                        max_dim = max(dim_vals)
-                        
-                        for p in points:
-                            val = p[2] if abs(normal[0]) > 0.5 else p[0]
-                            
-                            # U: 좌우 반전 적용 (Texture Mirroring Fix)
-                            u = max_dim - val
-                            
-                            # V: 전체 높이 기준 정규화 및 반전 (Vertical Stretch & Flip)
-                            # Y=0 -> 1.0 (Bottom), Y=H -> 0.0 (Top)
-                            v = 1.0 - (p[1] / max_wall_height)
-                            
-                            local_uvs.extend([u, v])
-    
-                    uv_list.extend(local_uvs)
-                
-                # Numpy 배열 변환
-                v_data = np.array(v_list, dtype=np.float32)
-                uv_data = np.array(uv_list, dtype=np.float32)
-                n_data = np.array(n_list, dtype=np.float32)
-                
+            for idx in range(num_textures):
+                if bounds[idx] == bounds[idx + 1]: continue
+                group, starts, tile_keys = sort_by_tile(quads[order[bounds[idx]:bounds[idx + 1]]])
+                data = build_geometry(group)
+
                 # 배치 정보 저장
-                batch = {
-                    'texture_id': texture_ids[idx],
-                    'vbo_vertices': create_buffer(v_data),
-                    'vbo_uvs': create_buffer(uv_data),
-                    'vbo_normals': create_buffer(n_data),
-                    'count': len(v_data) // 3
-                }
+                batch = create_quad_batch(data, starts, tile_keys)
+                batch['texture_id'] = texture_ids[idx]
                 batches_list.append(batch)
 
-        # 벽 배치 생성
-        process_faces(wall_faces, self.theme_textures['walls'], self.wall_batches, is_wall=True)
+        # 벽 배치 생성 (아틀라스 → 단일 배치)
+        is_wall_quad = self.maze_wall_mask & (face_mask[:, 3] if face_idx.shape[1] >= 4 else False)
+        wall_quads = face_idx[is_wall_quad, :4]
+        process_atlas_faces(wall_quads, self.theme_textures['walls'], self.wall_atlas_tiles, self.wall_batches)
         # 바닥 배치 생성
-        process_faces(normal_floor_faces, self.theme_textures['floors'], self.floor_batches, is_wall=False)
+        process_faces(normal_floor_quads, self.theme_textures['floors'], self.floor_batches)
 
         # 함정 타일 배치 생성 (텍스처 없음, 검은색으로 렌더링됨)
-        if trap_faces:
-            v_list = []
-            n_list = []
-            for face in trap_faces:
-                if len(face) < 4:
-                    continue
-                for v_idx in face:
-                    v = self.maze_vertices[v_idx]
-                    v_list.extend([v[0], v[1], v[2]])
-                    n_list.extend([0, 1, 0])  # 바닥은 위쪽 방향 법선
-
-            if v_list:
-                v_data = np.array(v_list, dtype=np.float32)
-                n_data = np.array(n_list, dtype=np.float32)
-                trap_batch = {
-                    'vbo_vertices': create_buffer(v_data),
-                    'vbo_normals': create_buffer(n_data),
-                    'count': len(v_data) // 3
-                }
-                self.trap_batches.append(trap_batch)
+        if len(trap_quads):
+            # 같은 인터리브 레이아웃 사용 (바닥은 위쪽 방향 법선, UV는 사용 안 함)
+            trap_quads, starts, tile_keys = sort_by_tile(trap_quads)
+            data = np.zeros((len(trap_quads), 4, VERTEX_FLOATS), dtype=np.float32)
+            data[:, :, 0:3] = verts[trap_quads]
+            data[:, :, 4] = 1.0
+            self.trap_batches.append(create_quad_batch(data, starts, tile_keys))
+
+        # 원거리 LOD 벽 배치 (원본 그리드가 있을 때만: 벽 런 단위로 병합한 박스)
+        if self.wall_batches:
+            wall_vertex_ids = face_idx[self.maze_wall_mask][face_mask[self.maze_wall_mask]]
+            far_boxes = self._build_far_wall_boxes(wall_vertex_ids, tile_origin)
+            if len(far_boxes):
+                far_verts, far_quads = self._boxes_to_quads(far_boxes)
+                far_quads, starts, tile_keys = sort_by_tile(far_quads, far_verts)
+                data = build_geometry(far_quads, far_verts)
+                self.wall_far_batches.append(create_quad_batch(data, starts, tile_keys))
 
         # Unbind
         glBindBuffer(GL_ARRAY_BUFFER, 0)
@@ -1336,19 +1780,104 @@ class MiroOpenGLWidget(QOpenGLWidget):
         
         self.vbo_initialized = True
 
+    def _build_far_wall_boxes(self, wall_vertex_ids, tile_origin):
+        """
+        원본 그리드의 벽 셀을 가로/세로 런(run)으로 묶어 원거리용 박스 (B, 6) [x0, x1, z0, z1, y0, y1] 생성.
+
+        maze_generator.export_to_dat의 벽(중앙 박스 + 연결 팔)은 가로 런과 세로 런 박스의 합집합과
+        같은 부피이므로 실루엣이 동일합니다. 런은 컬링 타일 경계에서 끊어 각 박스가 한 타일에만 속하게 합니다.
+        """
+        grid = self.original_maze_grid
+        if grid is None or grid.size == 0 or len(wall_vertex_ids) == 0:
+            return np.zeros((0, 6), dtype=np.float32)
+
+        height, width = grid.shape
+        offset_x = -self.original_maze_width / 2.0
+        offset_z = -self.original_maze_height / 2.0
+
+        # 벽 높이와 셀 내 벽 오프셋(inset)은 실제 벽 정점에서 복원
+        wall_verts = self.maze_vertices[np.unique(wall_vertex_ids)]
+        wall_top = float(wall_verts[:, 1].max())
+        frac = np.concatenate([(wall_verts[:, 0] - offset_x) % 1.0, (wall_verts[:, 2] - offset_z) % 1.0])
+        inner = frac[(frac > 1e-3) & (frac < 1.0 - 1e-3)]
+        inset = float(inner.min()) if len(inner) else 0.0
+
+        wall = grid.astype(bool)
+        boxes = []
+
+        def runs(cells, cell_tiles):
+            """행 단위 런 (시작 행/열, 끝 열, 앞/뒤 연속 여부) - 타일이 바뀌는 곳에서 끊음"""
+            prev = np.zeros_like(cells)
+            prev[:, 1:] = cells[:, :-1]
+            nxt = np.zeros_like(cells)
+            nxt[:, :-1] = cells[:, 1:]
+            tile_start = np.concatenate(([True], cell_tiles[1:] != cell_tiles[:-1]))
+            tile_end = np.concatenate((cell_tiles[1:] != cell_tiles[:-1], [True]))
+            rows, start_cols = np.nonzero(cells & (~prev | tile_start))
+            _, end_cols = np.nonzero(cells & (~nxt | tile_end))
+            return rows, start_cols, end_cols, prev[rows, start_cols], nxt[rows, end_cols]
+
+        def cell_tiles(count, offset, origin):
+            return (offset + np.arange(count) + 0.5 - origin) // CULL_TILE_SIZE
+
+        # 세로 방향으로 이웃한 벽이 있는 셀 (가로 길이 1 런은 세로 런이 덮음)
+        has_vertical = np.zeros_like(wall)
+        has_vertical[1:] |= wall[:-1]
+        has_vertical[:-1] |= wall[1:]
+
+        # 가로 런: x는 런 양 끝(연속이면 셀 경계까지), z는 벽 두께
+        r, c0, c1, cont0, cont1 = runs(wall, cell_tiles(width, offset_x, tile_origin[0]))
+        keep = (c1 > c0) | cont0 | cont1 | ~has_vertical[r, c0]
+        r, c0, c1, cont0, cont1 = r[keep], c0[keep], c1[keep], cont0[keep], cont1[keep]
+        boxes.append(np.stack([offset_x + c0 + np.where(cont0, 0.0, inset),
+                               offset_x + c1 + 1.0 - np.where(cont1, 0.0, inset),
+                               offset_z + r + inset,
+                               offset_z + r + 1.0 - inset], axis=1))
+
+        # 세로 런 (전치 그리드): 길이 2 이상이거나 타일 경계에서 이어지는 경우만
+        r, c0, c1, cont0, cont1 = runs(wall.T, cell_tiles(height, offset_z, tile_origin[2]))
+        keep = (c1 > c0) | cont0 | cont1
+        r, c0, c1, cont0, cont1 = r[keep], c0[keep], c1[keep], cont0[keep], cont1[keep]
+        boxes.append(np.stack([offset_x + r + inset,
+                               offset_x + r + 1.0 - inset,
+                               offset_z + c0 + np.where(cont0, 0.0, inset),
+                               offset_z + c1 + 1.0 - np.where(cont1, 0.0, inset)], axis=1))
+
+        boxes = np.concatenate(boxes)
+        heights = np.tile(np.array([0.0, wall_top]), (len(boxes), 1))
+        return np.hstack([boxes, heights]).astype(np.float32)
+
+    def _boxes_to_quads(self, boxes):
+        """
+        박스 (B, 6) [x0, x1, z0, z1, y0, y1] → 정점 (B*8, 3), 사각형 면 (B*5, 4).
+        면 순서/감기 방향은 maze_generator의 add_box와 같고, 보이지 않는 밑면은 생략합니다.
+        """
+        x0, x1, z0, z1, y0, y1 = boxes.T
+        corners = np.stack([
+            np.stack([x0, y0, z0], axis=1), np.stack([x1, y0, z0], axis=1),
+            np.stack([x1, y0, z1], axis=1), np.stack([x0, y0, z1], axis=1),
+            np.stack([x0, y1, z0], axis=1), np.stack([x1, y1, z0], axis=1),
+            np.stack([x1, y1, z1], axis=1), np.stack([x0, y1, z1], axis=1),
+        ], axis=1).astype(np.float32)
+        # Top, Front, Right, Back, Left
+        pattern = np.array([[4, 5, 6, 7], [0, 1, 5, 4], [1, 2, 6, 5], [2, 3, 7, 6], [3, 0, 4, 7]], dtype=np.int32)
+        quads = (np.arange(len(boxes), dtype=np.int32)[:, None, None] * 8 + pattern[None]).reshape(-1, 4)
+        return corners.reshape(-1, 3), quads
+
     def _calculate_maze_bounds(self):
         """미로 범위 계산 및 시작/목표 위치 설정"""
-        if not self.maze_vertices:
+        if len(self.maze_vertices) == 0:
             return
 
         # 미로 범위 계산
-        min_x = min(v[0] for v in self.maze_vertices)
-        max_x = max(v[0] for v in self.maze_vertices)
-        min_z = min(v[2] for v in self.maze_vertices)
-        max_z = max(v[2] for v in self.maze_vertices)
+        min_x, _, min_z = self.maze_vertices.min(axis=0).tolist()
+        max_x, _, max_z = self.maze_vertices.max(axis=0).tolist()
 
         # 미로 그리드 재구성 (충돌 감지용) - 먼저 생성
         self._build_collision_grid(min_x, max_x, min_z, max_z)
+        self.grid_inv_scale = 1.0 / self.grid_scale
+        self._grid_blocked = _make_grid_blocked(_pack_grid_rows(self.maze_grid), self.maze_grid.shape[1],
+                                                self.grid_min_x, self.grid_min_z, self.grid_inv_scale)
 
         # 시작점: 통로 셀 중 상단에서 가장 가까운 위치 찾기
         self.start_pos = self._find_safe_spawn(near_top=True)
@@ -1359,7 +1888,7 @@ class MiroOpenGLWidget(QOpenGLWidget):
     def _build_collision_grid(self, min_x, max_x, min_z, max_z):
         """충돌 감지용 그리드 구축"""
         # 원본 미로 그리드가 있으면 직접 사용 (가장 정확함)
-        if self.original_maze_grid and self.original_maze_width and self.original_maze_height:
+        if self.original_maze_grid is not None and self.original_maze_grid.size and self.original_maze_width and self.original_maze_height:
             # 원본 그리드의 오프셋 계산 (maze_generator.py와 동일)
             self.grid_min_x = -self.original_maze_width / 2.0
             self.grid_min_z = -self.original_maze_height / 2.0
@@ -1380,25 +1909,31 @@ class MiroOpenGLWidget(QOpenGLWidget):
         grid_height = int((max_z - min_z) / grid_scale) + 2
 
         # 모든 셀을 통로로 초기화 (0)
-        self.maze_grid = [[0 for _ in range(grid_width)] for _ in range(grid_height)]
-
-        # 벽의 윗면(Top Face)을 찾아 해당 셀을 벽으로 표시 (1)
-        for face in self.maze_faces:
-            verts = [self.maze_vertices[idx] for idx in face if idx < len(self.maze_vertices)]
-            if not verts:
-                continue
-
-            max_y = max(v[1] for v in verts)
-
-            if max_y > 0.6:
-                avg_x = sum(v[0] for v in verts) / len(verts)
-                avg_z = sum(v[2] for v in verts) / len(verts)
+        self.maze_grid = np.zeros((grid_height, grid_width), dtype=np.uint8)
+        if not self.maze_faces:
+            self.maze_width = grid_width
+            self.maze_height = grid_height
+            return
 
-                gx = int((avg_x - min_x) / grid_scale)
-                gz = int((avg_z - min_z) / grid_scale)
+        # 로드 시 패딩해 둔 (F, Kmax) 인덱스 행렬 사용 (mask=False는 패딩 칸)
+        verts = self.maze_vertices
+        face_idx = self.maze_face_matrix
+        mask = self.maze_face_mask
+        face_sizes = mask.sum(axis=1)
 
-                if 0 <= gz < grid_height and 0 <= gx < grid_width:
-                    self.maze_grid[gz][gx] = 1
+        # 벽의 윗면(Top Face)을 찾아 해당 셀을 벽으로 표시 (1)
+        # 분류에는 Y 열만 모으고, X/Z는 벽으로 판정된 면에 대해서만 모음
+        max_y = np.where(mask, verts[face_idx, 1], -np.inf).max(axis=1, initial=-np.inf)
+        is_wall = (face_sizes > 0) & (max_y > 0.6)
+        counts = face_sizes[is_wall]
+        wall_idx, wall_mask = face_idx[is_wall], mask[is_wall]
+        avg_x = np.where(wall_mask, verts[wall_idx, 0], 0.0).sum(axis=1) / counts
+        avg_z = np.where(wall_mask, verts[wall_idx, 2], 0.0).sum(axis=1) / counts
+
+        gx = ((avg_x - min_x) / grid_scale).astype(np.int32)
+        gz = ((avg_z - min_z) / grid_scale).astype(np.int32)
+        inside = (gz >= 0) & (gz < grid_height) & (gx >= 0) & (gx < grid_width)
+        self.maze_grid[gz[inside], gx[inside]] = 1
 
         self.maze_width = grid_width
         self.maze_height = grid_height
@@ -1407,14 +1942,14 @@ class MiroOpenGLWidget(QOpenGLWidget):
     def _find_safe_spawn(self, near_top=True):
         """원본 미로 그리드에서 입구/출구 찾기"""
         # 원본 그리드가 있으면 사용
-        if self.original_maze_grid:
+        if self.original_maze_grid is not None and self.original_maze_grid.size:
             return self._find_spawn_from_original_grid(near_top)
 
         # 원본 그리드가 없으면 충돌 그리드에서 찾기 (폴백)
         return self._find_spawn_from_collision_grid(near_top)
 
     def _find_spawn_from_original_grid(self, near_top=True):
-        """원본 미로 그리드에서 입구/출구 위치 찾기"""
+        """원본 미로 그리드에서 입구/출구 위치 찾기 (NumPy 검색)"""
         grid = self.original_maze_grid
         height = self.original_maze_height
         width = self.original_maze_width
@@ -1424,59 +1959,40 @@ class MiroOpenGLWidget(QOpenGLWidget):
         offset_z = -height / 2.0
 
         if near_top:
-            # 입구 찾기: 상단 경계(y=0)에서 통로(0) 찾기
-            for gx in range(width):
-                if grid[0][gx] == 0:
-                    # 입구 바깥쪽 padding 영역에 스폰 (z=-1)
-                    spawn_gz = -1
-                    x = offset_x + gx + 0.5
-                    z = offset_z + spawn_gz + 0.5
-                    return [x, z]
+            # 입구 찾기: 상단 경계(y=0)에서 첫 통로(0)
+            openings = np.flatnonzero(grid[0, :width] == 0)
+            if len(openings):
+                # 입구 바깥쪽 padding 영역에 스폰 (z=-1)
+                spawn_gz = -1
+                return [offset_x + int(openings[0]) + 0.5, offset_z + spawn_gz + 0.5]
         else:
-            # 출구 찾기: 하단 경계(y=height-1)에서 통로(0) 찾기
-            for gx in range(width - 1, -1, -1):
-                if grid[height - 1][gx] == 0:
-                    x = offset_x + gx + 0.5
-                    z = offset_z + (height - 1) + 0.5
-                    return [x, z]
-
-        # 못 찾으면 내부 첫 통로
-        for gz in range(height):
-            for gx in range(width):
-                if grid[gz][gx] == 0:
-                    x = offset_x + gx + 0.5
-                    z = offset_z + gz + 0.5
-                    return [x, z]
+            # 출구 찾기: 하단 경계(y=height-1)에서 마지막 통로(0)
+            openings = np.flatnonzero(grid[height - 1, :width] == 0)
+            if len(openings):
+                return [offset_x + int(openings[-1]) + 0.5, offset_z + (height - 1) + 0.5]
+
+        # 못 찾으면 내부 첫 통로 (행 우선 순서)
+        passages = np.argwhere(grid[:height, :width] == 0)
+        if len(passages):
+            gz, gx = (int(v) for v in passages[0])
+            return [offset_x + gx + 0.5, offset_z + gz + 0.5]
 
         return [0.0, 0.0]
 
     def _find_spawn_from_collision_grid(self, near_top=True):
         """충돌 그리드에서 스폰 위치 찾기 (폴백)"""
-        if not self.maze_grid or not self.maze_grid[0]:
+        if self.maze_grid.size == 0:
             return [0.0, 0.0]
 
-        grid_height = len(self.maze_grid)
-        grid_width = len(self.maze_grid[0])
-
-        def is_passage(gz, gx):
-            if 0 <= gz < grid_height and 0 <= gx < grid_width:
-                return self.maze_grid[gz][gx] == 0
-            return False
+        grid_height, grid_width = self.maze_grid.shape
 
-        if near_top:
-            for gz in range(grid_height):
-                for gx in range(grid_width):
-                    if is_passage(gz, gx):
-                        x = self.grid_min_x + (gx + 0.5) * self.grid_scale
-                        z = self.grid_min_z + (gz + 0.5) * self.grid_scale
-                        return [x, z]
-        else:
-            for gz in range(grid_height - 1, -1, -1):
-                for gx in range(grid_width - 1, -1, -1):
-                    if is_passage(gz, gx):
-                        x = self.grid_min_x + (gx + 0.5) * self.grid_scale
-                        z = self.grid_min_z + (gz + 0.5) * self.grid_scale
-                        return [x, z]
+        # 행 우선 순서의 통로 목록: 위쪽은 첫 번째, 아래쪽은 마지막 통로
+        passages = np.argwhere(self.maze_grid == 0)
+        if len(passages):
+            gz, gx = (int(v) for v in (passages[0] if near_top else passages[-1]))
+            x = self.grid_min_x + (gx + 0.5) * self.grid_scale
+            z = self.grid_min_z + (gz + 0.5) * self.grid_scale
+            return [x, z]
 
         center_x = self.grid_min_x + (grid_width / 2) * self.grid_scale
         center_z = self.grid_min_z + (grid_height / 2) * self.grid_scale
@@ -1489,13 +2005,14 @@ class MiroOpenGLWidget(QOpenGLWidget):
         self.player_pos = [self.start_pos[0], start_floor + PLAYER_HEIGHT, self.start_pos[1]]
         self.player_yaw = 0.0  # 앞쪽(+Z 방향) 바라보기
         self.player_pitch = 0.0
+        self._update_view_trig()
 
         # 수직 물리 상태 초기화
         self.player_velocity_y = 0.0
         self.is_grounded = True
 
         # 키 상태 초기화
-        self.keys_pressed.clear()
+        self.key_mask = 0
 
         # 게임 활성화
         self.game_active = True
@@ -1514,6 +2031,7 @@ class MiroOpenGLWidget(QOpenGLWidget):
         self.setCursor(Qt.BlankCursor)
 
         # 게임 루프 시작
+        self._last_frame_state = None
         self.game_timer.start(GAME_TICK_MS)
         self.gameStarted.emit() # UI 등 외부에 알림
         
@@ -1589,53 +2107,43 @@ class MiroOpenGLWidget(QOpenGLWidget):
         # 목표 도달 체크
         self._check_goal()
 
-        # 화면 갱신
-        self.update()
+        # 화면 갱신 (애니메이션이 없고 마지막으로 그린 프레임과 상태가 같으면 재렌더링 생략)
+        if self.items or (self.weather and self.weather.active) or self._frame_state() != self._last_frame_state:
+            self.update()
+
+    def _frame_state(self):
+        """게임 틱이 바꿀 수 있는 렌더링 관련 상태 스냅샷"""
+        return (tuple(self.player_pos), self.player_yaw, self.player_pitch,
+                self.cheat_xray, self.cheat_minimap, self.cheat_eagle_eye,
+                self.fog_enabled, self.fog_density, self.shadow_quality, self.current_theme)
 
     def _process_movement(self):
         """WASD 이동 처리"""
-        if not self.keys_pressed:
+        if not self.key_mask:
             return
 
-        dx, dz = 0.0, 0.0
+        # 눌린 키 조합 → (전진, 측면) 계수 한 번에 조회
+        forward, strafe = MOVE_TABLE[self.key_mask]
+        speed = self.move_speed
 
         if self.cheat_eagle_eye:
             # 이글아이 모드: 화면 기준 상하좌우 (고정 방향)
             # W=위(-Z), S=아래(+Z), A=왼쪽(-X), D=오른쪽(+X)
-            if Qt.Key_W in self.keys_pressed:
-                dz -= self.move_speed
-            if Qt.Key_S in self.keys_pressed:
-                dz += self.move_speed
-            if Qt.Key_A in self.keys_pressed:
-                dx -= self.move_speed
-            if Qt.Key_D in self.keys_pressed:
-                dx += self.move_speed
+            dx = -strafe * speed
+            dz = -forward * speed
         else:
-            # 기존 1인칭 모드: yaw 기준 이동
-            forward_x = math.sin(self.player_yaw)
-            forward_z = math.cos(self.player_yaw)
-            right_x = math.cos(self.player_yaw)
-            right_z = -math.sin(self.player_yaw)
-
-            if Qt.Key_W in self.keys_pressed:
-                dx += forward_x * self.move_speed
-                dz += forward_z * self.move_speed
-            if Qt.Key_S in self.keys_pressed:
-                dx -= forward_x * self.move_speed
-                dz -= forward_z * self.move_speed
-            if Qt.Key_A in self.keys_pressed:
-                dx += right_x * self.move_speed
-                dz += right_z * self.move_speed
-            if Qt.Key_D in self.keys_pressed:
-                dx -= right_x * self.move_speed
-                dz -= right_z * self.move_speed
-
-        # 충돌 감지 후 이동
+            # 기존 1인칭 모드: yaw 기준 이동 (캐싱된 삼각함수 사용)
+            # 전진 벡터 (sin, cos), 측면 벡터 (cos, -sin)
+            dx = (forward * self._sin_yaw + strafe * self._cos_yaw) * speed
+            dz = (forward * self._cos_yaw - strafe * self._sin_yaw) * speed
+
+        # 충돌 감지 후 이동 (변위가 0인 축은 충돌/지면 검사를 건너뜀)
+        check_collision = self._check_collision
         new_x = self.player_pos[0] + dx
         new_z = self.player_pos[2] + dz
 
         # X축 이동 체크
-        x_collision = self._check_collision(new_x, self.player_pos[2])
+        x_collision = dx == 0.0 or check_collision(new_x, self.player_pos[2])
         if not x_collision:
             self.player_pos[0] = new_x
             self._update_ground_state()
@@ -1643,7 +2151,7 @@ class MiroOpenGLWidget(QOpenGLWidget):
         #     print(f"[X_BLOCK] grounded={self.is_grounded}, pos=({self.player_pos[0]:.2f}, {self.player_pos[2]:.2f}), new_x={new_x:.2f}")
 
         # Z축 이동 체크
-        z_collision = self._check_collision(self.player_pos[0], new_z)
+        z_collision = dz == 0.0 or check_collision(self.player_pos[0], new_z)
         if not z_collision:
             self.player_pos[2] = new_z
             self._update_ground_state()
@@ -1656,24 +2164,12 @@ class MiroOpenGLWidget(QOpenGLWidget):
         if self.cheat_noclip:
             return False
 
-        if not self.maze_grid:
+        if self.maze_grid.size == 0:
             return False
 
         # 플레이어 반경 내의 그리드 셀 체크
-        for offset_x in [-PLAYER_RADIUS, 0, PLAYER_RADIUS]:
-            for offset_z in [-PLAYER_RADIUS, 0, PLAYER_RADIUS]:
-                check_x = x + offset_x
-                check_z = z + offset_z
-
-                gx = int((check_x - self.grid_min_x) / self.grid_scale)
-                gz = int((check_z - self.grid_min_z) / self.grid_scale)
-
-                # 범위 밖 = 충돌 (미로 밖으로 나갈 수 없음)
-                if not (0 <= gz < len(self.maze_grid) and 0 <= gx < len(self.maze_grid[0])):
-                    return True
-                # 벽 충돌
-                if self.maze_grid[gz][gx] == 1:
-                    return True
+        if self._grid_blocked(x, z):
+            return True
 
         # 높이 차이 충돌 (지면에 있을 때만)
         if self.floor_height_map and self.is_grounded:
@@ -1690,23 +2186,10 @@ class MiroOpenGLWidget(QOpenGLWidget):
 
     def _check_collision_ignore_noclip(self, x, z):
         """충돌 감지 (노클립 상태 무시, 순수 충돌만 체크)"""
-        if not self.maze_grid:
+        if self.maze_grid.size == 0:
             return False
 
-        for offset_x in [-PLAYER_RADIUS, 0, PLAYER_RADIUS]:
-            for offset_z in [-PLAYER_RADIUS, 0, PLAYER_RADIUS]:
-                check_x = x + offset_x
-                check_z = z + offset_z
-
-                gx = int((check_x - self.grid_min_x) / self.grid_scale)
-                gz = int((check_z - self.grid_min_z) / self.grid_scale)
-
-                if not (0 <= gz < len(self.maze_grid) and 0 <= gx < len(self.maze_grid[0])):
-                    return True
-                if self.maze_grid[gz][gx] == 1:
-                    return True
-
-        return False
+        return self._grid_blocked(x, z)
 
     def _find_nearest_safe_tile(self, x, z):
         """현재 위치에서 가장 가까운 빈 타일(통로)의 정중앙 좌표 반환 (유클리드 거리 기반)
@@ -1714,33 +2197,23 @@ class MiroOpenGLWidget(QOpenGLWidget):
         Returns:
             (world_x, world_z) 또는 None (안전한 타일이 없는 경우)
         """
-        if not self.maze_grid:
+        if self.maze_grid.size == 0:
             return None
 
-        height = len(self.maze_grid)
-        width = len(self.maze_grid[0]) if height > 0 else 0
-
-        best_pos = None
-        best_dist_sq = float('inf')
-
-        # 모든 빈 타일 탐색
-        for gz in range(height):
-            for gx in range(width):
-                if self.maze_grid[gz][gx] == 0:  # 통로
-                    # 타일 정중앙 월드 좌표
-                    world_x = self.grid_min_x + (gx + 0.5) * self.grid_scale
-                    world_z = self.grid_min_z + (gz + 0.5) * self.grid_scale
-
-                    # 유클리드 거리 제곱 계산
-                    dx = world_x - x
-                    dz = world_z - z
-                    dist_sq = dx * dx + dz * dz
+        # 모든 빈 타일(통로)의 격자 좌표 (행 우선 순서)
+        free = np.argwhere(self.maze_grid == 0)
+        if len(free) == 0:
+            return None
 
-                    if dist_sq < best_dist_sq:
-                        best_dist_sq = dist_sq
-                        best_pos = (world_x, world_z)
+        # 타일 정중앙까지의 유클리드 거리 제곱 → 최솟값 (동률이면 먼저 나온 타일)
+        dx = self.grid_min_x + (free[:, 1] + 0.5) * self.grid_scale - x
+        dz = self.grid_min_z + (free[:, 0] + 0.5) * self.grid_scale - z
+        gz, gx = free[int(np.argmin(dx * dx + dz * dz))].tolist()
 
-        return best_pos
+        # 타일 정중앙 월드 좌표
+        world_x = self.grid_min_x + (gx + 0.5) * self.grid_scale
+        world_z = self.grid_min_z + (gz + 0.5) * self.grid_scale
+        return (world_x, world_z)
 
     def _teleport_to_safe_position(self):
         """플레이어가 벽 안에 있으면 가장 가까운 안전한 타일로 이동"""
@@ -1763,11 +2236,8 @@ class MiroOpenGLWidget(QOpenGLWidget):
         """목표 도달 체크 (거리 제곱 비교로 sqrt 제거)"""
         dx = self.player_pos[0] - self.goal_pos[0]
         dz = self.player_pos[2] - self.goal_pos[1]
-        # sqrt 제거: 거리 제곱과 반경 제곱 비교
-        distance_sq = dx * dx + dz * dz
-        goal_radius_sq = self.goal_radius * self.goal_radius
-
-        if distance_sq < goal_radius_sq:
+        # sqrt 제거: 거리 제곱과 (미리 계산한) 반경 제곱 비교
+        if dx * dx + dz * dz < GOAL_RADIUS_SQ:
             self.stop_game()
             self.game_won.emit()
 
@@ -1775,23 +2245,30 @@ class MiroOpenGLWidget(QOpenGLWidget):
         """게임 시작 시 무작위 위치에 아이템 배치"""
         self.items = []
 
-        if not self.maze_grid or not self.maze_grid[0] or not self.item_models:
+        if self.maze_grid.size == 0 or not self.item_models:
             return
 
         # 모든 통로 셀 수집
+        sx, sz = self.start_pos
+        goal_x, goal_z = self.goal_pos
         passages = []
-        for gz in range(len(self.maze_grid)):
-            for gx in range(len(self.maze_grid[0])):
-                if self.maze_grid[gz][gx] == 0:
+        grid_height, grid_width = self.maze_grid.shape
+        for gz in range(grid_height):
+            for gx in range(grid_width):
+                if self.maze_grid[gz, gx] == 0:
                     x = self.grid_min_x + (gx + 0.5) * self.grid_scale
                     z = self.grid_min_z + (gz + 0.5) * self.grid_scale
 
-                    # 시작점/골 위치 제외
-                    dist_start_sq = (x - self.start_pos[0]) ** 2 + (z - self.start_pos[1]) ** 2
-                    dist_goal_sq = (x - self.goal_pos[0]) ** 2 + (z - self.goal_pos[1]) ** 2
-
-                    if dist_start_sq > 2.25 and dist_goal_sq > 2.25:  # 1.5^2 = 2.25
-                        passages.append((x, z))
+                    # 시작점/골 위치 제외 (** 대신 곱셈으로 거리 제곱 계산)
+                    dx = x - sx
+                    dz = z - sz
+                    if dx * dx + dz * dz <= ITEM_SPAWN_CLEARANCE_SQ:
+                        continue
+                    dx = x - goal_x
+                    dz = z - goal_z
+                    if dx * dx + dz * dz <= ITEM_SPAWN_CLEARANCE_SQ:
+                        continue
+                    passages.append((x, z))
 
         # 무작위 N개 위치 + 무작위 N개 모델 선택
         spawn_limit = min(self.spawn_count, len(passages))
@@ -1816,13 +2293,13 @@ class MiroOpenGLWidget(QOpenGLWidget):
     def _check_item_collision(self):
         """플레이어와 아이템 충돌 체크, 접촉 시 아이템 제거"""
         px, pz = self.player_pos[0], self.player_pos[2]
-        radius_sq = ITEM_PICKUP_RADIUS * ITEM_PICKUP_RADIUS
 
         # 역순 순회로 안전하게 제거
         for i in range(len(self.items) - 1, -1, -1):
             ix, iz = self.items[i]['pos']
-            dist_sq = (px - ix) ** 2 + (pz - iz) ** 2
-            if dist_sq < radius_sq:
+            dx = px - ix
+            dz = pz - iz
+            if dx * dx + dz * dz < ITEM_PICKUP_RADIUS_SQ:
                 self.items.pop(i)
                 # GAHO 점수 증가 & 시그널 발생
                 self.gaho_score += 1
@@ -2006,8 +2483,8 @@ class MiroOpenGLWidget(QOpenGLWidget):
             gz = int(z - offset_z)
         else:
             # 폴백: 기존 충돌 그리드 기반 변환
-            gx = int((x - self.grid_min_x) / self.grid_scale)
-            gz = int((z - self.grid_min_z) / self.grid_scale)
+            gx = int((x - self.grid_min_x) * self.grid_inv_scale)
+            gz = int((z - self.grid_min_z) * self.grid_inv_scale)
 
         return self.floor_height_map.get((gx, gz), 0.0)
 
@@ -2028,8 +2505,8 @@ class MiroOpenGLWidget(QOpenGLWidget):
             gx = int(x - offset_x)
             gz = int(z - offset_z)
         else:
-            gx = int((x - self.grid_min_x) / self.grid_scale)
-            gz = int((z - self.grid_min_z) / self.grid_scale)
+            gx = int((x - self.grid_min_x) * self.grid_inv_scale)
+            gz = int((z - self.grid_min_z) * self.grid_inv_scale)
 
         # 통로가 아닌 위치(벽 속)에서는 함정 체크 안 함
         if (gx, gz) not in self.floor_height_map:
@@ -2114,41 +2591,42 @@ class MiroOpenGLWidget(QOpenGLWidget):
             event.ignore()
             return
 
-        if key in (Qt.Key_W, Qt.Key_A, Qt.Key_S, Qt.Key_D):
-            self.keys_pressed.add(key)
+        bit = MOVE_KEY_BITS.get(key, 0)
+        if bit:
+            self.key_mask |= bit
             event.accept()
-        elif key == Qt.Key_Space:
+        elif key == KEY_SPACE:
             self._try_jump()
             event.accept()
-        elif key == Qt.Key_Escape:
+        elif key == KEY_ESCAPE:
             self.pause_game()
             event.accept()
         # 치트 키 (숫자키 1-6)
-        elif key == Qt.Key_1:
+        elif key == KEY_1:
             self.cheatPauseTimer.emit(10)  # Pause Timer
             event.accept()
-        elif key == Qt.Key_2:
+        elif key == KEY_2:
             self.cheatTimeBoost.emit()  # Time Boost
             event.accept()
-        elif key == Qt.Key_3:
+        elif key == KEY_3:
             self.cheat_minimap = not self.cheat_minimap
             self.cheatStateChanged.emit('minimap', self.cheat_minimap)
             event.accept()
-        elif key == Qt.Key_4:
+        elif key == KEY_4:
             self.cheat_noclip = not self.cheat_noclip
             # 노클립 해제 시 안전 위치로 이동
             if not self.cheat_noclip:
                 self._teleport_to_safe_position()
             self.cheatStateChanged.emit('noclip', self.cheat_noclip)
             event.accept()
-        elif key == Qt.Key_5:
+        elif key == KEY_5:
             self.cheat_xray = not self.cheat_xray
             self.cheatStateChanged.emit('xray', self.cheat_xray)
             event.accept()
-        elif key == Qt.Key_6:
+        elif key == KEY_6:
             self.set_eagle_eye_mode(not self.cheat_eagle_eye)
             event.accept()
-        elif key == Qt.Key_Shift:
+        elif key == KEY_SHIFT:
             # Shift: GAHO 스킬 발동
             if self.gaho_score > 0:
                 self.gaho_score -= 1
@@ -2159,9 +2637,11 @@ class MiroOpenGLWidget(QOpenGLWidget):
 
     def keyReleaseEvent(self, event):
         """키 놓음 이벤트"""
-        key = event.key()
-        if key in self.keys_pressed:
-            self.keys_pressed.discard(key)
+        bit = MOVE_KEY_BITS.get(event.key(), 0)
+        if self.key_mask & bit:
+            # 키를 누르고 있는 동안 오는 자동 반복 release는 무시 (비트가 켜졌다 꺼졌다 하지 않도록)
+            if not event.isAutoRepeat():
+                self.key_mask &= ~bit
             event.accept()
         else:
             event.ignore()
@@ -2179,12 +2659,13 @@ class MiroOpenGLWidget(QOpenGLWidget):
         dy = event.y() - center.y()
 
         # 시점 회전 (좌우 반전 수정: -= 사용)
-        self.player_yaw -= dx * self.mouse_sensitivity * 0.01
-        self.player_pitch -= dy * self.mouse_sensitivity * 0.01
+        if dx or dy:
+            self.player_yaw -= dx * self.mouse_sensitivity * 0.01
+            self.player_pitch -= dy * self.mouse_sensitivity * 0.01
 
-        # pitch 제한 (-89° ~ 89°)
-        max_pitch = math.radians(89)
-        self.player_pitch = max(-max_pitch, min(max_pitch, self.player_pitch))
+            # pitch 제한 (-89° ~ 89°)
+            self.player_pitch = max(-MAX_PITCH, min(MAX_PITCH, self.player_pitch))
+            self._update_view_trig()
 
         # 마우스 중앙으로 이동
         global_center = self.mapToGlobal(center)
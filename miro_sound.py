@@ -1,15 +1,42 @@
 import os
-from PyQt5.QtCore import QUrl, QObject
-from PyQt5.QtMultimedia import QMediaPlayer, QMediaContent, QMediaPlaylist
+import threading
+from PyQt5.QtCore import QUrl, QObject, QTimer
+from PyQt5.QtMultimedia import QMediaPlayer, QMediaContent, QMediaPlaylist, QSoundEffect
 from resource_path import get_resource_path
 
+SFX_CHANNELS = 3  # 효과음 하나당 동시 재생 가능한 수
+VOLUME_APPLY_DELAY_MS = 16  # 볼륨 슬라이더 드래그 중 변경을 모아서 적용하는 간격
+
+# 스테이지 이름 → BGM 파일 (목록에 없으면 커스텀 BGM)
+STAGE_BGM = {f"Stage {i}": f"bgm_stage_{i}.mp3" for i in (1, 2, 3)}
+DEFAULT_STAGE_BGM = "bgm_custom.mp3"
+
+# 타이틀 BGM 기본 파일 (Clean / Muffled)
+TITLE_BGM_CLEAN = "bgm_title_clean.mp3"
+TITLE_BGM_MUFFLED = "bgm_title_muffled.mp3"
+
+
+def _warm_file_cache(paths):
+    """파일들을 OS 페이지 캐시에 미리 올림 (백그라운드 스레드용, Qt 객체는 건드리지 않음)"""
+    for path in paths:
+        try:
+            with open(path, 'rb') as f:
+                if hasattr(os, 'posix_fadvise'):
+                    # Linux 등: 커널에 미리 읽기만 요청 (데이터 복사 없음)
+                    os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_WILLNEED)
+                else:
+                    while f.read(1 << 20):
+                        pass
+        except OSError:
+            pass
+
 class SoundManager(QObject):
     """
     게임 전체의 사운드를 관리하는 클래스.
     
     기능:
     1. 배경음악(BGM) 재생: 타이틀(Clean/Muffled) 및 스테이지별 BGM
-    2. 효과음(SFX) 재생: 게임 클리어, 게임 오버 등
+    2. 효과음(SFX) 재생: 게임 클리어, 게임 오버 등 (효과음별 QSoundEffect 채널)
     3. Muffled Effect: 타이틀 화면 외의 탭에서는 먹먹한 버전의 BGM으로 전환
     """
     
@@ -21,6 +48,13 @@ class SoundManager(QObject):
         # 0. 마스터 볼륨 (0~100)
         self.master_volume = 100
         self.ducking_factor = 1.0 # 스킬 발동 시 BGM 줄임 (0.0~1.0)
+
+        # 슬라이더 드래그처럼 연속으로 들어오는 볼륨 변경은 마지막 값만 한 번에 적용
+        self._pending_master = None
+        self._vol_timer = QTimer(self)
+        self._vol_timer.setSingleShot(True)
+        self._vol_timer.setInterval(VOLUME_APPLY_DELAY_MS)
+        self._vol_timer.timeout.connect(self._apply_master_volume)
         
         # 1. 타이틀 BGM (Clean 버전)
         self.player_title_clean = QMediaPlayer()
@@ -32,22 +66,37 @@ class SoundManager(QObject):
         
         # 3. 스테이지 BGM
         self.player_stage = QMediaPlayer()
-        self.player_stage.setVolume(int(self.master_volume * 0.8)) # 80%
-        
-        # 4. 효과음 (SFX)
-        # 4. 효과음 (SFX) - 다중 재생을 위한 풀(Pool) 방식
-        self.sfx_pool = []
-        for _ in range(8): # 8개 채널
-            player = QMediaPlayer()
-            player.setVolume(self.master_volume)
-            self.sfx_pool.append(player)
+        self._rebuild_stage_lut()
+        self.player_stage.setVolume(self._stage_lut[100]) # 80%
         
         # 경로 설정 (assets/sounds 폴더 가정)
         self.base_path = get_resource_path(os.path.join('assets', 'sounds'))
+
+        # 4. 효과음 (SFX) - 효과음별로 미리 디코딩해 둔 QSoundEffect 묶음 (저지연 원샷 재생)
+        self._sfx_effects = {}  # 파일명 → [QSoundEffect] (1개로 시작해 SFX_CHANNELS까지 늘어남)
+        self._sfx_next = {}     # 파일명 → 모두 재생 중일 때 끊고 재사용할 다음 인덱스
+        self._sfx_map = {}      # 효과음 종류(소문자) → 파일명 (폴더의 sfx_<종류>.wav에서 생성)
+
+        # BGM 파일명 → QMediaContent 캐시 (재생할 때마다 파일 확인/객체 생성 방지)
+        self._content_cache = {}
+
+        # 사운드 폴더 파일 목록 (한 번 스캔) 및 효과음/BGM 미리 로드
+        self._available = frozenset()
+        self.refresh_assets()
+
+        # BGM 파일은 첫 재생 때 디스크 읽기로 멈추지 않도록 백그라운드에서 페이지 캐시로 미리 읽기
+        bgm_paths = [os.path.join(self.base_path, f) for f in sorted(self._available)
+                     if f.startswith('bgm_') and f.endswith('.mp3')]
+        threading.Thread(target=_warm_file_cache, args=(bgm_paths,), daemon=True).start()
             
         # 플레이리스트 설정 (반복 재생을 위해)
         self._setup_playlists()
 
+        # 재생 버튼을 누를 때 mp3를 여는 지연이 없도록 플레이리스트를 미리 채워 둠
+        self._title_files = None        # 현재 타이틀 플레이리스트에 올라간 (clean, muffled)
+        self._current_stage_file = None # 현재 스테이지 플레이리스트에 올라간 파일
+        self.load_title_bgm(TITLE_BGM_CLEAN, TITLE_BGM_MUFFLED)
+
     def _setup_playlists(self):
         """배경음악 무한 반복을 위한 플레이리스트 설정"""
         # 타이틀 BGM은 반복 재생
@@ -65,14 +114,79 @@ class SoundManager(QObject):
         self.player_stage.setPlaylist(self.playlist_stage)
 
     def _get_media_content(self, filename):
-        """파일 경로로부터 QMediaContent 생성"""
-        path = os.path.join(self.base_path, filename)
-        if os.path.exists(path):
-            return QMediaContent(QUrl.fromLocalFile(path))
-        return QMediaContent()
+        """파일 경로로부터 QMediaContent 생성 (파일명별로 한 번만 만들고 캐시)"""
+        content = self._content_cache.get(filename)
+        if content is not None:
+            return content
+
+        if self._has_file(filename):
+            content = QMediaContent(QUrl.fromLocalFile(os.path.join(self.base_path, filename)))
+        else:
+            content = QMediaContent()
+        self._content_cache[filename] = content
+        return content
+
+    def refresh_assets(self):
+        """사운드 폴더를 다시 스캔하고 캐시를 비운 뒤 효과음/BGM을 미리 로드 (파일 교체 시 호출)"""
+        try:
+            self._available = frozenset(os.listdir(self.base_path))
+        except OSError: # 사운드 폴더가 없으면 소리 없이 동작
+            self._available = frozenset()
+
+        for effects in self._sfx_effects.values():
+            for effect in effects:
+                effect.stop()
+                effect.deleteLater()
+        self._sfx_effects.clear()
+        self._sfx_next.clear()
+        self._content_cache.clear()
+
+        self._sfx_map = {f[4:-4].lower(): f for f in self._available if f.startswith('sfx_') and f.endswith('.wav')}
+        for filename in sorted(self._sfx_map.values()):
+            self._load_sfx(filename)
+        self.preload(f for f in sorted(self._available) if f.startswith('bgm_') and f.endswith('.mp3'))
+
+    def _has_file(self, filename):
+        """사운드 폴더에 파일이 있는지 (스캔 목록으로 판단, 대소문자 구분 없는 파일시스템 대비 stat 폴백)"""
+        if not filename:
+            return False
+        return filename in self._available or os.path.isfile(os.path.join(self.base_path, filename))
+
+    def preload(self, filenames):
+        """
+        사운드 파일들의 QMediaContent를 미리 생성해 캐시에 저장
+        
+        Args:
+            filenames (Iterable[str]): base_path 기준 파일 이름들
+        """
+        for filename in filenames:
+            self._get_media_content(filename)
+
+    def _load_sfx(self, filename):
+        """효과음 파일을 채널 1개로 미리 로드 (파일이 없으면 빈 리스트, 나머지 채널은 필요할 때 추가)"""
+        effects = self._sfx_effects.get(filename)
+        if effects is not None:
+            return effects
+
+        effects = []
+        if self._has_file(filename):
+            effects.append(self._new_sfx_channel(filename))
+        self._sfx_effects[filename] = effects
+        return effects
+
+    def _new_sfx_channel(self, filename):
+        """효과음 채널(QSoundEffect) 하나 생성 (같은 파일의 샘플 데이터는 Qt 내부 캐시를 공유)"""
+        effect = QSoundEffect(self)
+        effect.setSource(QUrl.fromLocalFile(os.path.join(self.base_path, filename)))
+        effect.setVolume(self.master_volume / 100.0)
+        return effect
 
     def load_title_bgm(self, clean_file, muffled_file):
-        """타이틀 BGM 로드 (Clean & Muffled)"""
+        """타이틀 BGM 로드 (Clean & Muffled, 이미 올라간 파일이면 건너뜀)"""
+        if self._title_files == (clean_file, muffled_file):
+            return
+        self._title_files = (clean_file, muffled_file)
+
         self.playlist_title_clean.clear()
         self.playlist_title_clean.addMedia(self._get_media_content(clean_file))
         
@@ -100,7 +214,20 @@ class SoundManager(QObject):
         Args:
             volume (int): 0~100 사이의 값
         """
+        if self._pending_master is None and volume == self.master_volume:
+            return
+        self._pending_master = volume
+        if not self._vol_timer.isActive():
+            self._vol_timer.start()
+
+    def _apply_master_volume(self):
+        """모아 둔 마스터 볼륨을 플레이어/효과음에 실제 적용"""
+        volume = self._pending_master
+        self._pending_master = None
+        if volume is None or volume == self.master_volume:
+            return
         self.master_volume = volume
+        self._rebuild_stage_lut()
         
         # 현재 Muffled 상태에 따라 볼륨 재설정
         # (Clean이 들리고 있었다면 Clean에 볼륨 적용, 아니면 Muffled에 적용)
@@ -108,21 +235,24 @@ class SoundManager(QObject):
         
         self.set_muffled(not is_clean_active)
         
-        # 스테이지 BGM과 SFX도 업데이트
         # 스테이지 BGM과 SFX도 업데이트
         self._update_stage_volume()
-        for player in self.sfx_pool:
-            player.setVolume(self.master_volume)
+        for effects in self._sfx_effects.values():
+            for effect in effects:
+                effect.setVolume(self.master_volume / 100.0)
 
     def set_ducking(self, factor):
         """BGM 일시적 볼륨 조절 (Ducking)"""
-        self.ducking_factor = factor
+        self.ducking_factor = max(0.0, min(1.0, factor))
         self._update_stage_volume()
+
+    def _rebuild_stage_lut(self):
+        """덕킹 비율(0~100%)별 스테이지 BGM 볼륨표 (마스터 볼륨이 바뀔 때만 계산)"""
+        self._stage_lut = [int(self.master_volume * 0.8 * f / 100.0) for f in range(101)]
         
     def _update_stage_volume(self):
         """스테이지 BGM 볼륨 실제 적용"""
-        vol = int(self.master_volume * 0.8 * self.ducking_factor)
-        self.player_stage.setVolume(vol)
+        self.player_stage.setVolume(self._stage_lut[round(self.ducking_factor * 100)])
 
     def set_muffled(self, is_muffled):
         """
@@ -138,6 +268,28 @@ class SoundManager(QObject):
             self.player_title_clean.setVolume(self.master_volume)
             self.player_title_muffled.setVolume(0)
 
+    def preload_stage(self, stage_name):
+        """
+        다음에 들어갈 스테이지의 BGM을 플레이리스트에 미리 올려 둠
+        
+        Returns:
+            bool: 재생 가능한 BGM이 올라가 있으면 True
+        """
+        bgm_file = STAGE_BGM.get(stage_name, DEFAULT_STAGE_BGM)
+        if bgm_file == self._current_stage_file:
+            return True
+
+        self.player_stage.stop()
+        self.playlist_stage.clear()
+        content = self._get_media_content(bgm_file)
+        if content.isNull():
+            self._current_stage_file = None
+            print(f"BGM file not found: {bgm_file}")
+            return False
+        self.playlist_stage.addMedia(content)
+        self._current_stage_file = bgm_file
+        return True
+
     def play_stage_bgm(self, stage_name):
         """
         스테이지별 BGM 재생
@@ -149,75 +301,60 @@ class SoundManager(QObject):
         self.player_title_clean.pause()
         self.player_title_muffled.pause()
         
-        # 파일 매핑
-        bgm_file = "bgm_custom.mp3" # 기본값
-        if "Stage 1" in stage_name:
-            bgm_file = "bgm_stage_1.mp3"
-        elif "Stage 2" in stage_name:
-            bgm_file = "bgm_stage_2.mp3"
-        elif "Stage 3" in stage_name:
-            bgm_file = "bgm_stage_3.mp3"
-            
-        # 플레이리스트 갱신 및 재생
-        self.playlist_stage.clear()
-        content = self._get_media_content(bgm_file)
-        if not content.isNull():
-            self.playlist_stage.addMedia(content)
+        # 같은 곡이 이미 재생 중이면 처음부터 다시 틀지 않음 (코덱 재초기화/끊김 방지)
+        bgm_file = STAGE_BGM.get(stage_name, DEFAULT_STAGE_BGM)
+        if bgm_file == self._current_stage_file and self.player_stage.state() == QMediaPlayer.PlayingState:
+            self._update_stage_volume()
+            return
+
+        # 플레이리스트 갱신 (같은 곡이 이미 올라가 있으면 그대로) 및 재생
+        if self.preload_stage(stage_name):
             self._update_stage_volume()
             self.player_stage.play()
-        else:
-            print(f"BGM file not found: {bgm_file}")
 
     def play_sfx(self, sfx_type):
         """
         효과음 재생 (One-shot)
         
         Args:
-            sfx_type (str): "clear", "gameover" 등
+            sfx_type (str): "clear", "gameover", "ghost_start" 등 (sfx_<종류>.wav)
         """
-        filename = ""
-        if sfx_type == "clear":
-            filename = "sfx_clear.wav"
-        elif sfx_type == "gameover":
-            filename = "sfx_gameover.wav"
-        elif sfx_type == "item_get":
-            filename = "sfx_item_get.wav"
-        elif sfx_type == "skill_activate":
-            filename = "sfx_skill_activate.wav"
-        elif sfx_type == "time_boost":
-            filename = "sfx_time_boost.wav"
-        elif sfx_type == "trap_fall":
-            filename = "sfx_trap_fall.wav"
-        elif sfx_type.endswith("_start") or sfx_type.endswith("_end"):
-            # 일반화된 처리: sfx_ghost_start.wav 등
-            filename = f"sfx_{sfx_type}.wav"
-            
-        content = self._get_media_content(filename)
-        if not content.isNull():
-            # 사용 가능한 플레이어 찾기
-            player_to_use = None
-            for player in self.sfx_pool:
-                if player.state() == QMediaPlayer.StoppedState:
-                    player_to_use = player
-                    break
+        filename = self._sfx_map.get(sfx_type)
+        if filename is None:
+            return
             
-            # 모두 사용 중이면 첫 번째꺼 사용 (Interruption)
-            if player_to_use is None:
-                player_to_use = self.sfx_pool[0]
-                
-            player_to_use.setMedia(content)
-            player_to_use.setVolume(self.master_volume)
-            player_to_use.play()
+        effects = self._load_sfx(filename)
+        if not effects:
+            return
+
+        # 재생 중이 아닌 채널 찾기
+        for effect in effects:
+            if not effect.isPlaying():
+                effect.play()
+                return
+
+        # 모두 사용 중이면 최대 SFX_CHANNELS까지 채널을 늘림
+        if len(effects) < SFX_CHANNELS:
+            effect = self._new_sfx_channel(filename)
+            effects.append(effect)
+            effect.play()
+            return
+
+        # 채널이 꽉 찼으면 돌아가며 하나를 끊고 재사용 (Interruption)
+        index = self._sfx_next.get(filename, 0)
+        self._sfx_next[filename] = (index + 1) % len(effects)
+        effects[index].stop()
+        effects[index].play()
 
     def stop_stage_bgm(self):
         """스테이지 BGM 중지"""
         self.player_stage.stop()
 
-
     def stop_sfx_pool(self):
-        """SFX 풀의 모든 재생 중지"""
-        for player in self.sfx_pool:
-            player.stop()
+        """모든 효과음 재생 중지"""
+        for effects in self._sfx_effects.values():
+            for effect in effects:
+                effect.stop()
 
     def stop_all(self):
         """모든 사운드 중지"""
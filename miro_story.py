@@ -6,10 +6,24 @@
 import os
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
                              QSizePolicy, QFrame)
-from PyQt5.QtCore import Qt, pyqtSignal
-from PyQt5.QtGui import QPixmap, QFont, QColor, QPainter
+from PyQt5.QtCore import Qt, pyqtSignal, QTimer, QRunnable, QThreadPool, QSize
+from PyQt5.QtGui import QPixmap, QImage, QImageReader, QFont, QColor, QPainter
 from resource_path import get_resource_path
 
+def _read_story_image(path, target_size):
+    """
+    스토리 이미지를 표시 크기에 맞춰 디코딩합니다 (QImageReader가 디코딩 단계에서 축소).
+    target_size가 비어 있거나 원본보다 크면 원본 해상도로 읽습니다.
+    """
+    reader = QImageReader(path)
+    size = reader.size()
+    target = QSize(*target_size)
+    if size.isValid() and not target.isEmpty():
+        scaled = size.scaled(target, Qt.KeepAspectRatio)
+        if scaled.width() < size.width():
+            reader.setScaledSize(scaled)
+    return reader.read()
+
 class AspectRatioLabel(QLabel):
     """
     비율을 유지하며 부모 위젯에 맞춰 크기가 조절되는 라벨입니다.
@@ -21,13 +35,37 @@ class AspectRatioLabel(QLabel):
         self.setSizePolicy(QSizePolicy.Ignored, QSizePolicy.Ignored)
         self.setAlignment(Qt.AlignCenter)
         self._pixmap = None
+        self._scaled = None      # 현재 크기로 스케일된 픽스맵 캐시
+        self._scaled_key = None  # (너비, 높이, 원본 cacheKey, 변환 모드)
+
+        # 창 크기 조절 중에는 빠른(최근접) 스케일링, 멈추면 부드러운 스케일링으로 다시 그림
+        self._smooth = True
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(80)
+        self._resize_timer.timeout.connect(self._on_resize_settled)
 
     def setPixmap(self, pixmap):
+        # 같은 픽스맵(빈 화면 반복 등)이면 다시 그릴 필요 없음
+        if self._pixmap is not None and pixmap.cacheKey() == self._pixmap.cacheKey():
+            return
         self._pixmap = pixmap
+        self._scaled_key = None
         # 부모 setPixmap은 호출하지 않거나, 빈 픽스맵으로 초기화하여 기본 그리기 동작 방지
         super().setPixmap(QPixmap()) 
         self.update() # 다시 그리기 요청
 
+    def resizeEvent(self, event):
+        # 이미 한 번 그려진 뒤의 크기 변경(사용자 드래그)만 빠른 모드로 전환
+        if self._scaled_key is not None:
+            self._smooth = False
+            self._resize_timer.start()
+        super().resizeEvent(event)
+
+    def _on_resize_settled(self):
+        self._smooth = True
+        self.update()
+
     def paintEvent(self, event):
         if not self._pixmap or self._pixmap.isNull():
             super().paintEvent(event)
@@ -40,8 +78,13 @@ class AspectRatioLabel(QLabel):
         w = self.width()
         h = self.height()
         
-        # 원본 이미지 비율 유지하며 현재 위젯 크기에 맞게 스케일링
-        scaled_pixmap = self._pixmap.scaled(w, h, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        # 원본 이미지 비율 유지하며 현재 위젯 크기에 맞게 스케일링 (크기/원본이 같으면 캐시 재사용)
+        mode = Qt.SmoothTransformation if self._smooth else Qt.FastTransformation
+        key = (w, h, self._pixmap.cacheKey(), mode)
+        if key != self._scaled_key:
+            self._scaled = self._pixmap.scaled(w, h, Qt.KeepAspectRatio, mode)
+            self._scaled_key = key
+        scaled_pixmap = self._scaled
         
         # 중앙 정렬 좌표 계산
         x = (w - scaled_pixmap.width()) // 2
@@ -49,16 +92,48 @@ class AspectRatioLabel(QLabel):
         
         painter.drawPixmap(x, y, scaled_pixmap)
 
+class _StoryImageLoader(QRunnable):
+    """
+    스토리 이미지를 백그라운드 스레드에서 QImage로 디코딩합니다.
+    QPixmap은 GUI 스레드에서만 만들 수 있으므로 결과는 시그널로 넘깁니다.
+    """
+    def __init__(self, page, path, target_size, loaded_signal):
+        super().__init__()
+        self.page = page
+        self.path = path
+        self.target_size = target_size
+        self.loaded_signal = loaded_signal
+
+    def run(self):
+        image = _read_story_image(self.path, self.target_size)
+        try:
+            self.loaded_signal.emit(self.page, image)
+        except RuntimeError:
+            pass # 위젯이 이미 삭제된 경우
+
 class MiroStoryWidget(QWidget):
     """
     스토리 이미지를 순차적으로 보여주는 위젯입니다.
     """
     finished = pyqtSignal() # 스토리 읽기가 끝나고 타이틀로 돌아갈 때 발생
+    _page_loaded = pyqtSignal(int, QImage) # 백그라운드 미리 읽기 완료 (GUI 스레드로 전달)
 
     def __init__(self, parent=None):
         super().__init__(parent)
         self.current_page = 0
         self.total_pages = 8 # 총 8장으로 변경
+        self._page_cache = {} # 페이지 번호 → (디코딩 크기, QPixmap) (이전/현재/다음 페이지만 유지)
+        self._pending_pages = {} # 백그라운드에서 읽는 중인 페이지 → 디코딩 크기
+        self._placeholder = None # 이미지가 없는 페이지용 빈 화면 (처음 필요할 때 생성)
+        # 전역 스레드 풀은 Qt 내부(부드러운 스케일링 등)에서도 쓰므로 전용 풀 1개 스레드로 분리
+        self._loader_pool = QThreadPool(self)
+        self._loader_pool.setMaxThreadCount(1)
+        self._page_loaded.connect(self._on_page_loaded)
+        # 창 크기 조절이 끝나면 새 크기에 맞춰 현재 페이지를 다시 디코딩
+        self._redecode_timer = QTimer(self)
+        self._redecode_timer.setSingleShot(True)
+        self._redecode_timer.setInterval(150)
+        self._redecode_timer.timeout.connect(self._on_resize_settled)
         self._setup_ui()
 
     def _setup_ui(self):
@@ -118,31 +193,94 @@ class MiroStoryWidget(QWidget):
             # 마지막 페이지에서 누르면 종료
             self.finished.emit()
             
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        if self.current_page > 0:
+            self._redecode_timer.start()
+
+    def _on_resize_settled(self):
+        entry = self._page_cache.get(self.current_page)
+        if entry is not None and entry[0] != self._decode_size():
+            self._update_ui()
+
+    def _page_path(self, page):
+        return get_resource_path(os.path.join('assets', f"story_{page}.png"))
+
+    def _decode_size(self):
+        """이미지를 디코딩할 목표 크기 (라벨 크기, 아직 배치 전이면 (0, 0) → 원본 크기)"""
+        size = self.lbl_image.size()
+        if size.isEmpty():
+            return (0, 0)
+        return (size.width(), size.height())
+
+    def _cached_pixmap(self, page, decode_size):
+        entry = self._page_cache.get(page)
+        if entry is None or entry[0] != decode_size:
+            return None
+        return entry[1]
+
+    def _prefetch(self, page, decode_size):
+        """다음에 볼 페이지 이미지를 백그라운드에서 미리 디코딩"""
+        if page > self.total_pages or self._cached_pixmap(page, decode_size) is not None:
+            return
+        if self._pending_pages.get(page) == decode_size:
+            return
+        image_path = self._page_path(page)
+        if not os.path.exists(image_path):
+            return
+        self._pending_pages[page] = decode_size
+        self._loader_pool.start(_StoryImageLoader(page, image_path, decode_size, self._page_loaded))
+
+    def _on_page_loaded(self, page, image):
+        """미리 읽은 이미지를 GUI 스레드에서 QPixmap으로 변환해 캐시에 저장"""
+        decode_size = self._pending_pages.pop(page, None)
+        if image.isNull() or decode_size != self._decode_size() or abs(page - self.current_page) > 1:
+            return
+        if self._cached_pixmap(page, decode_size) is None:
+            self._page_cache[page] = (decode_size, QPixmap.fromImage(image))
+
     def _update_ui(self):
         """현재 페이지에 맞춰 UI(이미지, 버튼 상태)를 갱신합니다."""
-        # 1. 이미지 로드
-        image_name = f"story_{self.current_page}.png"
-        image_path = get_resource_path(os.path.join('assets', image_name))
-        
-        if os.path.exists(image_path):
-            pixmap = QPixmap(image_path)
-            self.lbl_image.setPixmap(pixmap)
-        else:
-            # 이미지가 없을 경우: 검은 화면 (규격 유지)
-            # print(f"Image not found: {image_path}") # 디버그 로그 제거
-            empty = QPixmap(1920, 1440)
-            empty.fill(QColor("#222"))
-            self.lbl_image.setPixmap(empty)
-
-        # 2. 버튼 상태 업데이트
-        self.btn_prev.setVisible(self.current_page > 1)
+        # 이미지/버튼/페이지 번호 변경을 한 번의 다시 그리기로 모음
+        self.setUpdatesEnabled(False)
+        try:
+            # 1. 이미지 로드 (같은 크기로 읽은 페이지는 캐시에서, 아니면 표시 크기로 축소 디코딩)
+            decode_size = self._decode_size()
+            pixmap = self._cached_pixmap(self.current_page, decode_size)
+            if pixmap is None:
+                image_path = self._page_path(self.current_page)
+                if os.path.exists(image_path):
+                    pixmap = QPixmap.fromImage(_read_story_image(image_path, decode_size))
+                    self._page_cache[self.current_page] = (decode_size, pixmap)
+
+            if pixmap is not None:
+                self.lbl_image.setPixmap(pixmap)
+            else:
+                # 이미지가 없을 경우: 검은 화면 (규격 유지)
+                # print(f"Image not found: {image_path}") # 디버그 로그 제거
+                if self._placeholder is None:
+                    # 단색이므로 1920x1440과 같은 4:3 비율의 작은 픽스맵을 라벨이 늘려 그림
+                    self._placeholder = QPixmap(16, 12)
+                    self._placeholder.fill(QColor("#222"))
+                self.lbl_image.setPixmap(self._placeholder)
+
+            # 이전/현재/다음 페이지만 남기고, 다음 페이지는 읽는 동안 미리 디코딩
+            for page in [p for p in self._page_cache if abs(p - self.current_page) > 1]:
+                del self._page_cache[page]
+            self._prefetch(self.current_page + 1, decode_size)
+
+            # 2. 버튼 상태 업데이트
+            self.btn_prev.setVisible(self.current_page > 1)
         
-        if self.current_page == self.total_pages:
-            self.btn_next.setText("Return to Title")
-            self.btn_next.setStyleSheet("")
-        else:
-            self.btn_next.setText("Next Page")
-            self.btn_next.setStyleSheet("")
+            if self.current_page == self.total_pages:
+                self.btn_next.setText("Return to Title")
+                self.btn_next.setStyleSheet("")
+            else:
+                self.btn_next.setText("Next Page")
+                self.btn_next.setStyleSheet("")
 
-        # 3. 페이지 번호 업데이트
-        self.lbl_page_num.setText(f"{self.current_page} / {self.total_pages}")
+            # 3. 페이지 번호 업데이트
+            self.lbl_page_num.setText(f"{self.current_page} / {self.total_pages}")
+        finally:
+            self.setUpdatesEnabled(True)
+            self.update()
@@ -5,20 +5,199 @@
 
 import os
 import glob
+import functools
+import hashlib
+import random
+import time
 from PyQt5.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
                              QStackedWidget, QGroupBox, QSpinBox, QCheckBox, QComboBox,
-                             QSpacerItem, QSizePolicy, QMessageBox, QProgressBar)
-from PyQt5.QtCore import Qt, QSize, QTimer
-from PyQt5.QtGui import QPixmap, QFont
+                             QSizePolicy, QMessageBox, QProgressBar,
+                             QToolBar, QAction, QToolButton, QMenu, QWidgetAction,
+                             QFrame, QDoubleSpinBox, QFileDialog, QApplication)
+from PyQt5.QtCore import Qt, QTimer, pyqtSignal, QRunnable, QThreadPool, QThread
+from PyQt5.QtGui import QPixmap, QPixmapCache, QFont, QImageReader
 from miro_opengl import MiroOpenGLWidget
 from miro_story import MiroStoryWidget
 from resource_path import get_resource_path, get_user_data_path
 
+TITLE_IMAGE_SIZE = (800, 300) # 타이틀 이미지 표시 크기 (비율 유지, 이 안에 맞춤)
+# 스토리 모드 스테이지 설정: 모드 이름 → (테마, 안개, 날씨, 미로 파일, 제한 시간[초])
+_STAGE_SETTINGS = {
+    "Stage 1": ("810-Gwan", False, "Clear", 'maze_01.dat', 60),               # 810관
+    "Stage 2": ("Inside Campus", True, "Rain", 'maze_02.dat', 90),            # 교정 내부, 안개로 분위기 조성
+    "Stage 3": ("Path to the Main Gate", False, "Snow", 'maze_03.dat', 120),  # 정문
+}
+STAGE_COUNT = len(_STAGE_SETTINGS) # 스토리 모드 스테이지 수
+TIMER_TICK_MS = 250 # 게임 타이머 확인 주기 (표시 시간은 monotonic 시계에서 계산)
+MAZE_CACHE_LIMIT = 32 # 미리 만들어 두는 커스텀 미로 파일 최대 개수 (설정 조합별 1개)
+
+# 타이틀 이미지 경로 (import 시 한 번만 계산, PyInstaller 빌드에서도 유효한 경로)
+_TITLE_IMAGE_PATH = get_resource_path(os.path.join('assets', 'maze_title.png'))
+_TITLE_IMAGE_EXISTS = os.path.exists(_TITLE_IMAGE_PATH)
+
+_ITEMS_CACHE = {} # (datasets 경로, 폴더 mtime) → 샘플 아이템 목록
+
+# 남은 시간 구간별 타이머 라벨 스타일 (구간이 바뀔 때만 적용, 텍스트 색상만 변경하여 OS 기본 UI 유지)
+_TIMER_BAND_QSS = {
+    'normal': "",
+    'orange': "color: #FF5722; font-weight: bold;", # Deep Orange
+    'red': "color: red; font-weight: bold;",
+}
+
+# 0~3600초 타이머 문자열을 미리 만들어 두고, 매 초 포맷팅 대신 인덱스로 꺼내 씀
+_MMSS = tuple(f"{t // 60:02d}:{t % 60:02d}" for t in range(3601))
+
+def _load_title_pixmap(image_path, width, height):
+    """
+    타이틀 이미지를 (width, height) 안에 맞게 줄인 픽스맵 반환.
+    줄인 결과는 사용자 데이터 폴더에 저장해 두고, 원본이 바뀌지 않았으면 다음 실행부터 그대로 읽습니다.
+    같은 프로세스 안에서는 QPixmapCache에 올려 두어 여러 창/위젯이 같은 픽스맵(암시적 공유)을 씁니다.
+    """
+    # 원본 수정 시각까지 키에 넣어, 실행 중에 이미지가 바뀌면 메모리 캐시도 새로 만들어짐
+    stat = os.stat(image_path)
+    cache_key = f"{image_path}@{width}x{height}@{stat.st_mtime_ns}"
+    pixmap = QPixmapCache.find(cache_key)
+    if pixmap is not None and not pixmap.isNull():
+        return pixmap
+
+    # 디스크 캐시 폴더 (읽기 전용 설치 경로 등으로 만들 수 없으면 디스크 캐시 없이 진행)
+    try:
+        cache_dir = get_user_data_path('cache')
+        os.makedirs(cache_dir, exist_ok=True)
+    except OSError:
+        cache_dir = None
+    cache_path = None
+    if cache_dir is not None:
+        cache_path = os.path.join(cache_dir, f"maze_title_{width}x{height}_{stat.st_mtime_ns}_{stat.st_size}.png")
+
+    if cache_path is not None and os.path.exists(cache_path):
+        pixmap = QPixmap(cache_path)
+        if not pixmap.isNull():
+            QPixmapCache.insert(cache_key, pixmap)
+            return pixmap
+
+    # 이미지 크기 조정 (비율 유지) - 원본 크기의 QPixmap을 만들지 않고 디코딩 단계에서 축소
+    reader = QImageReader(image_path)
+    source_size = reader.size()
+    if source_size.isValid():
+        reader.setScaledSize(source_size.scaled(width, height, Qt.KeepAspectRatio))
+    pixmap = QPixmap.fromImage(reader.read())
+
+    # 이전 원본으로 만든 캐시는 지우고 새로 저장 (실패해도 다음 실행에서 다시 만들면 됨)
+    if cache_path is not None and not pixmap.isNull():
+        for old_path in glob.glob(os.path.join(cache_dir, f"maze_title_{width}x{height}_*.png")):
+            try:
+                os.remove(old_path)
+            except OSError:
+                pass
+        if not pixmap.save(cache_path, "PNG"):
+            print(f"Failed to cache title image: {cache_path}")
+    QPixmapCache.insert(cache_key, pixmap)
+    return pixmap
+
+
+def _custom_maze_cache_path(cache_dir, width, height, wall_thickness, wall_height, enable_height_var):
+    """커스텀 미로 설정 조합별로 미리 만들어 둘 .dat 파일 경로 (cache_dir 아래)"""
+    import maze_generator
+
+    # 생성기 출력 형식 버전을 키에 넣어, 형식이 바뀌면 이전 버전으로 만든 파일은 쓰지 않음
+    params = (f"v{maze_generator.MAZE_FORMAT_VERSION}:{width}x{height}:{wall_thickness}:{wall_height}:"
+              f"{int(enable_height_var)}")
+    key = hashlib.blake2b(params.encode(), digest_size=12).hexdigest()
+    return os.path.join(cache_dir, key + '.dat')
+
+def _take_cached_maze(cache_path, dest_path):
+    """
+    미리 만들어 둔 미로가 있으면 dest_path로 옮기고 True 반환.
+    한 번 쓴 파일은 캐시에서 빠지므로 같은 설정으로 다시 시작해도 매번 새 미로가 됩니다.
+    """
+    try:
+        os.replace(cache_path, dest_path)
+    except OSError:
+        return False
+    return True
+
+def _evict_maze_cache(cache_dir, limit):
+    """최근에 만든 limit개만 남기고 오래된 캐시 미로 삭제"""
+    try:
+        with os.scandir(cache_dir) as entries:
+            files = [(e.stat().st_mtime, e.path) for e in entries if e.name.endswith('.dat')]
+    except OSError:
+        return
+    files.sort(reverse=True)
+    for _, path in files[limit:]:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+class _CustomMazeBuilder(QRunnable):
+    """
+    커스텀 미로를 백그라운드 스레드에서 생성하고 .dat 파일로 내보냅니다.
+    결과(세션 ID, 파일 경로, 오류 메시지)는 시그널로 GUI 스레드에 넘깁니다. (ready_signal이 None이면 캐시용 파일만 생성)
+    """
+    def __init__(self, session_id, path, width, height, wall_thickness, wall_height,
+                 enable_height_var, ready_signal):
+        super().__init__()
+        self.session_id = session_id
+        self.path = path
+        self.width = width
+        self.height = height
+        self.wall_thickness = wall_thickness
+        self.wall_height = wall_height
+        self.enable_height_var = enable_height_var
+        self.ready_signal = ready_signal
+
+    def run(self):
+        if self.ready_signal is None:
+            # 미리 만들어 두는 미로는 실제 생성/게임 화면보다 CPU를 덜 쓰도록 (풀 스레드는 이 용도로만 쓰임)
+            QThread.currentThread().setPriority(QThread.LowestPriority)
+        error = ""
+        try:
+            import maze_generator
+
+            print(f"Generating Custom Maze ({self.width}x{self.height}), Height Variation: {self.enable_height_var}...")
+            maze = maze_generator.Maze(self.width, self.height, enable_height_variation=self.enable_height_var)
+            maze.generate()
+            # .dat 파일로 내보내기 (임시 파일에 쓴 뒤 교체해, 쓰는 도중인 파일을 읽지 않도록)
+            tmp_path = self.path + '.tmp'
+            maze.export_to_dat(tmp_path, wall_thickness=self.wall_thickness, wall_height=self.wall_height)
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            error = str(e) or type(e).__name__
+        if self.ready_signal is None:
+            # 미리 만들어 두는 미로: 캐시 폴더 크기만 제한
+            _evict_maze_cache(os.path.dirname(self.path), MAZE_CACHE_LIMIT)
+            return
+        try:
+            self.ready_signal.emit(self.session_id, self.path, error)
+        except RuntimeError:
+            pass # 창이 이미 닫힌 경우
+
+
 class MiroWindow(QMainWindow):
     """
     미로 찾기 게임의 메인 UI 위젯입니다.
     타이틀 화면과 게임 화면을 전환하며 관리합니다.
     """
+    # 라벨 스타일시트 (인스턴스마다 문자열을 새로 만들지 않도록 클래스 상수로 공유)
+    _HINT_QSS = "color: gray; font-style: italic; font-size: 12px;"
+    _TITLE_MISSING_QSS = "font-size: 30px; color: white; font-weight: bold;"
+    _CREDITS_QSS = "font-weight: bold; color: #666; font-size: 14px; margin-bottom: 20px;"
+    _GAHO_QSS = "margin-left: 10px;"
+    _GAHO_MESSAGE_QSS = "color: red; font-weight: bold; margin-left: 10px;"
+
+    # 치트 메뉴의 토글 항목: (액션 속성 이름, 메뉴 텍스트, 슬롯 메서드 이름, OpenGL 위젯의 치트 이름)
+    _TOGGLE_CHEATS = (
+        ("action_cheat_minimap", "Show Minimap [3]", "_cheat_toggle_minimap", 'minimap'),
+        ("action_cheat_ghost", "Ghost Mode (No Clip) [4]", "_cheat_toggle_ghost", 'noclip'),   # 벽 뚫기
+        ("action_cheat_xray", "X-Ray Vision [5]", "_cheat_toggle_xray", 'xray'),               # 벽 투명화
+        ("action_cheat_eagle", "Eagle Eye View [6]", "_cheat_toggle_eagle", 'eagle'),          # 시야 상승
+    )
+
+    _custom_maze_ready = pyqtSignal(int, str, str) # 커스텀 미로 생성 완료 (세션 ID, 경로, 오류 메시지)
+
     def __init__(self, sound_manager=None):
         super().__init__()
         self.sound_manager = sound_manager
@@ -29,7 +208,15 @@ class MiroWindow(QMainWindow):
         self.items_list = []       # Main list
         self.items_spawn_enabled = True # 마스터 스위치
         self.spawn_count = 3       # 아이템 스폰 개수
+        # 미로/아이템 파일 경로 (창을 만들 때 한 번만 계산)
+        self._datasets_dir = get_user_data_path('datasets')
+        self._stage_maze_files = {mode: os.path.join(self._datasets_dir, settings[3])
+                                  for mode, settings in _STAGE_SETTINGS.items()}
+        self._custom_maze_file = os.path.join(self._datasets_dir, 'custom_maze.dat')
+        self._maze_cache_dir = get_user_data_path(os.path.join('datasets', 'cache'))
         self._init_sample_items()
+        self._item_actions = {}    # 아이템 경로 → 메뉴 액션 (체크박스[, 삭제 버튼])
+        self._items_end_separator = None # 아이템 메뉴가 구성되기 전이면 None
         
         # 스킬 활성화 상태 (BGM Ducking 용)
         self.active_skill_count = 0
@@ -40,7 +227,21 @@ class MiroWindow(QMainWindow):
         self.game_timer.timeout.connect(self._update_timer)
         self.time_limit = 0
         self.current_time = 0
+        # 경과 시간 = _timer_elapsed(멈추기 전까지 누적) + 현재 구간(_timer_anchor부터)
+        self._timer_elapsed = 0.0
+        self._timer_anchor = None # 시계가 멈춰 있으면 None
+        self._timer_adjust = 0    # 치트(Time Boost)로 더하거나 뺀 초
+        self._timer_band = None   # 현재 적용된 _TIMER_BAND_QSS 키
         self.is_custom_mode = False
+        self._gl_widget = None # 게임 화면의 OpenGL 위젯 (처음 게임을 시작할 때 생성)
+        # 커스텀 미로 생성 전용 스레드 풀 (UI 스레드를 막지 않도록)
+        self._maze_pool = QThreadPool(self)
+        self._maze_pool.setMaxThreadCount(1)
+        # 다음 미로 미리 생성 전용 풀 (실제 생성이 그 뒤에서 기다리지 않도록 분리)
+        self._prebuild_pool = QThreadPool(self)
+        self._prebuild_pool.setMaxThreadCount(1)
+        self._pending_prebuild = None # (세션 ID, 캐시 경로, 설정값) - 실제 생성이 끝나면 미리 생성 시작
+        self._custom_maze_ready.connect(self._on_custom_maze_ready)
         self._setup_ui()
 
     def _setup_ui(self):
@@ -63,9 +264,8 @@ class MiroWindow(QMainWindow):
         self._setup_title_page()
         self.stack.addWidget(self.page_title)
         
-        # 2. 게임 화면 (Page 1)
+        # 2. 게임 화면 (Page 1) - 빈 페이지만 두고 내용(OpenGL 위젯)은 처음 필요할 때 구성
         self.page_game = QWidget()
-        self._setup_game_page()
         self.stack.addWidget(self.page_game)
         
         # 3. 스토리 모드 화면 (Page 2)
@@ -75,31 +275,63 @@ class MiroWindow(QMainWindow):
         
         # 초기 화면 설정
         self.stack.setCurrentIndex(0)
-        
-        # 아이템 리스트 초기화 (재설정)
-        self.items_list = []
-        self._init_sample_items()
+
+        # 타이틀 화면이 먼저 뜨도록, 게임 화면은 이벤트 루프가 돌기 시작한 뒤 첫 틈에 구성
+        # (그 전에 게임을 시작하면 gl_widget 접근 시 바로 구성됨)
+        QTimer.singleShot(0, self._prepare_game_page)
+        # 타이틀에서 기다리는 동안 스테이지/아이템 파일을 미리 읽어 OS 캐시에 올려 둠
+        QTimer.singleShot(200, self._prefetch_assets)
+
+    @property
+    def gl_widget(self):
+        """게임 OpenGL 위젯 (처음 접근할 때 게임 화면과 함께 생성)"""
+        self._prepare_game_page()
+        return self._gl_widget
+
+    def _prepare_game_page(self):
+        """게임 화면을 미리 구성 (이미 구성되었으면 아무것도 안 함)"""
+        if self._gl_widget is None:
+            self._setup_game_page()
+
+    def _prefetch_assets(self):
+        """
+        스테이지 미로와 샘플 아이템 파일을 한 번 읽어 둡니다. (내용은 버림)
+        첫 게임 시작 때 load_maze가 디스크를 기다리지 않고 OS 페이지 캐시에서 바로 읽게 됩니다.
+        """
+        paths = list(self._stage_maze_files.values())
+        paths += [item['path'] for item in self.items_list if item['is_sample']]
+        for path in paths:
+            try:
+                with open(path, 'rb') as f:
+                    while f.read(1 << 20):
+                        pass
+            except OSError:
+                pass # 없는 파일은 게임 시작 시 기존대로 안내
 
     def _init_sample_items(self):
         """샘플 아이템 리스트 초기화"""
-        base_path = get_user_data_path('datasets')
-        # item_*.dat 파일 찾기
-        sample_files = sorted(glob.glob(os.path.join(base_path, "item_*.dat")))
-        
-        for f in sample_files:
-            name = os.path.basename(f)
-            self.items_list.append({
+        base_path = self._datasets_dir
+        # 폴더가 바뀌지 않았으면 이전 스캔 결과 재사용 (항목 dict는 창마다 복사)
+        cache_key = (base_path, os.stat(base_path).st_mtime_ns)
+        samples = _ITEMS_CACHE.get(cache_key)
+        if samples is None:
+            # item_*.dat 파일 찾기
+            with os.scandir(base_path) as entries:
+                names = sorted(e.name for e in entries if e.name.startswith('item_') and e.name.endswith('.dat'))
+            samples = [{
                 'name': name,
-                'path': f,
+                'path': os.path.join(base_path, name),
                 'is_sample': True,
                 'checked': True # 기본값 활성화
-            })
+            } for name in names]
+            _ITEMS_CACHE.clear()
+            _ITEMS_CACHE[cache_key] = samples
+
+        self.items_list.extend(dict(item) for item in samples)
 
 
     def _create_toolbar(self):
         """툴바 설정 (뷰 모드 드롭다운, 미니맵 토글)"""
-        from PyQt5.QtWidgets import QToolBar, QAction, QToolButton, QMenu
-        
         toolbar = QToolBar("Maze Toolbar")
         # toolbar.setMovable(True) # 기본값이 True
         self.addToolBar(toolbar)
@@ -112,8 +344,6 @@ class MiroWindow(QMainWindow):
 
         
         # 2. 치트 메뉴 (드롭다운)
-        from PyQt5.QtWidgets import QToolButton, QMenu
-
         self.btn_cheats = QToolButton()
         self.btn_cheats.setText("Cheats ▾")
         self.btn_cheats.setPopupMode(QToolButton.InstantPopup)
@@ -131,33 +361,16 @@ class MiroWindow(QMainWindow):
         self.action_cheat_time.triggered.connect(self._cheat_time_boost)
         self.menu_cheats.addAction(self.action_cheat_time)
 
-        # 2.3 미니맵 (Toggle)
-        self.action_cheat_minimap = QAction("Show Minimap [3]", self)
-        self.action_cheat_minimap.setCheckable(True)
-        self.action_cheat_minimap.setChecked(False)
-        self.action_cheat_minimap.toggled.connect(self._cheat_toggle_minimap)
-        self.menu_cheats.addAction(self.action_cheat_minimap)
-
-        # 2.4 고스트 모드 (Toggle) - 벽 뚫기
-        self.action_cheat_ghost = QAction("Ghost Mode (No Clip) [4]", self)
-        self.action_cheat_ghost.setCheckable(True)
-        self.action_cheat_ghost.setChecked(False)
-        self.action_cheat_ghost.toggled.connect(self._cheat_toggle_ghost)
-        self.menu_cheats.addAction(self.action_cheat_ghost)
-
-        # 2.5 투시 (Toggle) - 벽 투명화
-        self.action_cheat_xray = QAction("X-Ray Vision [5]", self)
-        self.action_cheat_xray.setCheckable(True)
-        self.action_cheat_xray.setChecked(False)
-        self.action_cheat_xray.toggled.connect(self._cheat_toggle_xray)
-        self.menu_cheats.addAction(self.action_cheat_xray)
-
-        # 2.6 이글 아이 (Toggle) - 시야 상승
-        self.action_cheat_eagle = QAction("Eagle Eye View [6]", self)
-        self.action_cheat_eagle.setCheckable(True)
-        self.action_cheat_eagle.setChecked(False)
-        self.action_cheat_eagle.toggled.connect(self._cheat_toggle_eagle)
-        self.menu_cheats.addAction(self.action_cheat_eagle)
+        # 2.3 ~ 2.6 토글 치트 (_TOGGLE_CHEATS 표에서 생성)
+        self._cheat_actions = {} # OpenGL 위젯의 치트 이름 → 메뉴 액션 (상태 동기화용)
+        for attr, text, slot, cheat_name in self._TOGGLE_CHEATS:
+            action = QAction(text, self)
+            action.setCheckable(True)
+            action.setChecked(False)
+            action.toggled.connect(getattr(self, slot))
+            self.menu_cheats.addAction(action)
+            setattr(self, attr, action)
+            self._cheat_actions[cheat_name] = action
 
         self.menu_cheats.addSeparator()
         self.menu_cheats.addSection("Simulation (Trigger)")
@@ -174,8 +387,8 @@ class MiroWindow(QMainWindow):
         
         for name, effect in sim_effects:
             action = QAction(name, self)
-            # lambda의 closure 문제 방지를 위해 default argument 사용
-            action.triggered.connect(lambda checked, eff=effect: self._activate_specific_skill(eff))
+            action.setData(effect) # 효과 이름은 액션에 저장하고 슬롯 하나에서 꺼내 씀
+            action.triggered.connect(self._on_sim_effect_triggered)
             self.menu_cheats.addAction(action)
 
         self.btn_cheats.setMenu(self.menu_cheats)
@@ -196,8 +409,6 @@ class MiroWindow(QMainWindow):
 
     def _setup_title_page(self):
         """타이틀 화면 UI 구성"""
-        from PyQt5.QtWidgets import QFrame, QDoubleSpinBox
-        
         layout = QVBoxLayout(self.page_title)
         layout.setAlignment(Qt.AlignCenter)
         layout.setSpacing(30)
@@ -205,7 +416,7 @@ class MiroWindow(QMainWindow):
         # 사이드바 안내 라벨 (좌측 상단)
         hint_layout = QHBoxLayout()
         self.lbl_hint = QLabel("← Click here to use 3D Modeler")
-        self.lbl_hint.setStyleSheet("color: gray; font-style: italic; font-size: 12px;")
+        self.lbl_hint.setStyleSheet(self._HINT_QSS)
         hint_layout.addWidget(self.lbl_hint)
         hint_layout.addStretch()
         layout.addLayout(hint_layout)
@@ -215,15 +426,11 @@ class MiroWindow(QMainWindow):
         self.lbl_title_image.setAlignment(Qt.AlignCenter)
         
         # 이미지 로드 (assets/maze_title.png)
-        image_path = get_resource_path(os.path.join('assets', 'maze_title.png'))
-        if os.path.exists(image_path):
-            pixmap = QPixmap(image_path)
-            # 이미지 크기 조정 (가로 800px, 비율 유지)
-            scaled_pixmap = pixmap.scaled(800, 300, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-            self.lbl_title_image.setPixmap(scaled_pixmap)
+        if _TITLE_IMAGE_EXISTS:
+            self.lbl_title_image.setPixmap(_load_title_pixmap(_TITLE_IMAGE_PATH, *TITLE_IMAGE_SIZE))
         else:
             self.lbl_title_image.setText("Maze Game Title Image Not Found")
-            self.lbl_title_image.setStyleSheet("font-size: 30px; color: white; font-weight: bold;")
+            self.lbl_title_image.setStyleSheet(self._TITLE_MISSING_QSS)
             
         layout.addWidget(self.lbl_title_image)
         
@@ -242,10 +449,7 @@ class MiroWindow(QMainWindow):
         story_layout.setContentsMargins(20, 20, 20, 20)
         
         # 스토리 읽기
-        self.btn_read_story = QPushButton("Read Story")
-        self.btn_read_story.setMinimumHeight(40)
-        self.btn_read_story.clicked.connect(lambda: self._start_game("Story Read"))
-        story_layout.addWidget(self.btn_read_story)
+        self.btn_read_story = self._add_mode_button(story_layout, "Read Story", "Story Read")
         
         # 구분선
         line_story = QFrame()
@@ -253,21 +457,10 @@ class MiroWindow(QMainWindow):
         line_story.setFrameShadow(QFrame.Sunken)
         story_layout.addWidget(line_story)
         
-        # 스테이지 버튼들
-        self.btn_stage1 = QPushButton("Stage 1")
-        self.btn_stage1.setMinimumHeight(40)
-        self.btn_stage1.clicked.connect(lambda: self._start_game("Stage 1"))
-        story_layout.addWidget(self.btn_stage1)
-        
-        self.btn_stage2 = QPushButton("Stage 2")
-        self.btn_stage2.setMinimumHeight(40)
-        self.btn_stage2.clicked.connect(lambda: self._start_game("Stage 2"))
-        story_layout.addWidget(self.btn_stage2)
-        
-        self.btn_stage3 = QPushButton("Stage 3")
-        self.btn_stage3.setMinimumHeight(40)
-        self.btn_stage3.clicked.connect(lambda: self._start_game("Stage 3"))
-        story_layout.addWidget(self.btn_stage3)
+        # 스테이지 버튼들 (self.btn_stage1 ~ self.btn_stage3)
+        for i in range(1, STAGE_COUNT + 1):
+            stage = f"Stage {i}"
+            setattr(self, f"btn_stage{i}", self._add_mode_button(story_layout, stage, stage))
         
         story_layout.addStretch()
         content_layout.addWidget(group_story)
@@ -284,7 +477,7 @@ class MiroWindow(QMainWindow):
         # 1. 시작 버튼 (최상단 이동)
         self.btn_start_custom = QPushButton("Start Game")
         self.btn_start_custom.setMinimumHeight(40) 
-        self.btn_start_custom.clicked.connect(lambda: self._start_game("Custom"))
+        self.btn_start_custom.clicked.connect(functools.partial(self._start_game, "Custom"))
         custom_layout.addWidget(self.btn_start_custom)
         
         # 구분선
@@ -349,12 +542,8 @@ class MiroWindow(QMainWindow):
         custom_layout.addWidget(group_maze_details)
         
         custom_layout.addStretch()
-        content_layout.addWidget(group_custom)
-        
-        layout.addLayout(content_layout)
-        layout.addStretch()
-        
-        # 환경 설정 (가로 배치: 날씨 | 테마 | 안개)
+
+        # 환경 설정 (가로 배치: 날씨 | 테마 | 안개) - 패널 하단, 패널을 레이아웃에 넣기 전에 완성
         env_layout = QHBoxLayout()
         
         # 1. 날씨
@@ -381,6 +570,11 @@ class MiroWindow(QMainWindow):
         env_layout.addStretch() # 우측 여백
         custom_layout.addLayout(env_layout)
 
+        content_layout.addWidget(group_custom)
+        
+        layout.addLayout(content_layout)
+        layout.addStretch()
+
         # 초기 상태 업데이트
         self._on_thickness_changed(self.spin_thickness.value())
         self._on_fog_changed(self.check_fog.isChecked())
@@ -390,24 +584,33 @@ class MiroWindow(QMainWindow):
         # 크레딧 (하단)
         lbl_credits = QLabel("컴퓨터그래픽스 02분반 ∙ 06조 ∙ 김도균(20225525), 오성진(20225534), 권민준(20231389)")
         lbl_credits.setAlignment(Qt.AlignCenter)
-        lbl_credits.setStyleSheet("font-weight: bold; color: #666; font-size: 14px; margin-bottom: 20px;")
+        lbl_credits.setStyleSheet(self._CREDITS_QSS)
         layout.addWidget(lbl_credits)
 
+    def _add_mode_button(self, layout, label, mode):
+        """게임 모드 시작 버튼 생성 (클릭 시 _start_game(mode))"""
+        button = QPushButton(label)
+        button.setMinimumHeight(40)
+        button.clicked.connect(functools.partial(self._start_game, mode))
+        layout.addWidget(button)
+        return button
+
     def _on_weather_changed(self, text):
         """날씨 변경 핸들러"""
-        if hasattr(self, 'gl_widget'):
+        if self._gl_widget is not None:
             self.gl_widget.set_weather(text)
 
     def _on_fog_changed(self, state):
         """안개 설정 변경"""
         # state는 int(0/2) 또는 bool일 수 있음
         is_checked = (state == Qt.Checked) if isinstance(state, int) else state
-        if hasattr(self, 'gl_widget'):
+        if self._gl_widget is not None:
             self.gl_widget.set_fog(is_checked)
 
     def _on_theme_changed(self, theme_text):
         """테마 변경 핸들러"""
-        self.gl_widget.set_theme(theme_text)
+        if self._gl_widget is not None:
+            self._gl_widget.set_theme(theme_text)
 
     def _on_thickness_changed(self, value):
         """벽 두께 변경 시 높낮이 옵션 활성화 여부 제어"""
@@ -422,7 +625,6 @@ class MiroWindow(QMainWindow):
 
     def _setup_game_page(self):
         """게임 화면 UI 구성"""
-        from PyQt5.QtGui import QFont
         layout = QVBoxLayout(self.page_game)
 
         # 상단 정보 바
@@ -439,11 +641,11 @@ class MiroWindow(QMainWindow):
         font_gaho.setBold(True)
         font_gaho.setPointSize(12)
         self.lbl_gaho.setFont(font_gaho)
-        self.lbl_gaho.setStyleSheet("margin-left: 10px;")
+        self.lbl_gaho.setStyleSheet(self._GAHO_QSS)
         
         # GAHO 메시지 라벨 (효과 발동 시 표시)
         self.lbl_gaho_message = QLabel("")
-        self.lbl_gaho_message.setStyleSheet("color: red; font-weight: bold; margin-left: 10px;")
+        self.lbl_gaho_message.setStyleSheet(self._GAHO_MESSAGE_QSS)
 
         # 타이머 라벨 (우측 상단)
         self.lbl_timer = QLabel("00:00")
@@ -467,21 +669,27 @@ class MiroWindow(QMainWindow):
         layout.addWidget(self.progress_bar)
 
         # OpenGL 위젯
-        self.gl_widget = MiroOpenGLWidget()
-        self.gl_widget.game_won.connect(self._on_game_won)
-        self.gl_widget.gameStarted.connect(lambda: self._update_ui_state(True)) # 게임 시작 시 UI 갱신 연결
-        self.gl_widget.gamePaused.connect(self._on_game_paused)
-        self.gl_widget.gameResumed.connect(self._on_game_resumed)
+        gl_widget = MiroOpenGLWidget()
+        self._gl_widget = gl_widget
+        gl_widget.game_won.connect(self._on_game_won)
+        gl_widget.gameStarted.connect(lambda: self._update_ui_state(True)) # 게임 시작 시 UI 갱신 연결
+        gl_widget.gamePaused.connect(self._on_game_paused)
+        gl_widget.gameResumed.connect(self._on_game_resumed)
         # 치트 시그널 연결
-        self.gl_widget.cheatPauseTimer.connect(self._on_cheat_pause_timer)
-        self.gl_widget.cheatTimeBoost.connect(self._cheat_time_boost)
-        self.gl_widget.cheatStateChanged.connect(self._on_cheat_state_changed)
-        self.gl_widget.gameFinished.connect(self._on_game_won)
-        self.gl_widget.itemCollected.connect(self._on_item_collected)
-        self.gl_widget.skillActivated.connect(self._on_skill_activated)
-        self.gl_widget.trapFall.connect(self._on_trap_fall) # 함정 추락 연결
+        gl_widget.cheatPauseTimer.connect(self._on_cheat_pause_timer)
+        gl_widget.cheatTimeBoost.connect(self._cheat_time_boost)
+        gl_widget.cheatStateChanged.connect(self._on_cheat_state_changed)
+        gl_widget.gameFinished.connect(self._on_game_won)
+        gl_widget.itemCollected.connect(self._on_item_collected)
+        gl_widget.skillActivated.connect(self._on_skill_activated)
+        gl_widget.trapFall.connect(self._on_trap_fall) # 함정 추락 연결
         
-        layout.addWidget(self.gl_widget, 1) # Stretch Factor 1 추가
+        layout.addWidget(gl_widget, 1) # Stretch Factor 1 추가
+
+        # 위젯이 없는 동안 타이틀 화면에서 바꾼 환경 설정 반영
+        gl_widget.set_theme(self.combo_theme.currentText())
+        gl_widget.set_fog(self.check_fog.isChecked())
+        gl_widget.set_weather(self.combo_weather.currentText())
 
     def _toggle_custom_setup(self):
         """커스텀 설정 패널 표시/숨김 토글 (현재 사용 안 함)"""
@@ -497,6 +705,8 @@ class MiroWindow(QMainWindow):
             # 스토리 모드 시작
             self.story_widget.reset_story()
             self.stack.setCurrentWidget(self.story_widget)
+            if self.sound_manager:
+                self.sound_manager.preload_stage("Stage 1") # 스토리를 읽는 동안 첫 스테이지 BGM 준비
             return
 
         if self.sound_manager:
@@ -517,63 +727,75 @@ class MiroWindow(QMainWindow):
 
         # Stage별 미로 파일 경로 설정
         maze_file = None
-        if mode == "Stage 1":
-            self.combo_theme.setCurrentText("810-Gwan")         # Theme: 810관
-            self.gl_widget.set_fog(False)                       # Fog: OFF
-            self.gl_widget.set_weather("Clear")                 # Weather: Clear
-            maze_file = os.path.join(get_user_data_path('datasets'), 'maze_01.dat')
-            self._start_timer(mode, 60)
-
-        elif mode == "Stage 2":
-            self.combo_theme.setCurrentText("Inside Campus")    # Theme: 교정 내부
-            self.gl_widget.set_fog(True)                        # Fog: ON (분위기 조성)
-            self.gl_widget.set_weather("Rain")                  # Weather: Rain
-            maze_file = os.path.join(get_user_data_path('datasets'), 'maze_02.dat')
-            self._start_timer(mode, 90)
-
-        elif mode == "Stage 3":
-            self.combo_theme.setCurrentText("Path to the Main Gate") # Theme: 정문
-            self.gl_widget.set_fog(False)                            # Fog: OFF
-            self.gl_widget.set_weather("Snow")                       # Weather: Snow
-            maze_file = os.path.join(get_user_data_path('datasets'), 'maze_03.dat')
-            self._start_timer(mode, 120)
+        if mode in _STAGE_SETTINGS:
+            theme, fog, weather, _, limit_seconds = _STAGE_SETTINGS[mode]
+            self.combo_theme.setCurrentText(theme)
+            self.gl_widget.set_fog(fog)
+            self.gl_widget.set_weather(weather)
+            maze_file = self._stage_maze_files[mode]
+            self._start_timer(mode, limit_seconds)
         elif mode == "Custom":
             # 커스텀 모드 설정값 적용
             self.gl_widget.set_fog(self.check_fog.isChecked())
             self.gl_widget.set_weather(self.combo_weather.currentText())
 
-            # 커스텀 모드: 동적으로 미로 생성
-            try:
-                import maze_generator
-
-                width = self.spin_width.value()
-                height = self.spin_height.value()
-                wall_thickness = self.spin_thickness.value()
-                wall_height = self.spin_wall_height.value()
-
-                # 높이 변화 설정 (두께가 1.0일 때만 유효)
-                enable_height_var = (self.check_height_variation.isChecked() and
-                                     abs(wall_thickness - 1.0) < 0.001)
-
-                # 미로 생성
-                print(f"Generating Custom Maze ({width}x{height}), Height Variation: {enable_height_var}...")
-                maze = maze_generator.Maze(width, height, enable_height_variation=enable_height_var)
-                maze.generate()
-                
-                # 저장 경로 설정 (사용자 데이터 경로 사용 - macOS 번들 호환)
-                datasets_dir = get_user_data_path('datasets')
-                custom_maze_file = os.path.join(datasets_dir, 'custom_maze.dat')
-                
-                # .dat 파일로 내보내기
-                maze.export_to_dat(custom_maze_file, wall_thickness=wall_thickness, wall_height=wall_height)
-                
-                maze_file = custom_maze_file
+            # 커스텀 모드: 동적으로 미로 생성 (백그라운드, 완료되면 _on_custom_maze_ready에서 시작)
+            width = self.spin_width.value()
+            height = self.spin_height.value()
+            wall_thickness = self.spin_thickness.value()
+
+            # 높이 변화 설정 (두께가 1.0일 때만 유효)
+            enable_height_var = (self.check_height_variation.isChecked() and
+                                 abs(wall_thickness - 1.0) < 0.001)
+
+            params = (width, height, wall_thickness, self.spin_wall_height.value(), enable_height_var)
+
+            # 저장 경로 설정 (사용자 데이터 경로 사용 - macOS 번들 호환)
+            custom_maze_file = self._custom_maze_file
+            cache_path = _custom_maze_cache_path(self._maze_cache_dir, *params)
+
+            if _take_cached_maze(cache_path, custom_maze_file):
+                # 같은 설정으로 미리 만들어 둔 미로가 있으면 바로 시작
+                self._prebuild_custom_maze(cache_path, params)
                 self._start_timer(mode) # 커스텀 모드 타이머(스톱워치) 시작
-                
-            except Exception as e:
-                QMessageBox.critical(self, "Generation Error", f"Failed to generate maze: {e}")
+                self._launch_maze(mode, custom_maze_file)
                 return
 
+            # 아직 시작하지 않은 미리 생성 작업은 버림 (이번 생성과 CPU를 나눠 쓰지 않도록)
+            self._prebuild_pool.clear()
+            QApplication.setOverrideCursor(Qt.WaitCursor) # 생성 중 표시 (작업마다 하나씩 쌓고 완료 시 해제)
+            self._maze_pool.start(_CustomMazeBuilder(
+                self.game_session_id, custom_maze_file, *params, self._custom_maze_ready))
+            self._pending_prebuild = (self.game_session_id, cache_path, params)
+            return
+
+        self._launch_maze(mode, maze_file)
+
+    def _prebuild_custom_maze(self, cache_path, params):
+        """같은 설정으로 다시 시작할 때 쓸 다음 미로를 백그라운드에서 미리 생성"""
+        self._prebuild_pool.start(_CustomMazeBuilder(-1, cache_path, *params, None))
+
+    def _on_custom_maze_ready(self, session_id, maze_file, error):
+        """커스텀 미로 생성 완료 (GUI 스레드)"""
+        QApplication.restoreOverrideCursor()
+        if session_id != self.game_session_id:
+            return # 그 사이 다른 게임을 시작했으면 최신 요청 결과만 사용
+
+        if error:
+            QMessageBox.critical(self, "Generation Error", f"Failed to generate maze: {error}")
+            return
+        if self._pending_prebuild is not None and self._pending_prebuild[0] == session_id:
+            # 실제 미로가 준비된 뒤에야 같은 설정의 다음 미로를 미리 생성
+            _, cache_path, params = self._pending_prebuild
+            self._pending_prebuild = None
+            self._prebuild_custom_maze(cache_path, params)
+        if self.stack.currentIndex() != 0:
+            return # 생성 중 타이틀을 벗어났으면 시작하지 않음
+        self._start_timer("Custom") # 커스텀 모드 타이머(스톱워치) 시작
+        self._launch_maze("Custom", maze_file)
+
+    def _launch_maze(self, mode, maze_file):
+        """미로 파일을 불러와 게임 화면으로 전환"""
         # 미로 파일 로드 및 게임 시작
         if maze_file and os.path.exists(maze_file):
             self.gl_widget.load_maze(maze_file)
@@ -586,7 +808,8 @@ class MiroWindow(QMainWindow):
                  self.lbl_game_info.setText(f"Mode: Custom ({self.spin_width.value()}x{self.spin_height.value()}) | WASD: Move | Mouse: Look | Left Shift: use GAHO | ESC: Pause")
 
             # 화면 전환
-            self.stack.setCurrentIndex(1)
+            if self.stack.currentIndex() != 1:
+                self.stack.setCurrentIndex(1)
 
             # 게임 시작
             self.gl_widget.start_game()
@@ -596,40 +819,67 @@ class MiroWindow(QMainWindow):
     def _start_timer(self, mode, limit_seconds=0):
         """타이머 시작"""
         self.game_mode = mode
-        self.lbl_timer.setStyleSheet("") # 스타일 초기화
+        self._set_timer_band('normal') # 스타일 초기화
         
         if mode == "Custom":
             self.is_custom_mode = True
             self.current_time = 0
             self.time_limit = 0
-            self.progress_bar.setRange(0, 0) # Indeterminate mode (busy)
+            # 스톱워치에는 진행률이 없으므로 바를 숨김
+            # (busy 애니메이션은 매 프레임 바를 다시 그려, OpenGL 화면과 창 합성 비용이 계속 발생)
+            self.progress_bar.hide()
         else:
             self.is_custom_mode = False
             self.time_limit = limit_seconds
             self.current_time = limit_seconds
             self.progress_bar.setRange(0, limit_seconds)
             self.progress_bar.setValue(limit_seconds)
+            self.progress_bar.show()
         
-        self.game_timer.start(1000) # 1초마다 업데이트
+        self.game_timer.stop()
+        self._timer_elapsed = 0.0
+        self._timer_anchor = None
+        self._timer_adjust = 0
+        self._start_clock()
         self._update_timer_display()
 
-    def _update_timer(self):
-        """타이머 업데이트 (1초마다 호출)"""
+    def _start_clock(self):
+        """게임 시계 (재)시작"""
+        if self._timer_anchor is None:
+            self._timer_anchor = time.monotonic()
+        self.game_timer.start(TIMER_TICK_MS)
+
+    def _stop_clock(self):
+        """게임 시계 정지 (지금까지 흐른 시간은 누적해 둠)"""
+        self.game_timer.stop()
+        if self._timer_anchor is not None:
+            self._timer_elapsed += time.monotonic() - self._timer_anchor
+            self._timer_anchor = None
+
+    def _clock_value(self):
+        """현재 표시할 초 (스토리: 남은 시간, 커스텀: 경과 시간)"""
+        elapsed = self._timer_elapsed
+        if self._timer_anchor is not None:
+            elapsed += time.monotonic() - self._timer_anchor
         if self.is_custom_mode:
-            # 카운트 업 (스톱워치)
-            self.current_time += 1
-        else:
+            return int(elapsed) + self._timer_adjust
+        return max(0, self.time_limit - int(elapsed) + self._timer_adjust)
+
+    def _update_timer(self):
+        """타이머 업데이트 (TIMER_TICK_MS마다 호출, 초가 바뀌었을 때만 화면 갱신)"""
+        if self.stack.currentIndex() != 1:
+            self._stop_clock() # 게임 화면이 아니면 시계를 멈추고 더 이상 깨어나지 않음
+            return
+        value = self._clock_value()
+        if value == self.current_time:
+            return
+        self.current_time = value
+
+        if not self.is_custom_mode:
             # 카운트 다운 (타이머)
-            self.current_time -= 1
             self.progress_bar.setValue(self.current_time)
             
-            # 색상 변경 (긴박감 조성) - 텍스트 색상만 변경하여 OS 기본 UI 유지
-            if self.current_time <= 10:
-                self.lbl_timer.setStyleSheet("color: red; font-weight: bold;")
-            elif self.current_time <= 30:
-                self.lbl_timer.setStyleSheet("color: #FF5722; font-weight: bold;") # Deep Orange
-            else:
-                self.lbl_timer.setStyleSheet("")
+            self._update_timer_band() # 색상 변경 (긴박감 조성)
             
             if self.current_time <= 0:
                 self._on_game_over()
@@ -637,10 +887,28 @@ class MiroWindow(QMainWindow):
 
         self._update_timer_display()
 
+    def _update_timer_band(self):
+        """남은 시간에 맞는 색상 구간 적용"""
+        if self.current_time <= 10:
+            self._set_timer_band('red')
+        elif self.current_time <= 30:
+            self._set_timer_band('orange')
+        else:
+            self._set_timer_band('normal')
+
+    def _set_timer_band(self, band):
+        """구간이 바뀐 경우에만 스타일시트 적용 (매번 QSS를 다시 파싱하지 않도록)"""
+        if band != self._timer_band:
+            self._timer_band = band
+            self.lbl_timer.setStyleSheet(_TIMER_BAND_QSS[band])
+
     def _update_timer_display(self):
         """타이머 라벨 업데이트"""
-        mins, secs = divmod(self.current_time, 60)
-        self.lbl_timer.setText(f"{mins:02d}:{secs:02d}")
+        if 0 <= self.current_time < len(_MMSS):
+            self.lbl_timer.setText(_MMSS[self.current_time])
+        else:
+            mins, secs = divmod(self.current_time, 60)
+            self.lbl_timer.setText(f"{mins:02d}:{secs:02d}")
 
     def _reset_skill_state(self):
         """게임 종료/타이틀 복귀 시 스킬/사운드 상태 초기화"""
@@ -654,7 +922,7 @@ class MiroWindow(QMainWindow):
         self.is_cheat_paused = False
 
         # 3. GLCheats 초기화 (타이머 콜백이 뒤늦게 실행되도 영향 없도록)
-        if hasattr(self, 'gl_widget'):
+        if self._gl_widget is not None:
             self.gl_widget.cheat_minimap = False
             self.gl_widget.cheat_noclip = False
             self.gl_widget.cheat_xray = False
@@ -667,7 +935,7 @@ class MiroWindow(QMainWindow):
 
     def _on_game_over(self):
         """게임 오버 (시간 초과) 처리"""
-        self.game_timer.stop()
+        self._stop_clock()
         self.gl_widget.stop_game()
         
         # 스킬 상태 초기화
@@ -682,7 +950,7 @@ class MiroWindow(QMainWindow):
  
     def _on_game_won(self):
         """게임 클리어 처리"""
-        self.game_timer.stop()
+        self._stop_clock()
 
         # 스킬 상태 초기화
         self._reset_skill_state()
@@ -696,31 +964,33 @@ class MiroWindow(QMainWindow):
 
     def _on_game_paused(self):
         """게임 일시정지 시 UI 타이머도 정지"""
-        self.game_timer.stop()
+        self._stop_clock()
 
     def _on_game_resumed(self):
         """게임 재개 시 UI 타이머도 재시작 (단, 치트 퍼즈 중이면 시작 안 함)"""
         if not self.is_cheat_paused:
-            self.game_timer.start(1000)
+            self._start_clock()
 
     def _return_to_title(self):
         """타이틀 화면으로 복귀"""
         # 게임 중이라면 중지
-        if self.gl_widget.game_active:
-            self.gl_widget.stop_game()
+        if self._gl_widget is not None and self._gl_widget.game_active:
+            self._gl_widget.stop_game()
             
         # 스킬/사운드 상태 초기화
         self._reset_skill_state()
+        self.game_session_id += 1 # 아직 남아 있는 타이머 콜백(치트 퍼즈 재개, 스킬 종료)은 무시되도록
             
         # 게임 타이머 중지
-        self.game_timer.stop()
+        self._stop_clock()
         
         # 타이틀 BGM으로 복귀 (재생 중지 후 처음부터 재생)
         if self.sound_manager:
             self.sound_manager.play_title_bgm() 
             
-        self.stack.setCurrentIndex(0)
-        self.stack.setCurrentIndex(0)
+        # 이미 타이틀이면 페이지 전환(숨김/표시 이벤트)을 건너뜀
+        if self.stack.currentIndex() != 0:
+            self.stack.setCurrentIndex(0)
         self._update_ui_state(False) # 아이템 메뉴 활성화
 
     # --- Cheats Logic ---
@@ -730,52 +1000,54 @@ class MiroWindow(QMainWindow):
         if not self.gl_widget.game_active:
             return
             
+        value = self._clock_value()
         if self.is_custom_mode:
             # 커스텀 모드: 시간 감소
-            self.current_time = max(0, self.current_time - 10)
+            self.current_time = max(0, value - 10)
         else:
             # 스토리 모드: 시간 추가
-            self.current_time = min(self.time_limit, self.current_time + 10)
+            self.current_time = min(self.time_limit, value + 10)
+            self.progress_bar.setValue(self.current_time)
+            self._update_timer_band()
+        self._timer_adjust += self.current_time - value
         self._update_timer_display()
 
     def _on_cheat_pause_timer(self, seconds):
         """치트: 타이머 일시정지 (숫자키 1)"""
         if not self.game_timer.isActive():
             return
-        self.game_timer.stop()
+        self._stop_clock()
         self.is_cheat_paused = True
-        # seconds초 후 자동 재개
-        QTimer.singleShot(seconds * 1000, self._resume_timer_after_pause)
+        # seconds초 후 자동 재개 (그 사이 게임이 바뀌었으면 무시)
+        sid = self.game_session_id
+        QTimer.singleShot(seconds * 1000, lambda: self._resume_timer_after_pause(sid))
 
-    def _resume_timer_after_pause(self):
+    def _resume_timer_after_pause(self, sid):
         """퍼즈 종료 후 타이머 재개"""
+        if sid != self.game_session_id:
+            return
         self.is_cheat_paused = False
         # 게임이 일시정지(ESC메뉴) 상태가 아니어야 타이머 재개
         if self.stack.currentIndex() == 1 and \
-           hasattr(self, 'gl_widget') and \
+           self._gl_widget is not None and \
            self.gl_widget.game_active and \
            not self.gl_widget.game_paused:
-            self.game_timer.start(1000)
+            self._start_clock()
 
     def _on_cheat_state_changed(self, cheat_name, enabled):
         """OpenGL 위젯에서 치트 상태 변경 시 UI 동기화"""
-        if cheat_name == 'minimap':
-            self.action_cheat_minimap.setChecked(enabled)
-        elif cheat_name == 'noclip':
-            self.action_cheat_ghost.setChecked(enabled)
-        elif cheat_name == 'xray':
-            self.action_cheat_xray.setChecked(enabled)
-        elif cheat_name == 'eagle':
-            self.action_cheat_eagle.setChecked(enabled)
+        action = self._cheat_actions.get(cheat_name)
+        if action is not None:
+            action.setChecked(enabled)
 
     def _cheat_toggle_minimap(self, enabled):
         """치트: 미니맵 토글 (UI 메뉴에서 호출)"""
-        if hasattr(self, 'gl_widget'):
+        if self._gl_widget is not None:
             self.gl_widget.cheat_minimap = enabled
 
     def _cheat_toggle_ghost(self, enabled):
         """치트: 고스트 모드 토글 (UI 메뉴에서 호출)"""
-        if hasattr(self, 'gl_widget'):
+        if self._gl_widget is not None:
             self.gl_widget.cheat_noclip = enabled
             # 노클립 해제 시 안전 위치로 이동
             if not enabled:
@@ -783,31 +1055,58 @@ class MiroWindow(QMainWindow):
 
     def _cheat_toggle_xray(self, enabled):
         """치트: 투시 모드 토글 (UI 메뉴에서 호출)"""
-        if hasattr(self, 'gl_widget'):
+        if self._gl_widget is not None:
             self.gl_widget.cheat_xray = enabled
 
     def _cheat_toggle_eagle(self, enabled):
         """치트: 이글 아이 모드 토글 (UI 메뉴에서 호출)"""
-        if hasattr(self, 'gl_widget'):
+        if self._gl_widget is not None:
             # 스마트 안개 로직이 포함된 메서드 호출
             self.gl_widget.set_eagle_eye_mode(enabled)
 
     # --- Items UI Logic ---
     def _refresh_items_menu(self):
-        """아이템 메뉴 동적 재구성"""
-        from PyQt5.QtWidgets import QAction
-        self.menu_items.clear()
-        
+        """아이템 메뉴를 현재 상태에 맞게 갱신 (처음에만 구성, 이후에는 바뀐 항목만 추가/제거)"""
+        if self._items_end_separator is None:
+            self._build_items_menu()
+        enabled = self.items_spawn_enabled
+
+        self.action_spawn_items.setChecked(enabled)
+        self.spin_spawn_count.setEnabled(enabled)
+        self.lbl_spawn_count.setEnabled(enabled)
+        self.action_add_item.setEnabled(enabled)
+
+        # 2. 아이템 리스트 - 리스트에서 빠진 항목의 액션 제거
+        paths = {item['path'] for item in self.items_list}
+        for path in [p for p in self._item_actions if p not in paths]:
+            for action in self._item_actions.pop(path):
+                self.menu_items.removeAction(action)
+                action.deleteLater()
+
+        has_custom = False
+        for item in self.items_list:
+            actions = self._item_actions.get(item['path'])
+            if actions is None:
+                actions = self._create_item_actions(item)
+            if not item['is_sample']:
+                has_custom = True
+            actions[0].setChecked(item['checked'])
+            # 마스터 스위치 여부에 따라 활성/비활성 제어
+            for action in actions:
+                action.setEnabled(enabled)
+
+        # 샘플 아이템과 커스텀 아이템 구분선 (커스텀 아이템이 있을 때만)
+        self._custom_items_separator.setVisible(has_custom)
+
+    def _build_items_menu(self):
+        """아이템 메뉴의 고정 항목 구성 (한 번만 호출)"""
         # 1. 마스터 스위치 (Spawn Items)
-        action_spawn = QAction("Spawn Items", self)
-        action_spawn.setCheckable(True)
-        action_spawn.setChecked(self.items_spawn_enabled)
-        action_spawn.triggered.connect(self._on_spawn_items_toggled)
-        self.menu_items.addAction(action_spawn)
+        self.action_spawn_items = QAction("Spawn Items", self)
+        self.action_spawn_items.setCheckable(True)
+        self.action_spawn_items.triggered.connect(self._on_spawn_items_toggled)
+        self.menu_items.addAction(self.action_spawn_items)
 
         # 1.5. 스폰 개수 조절 (QSpinBox)
-        from PyQt5.QtWidgets import QWidgetAction, QHBoxLayout, QLabel, QSpinBox, QWidget
-        
         # 메뉴에 위젯을 넣기 위한 컨테이너 액션
         count_action = QWidgetAction(self.menu_items)
         count_widget = QWidget()
@@ -824,9 +1123,6 @@ class MiroWindow(QMainWindow):
         # 값 변경 시 self.spawn_count 업데이트
         spin_count.valueChanged.connect(self._on_spawn_count_changed)
         
-        # 마스터 스위치와 연동하여 활성/비활성
-        spin_count.setEnabled(self.items_spawn_enabled)
-        lbl_count.setEnabled(self.items_spawn_enabled)
         self.spin_spawn_count = spin_count # 참조 저장 (활성화 제어용)
         self.lbl_spawn_count = lbl_count   # 참조 저장
 
@@ -836,51 +1132,44 @@ class MiroWindow(QMainWindow):
         self.menu_items.addAction(count_action)
         
         self.menu_items.addSeparator()
-        
-        # 2. 아이템 리스트
-        # 샘플 아이템과 커스텀 아이템 구분
-        has_added_separator = False
-        
-        for idx, item in enumerate(self.items_list):
-            # 커스텀 아이템 시작 시 구분선 추가 (한 번만)
-            if not item['is_sample'] and not has_added_separator:
-                self.menu_items.addSeparator()
-                has_added_separator = True
-            
-            # 체크박스 액션
-            action = QAction(item['name'], self)
-            action.setCheckable(True)
-            action.setChecked(item['checked'])
-            # 마스터 스위치 여부에 따라 활성/비활성 제어
-            action.setEnabled(self.items_spawn_enabled)
-            
-            # 클로저 문제 해결을 위해 기본값 인자 사용
-            action.toggled.connect(lambda checked, i=idx: self._on_item_checked(i, checked))
-            self.menu_items.addAction(action)
-            
-            # 커스텀 아이템인 경우 삭제 버튼 추가
-            if not item['is_sample']:
-                del_action = QAction(f"    ❌ Delete '{item['name']}'", self)
-                del_action.setEnabled(self.items_spawn_enabled)
-                del_action.triggered.connect(lambda _, i=idx: self._on_remove_item(i))
-                self.menu_items.addAction(del_action)
 
-        self.menu_items.addSeparator()
+        # 2. 아이템 리스트: 샘플 아이템은 이 구분선 앞, 커스텀 아이템은 끝 구분선 앞에 삽입됨
+        self._custom_items_separator = self.menu_items.addSeparator()
+        self._items_end_separator = self.menu_items.addSeparator()
 
         # 3. 파일 추가
-        action_add = QAction("➕ Add File...", self)
+        self.action_add_item = QAction("➕ Add File...", self)
         # Spawn이 꺼진 상태에서 추가하는게 의미가 없으므로 비활성화가 자연스러움.
-        action_add.setEnabled(self.items_spawn_enabled)
-        action_add.triggered.connect(self._on_add_item)
-        self.menu_items.addAction(action_add)
+        self.action_add_item.triggered.connect(self._on_add_item)
+        self.menu_items.addAction(self.action_add_item)
+
+    def _create_item_actions(self, item):
+        """아이템 하나의 메뉴 액션 생성 (체크박스, 커스텀 아이템은 삭제 버튼 포함)"""
+        path = item['path']
+        before = self._custom_items_separator if item['is_sample'] else self._items_end_separator
+
+        # 체크박스 액션
+        action = QAction(item['name'], self)
+        action.setCheckable(True)
+        action.setChecked(item['checked'])
+        # 인덱스는 삭제 시 바뀌므로 경로로 아이템을 찾음
+        action.toggled.connect(functools.partial(self._on_item_checked, path))
+        self.menu_items.insertAction(before, action)
+        actions = (action,)
+
+        # 커스텀 아이템인 경우 삭제 버튼 추가
+        if not item['is_sample']:
+            del_action = QAction(f"    ❌ Delete '{item['name']}'", self)
+            del_action.triggered.connect(functools.partial(self._on_remove_item, path))
+            self.menu_items.insertAction(before, del_action)
+            actions += (del_action,)
+
+        self._item_actions[path] = actions
+        return actions
 
     def _on_spawn_items_toggled(self, checked):
         """아이템 스폰 마스터 스위치 토글"""
         self.items_spawn_enabled = checked
-        if hasattr(self, 'spin_spawn_count'):
-            self.spin_spawn_count.setEnabled(checked)
-        if hasattr(self, 'lbl_spawn_count'):
-            self.lbl_spawn_count.setEnabled(checked)
         self._refresh_items_menu()
         
     def _on_spawn_count_changed(self, value):
@@ -931,10 +1220,13 @@ class MiroWindow(QMainWindow):
             self.sound_manager.play_sfx("skill_activate")
             
         # 랜덤 효과 발동
-        import random
         effect = random.choice(["time_pause", "time_boost", "minimap", "ghost", "xray", "eagle"])
         self._activate_specific_skill(effect)
 
+    def _on_sim_effect_triggered(self):
+        """시뮬레이션 메뉴 액션 공통 슬롯 (발동할 효과는 액션의 data)"""
+        self._activate_specific_skill(self.sender().data())
+
     def _activate_specific_skill(self, effect):
         """특정 스킬 효과 강제 발동 (시뮬레이션용)"""
         sid = self.game_session_id
@@ -1036,15 +1328,16 @@ class MiroWindow(QMainWindow):
     def _restore_info_text(self, text):
         pass # 더 이상 사용하지 않음 (메시지 라벨 분리됨)
 
-    def _on_item_checked(self, index, checked):
+    def _on_item_checked(self, path, checked):
         """개별 아이템 토글"""
-        if 0 <= index < len(self.items_list):
-            self.items_list[index]['checked'] = checked
+        for item in self.items_list:
+            if item['path'] == path:
+                item['checked'] = checked
+                break
         # UI 업데이트 불필요 (QAction이 스스로 상태 변경)
 
     def _on_add_item(self):
         """아이템 파일 추가"""
-        from PyQt5.QtWidgets import QFileDialog
         options = QFileDialog.Options()
         file_path, _ = QFileDialog.getOpenFileName(self, "Load Item File", "", "Data Files (*.dat);;All Files (*)", options=options)
         
@@ -1062,11 +1355,10 @@ class MiroWindow(QMainWindow):
             })
             self._refresh_items_menu()
 
-    def _on_remove_item(self, index):
+    def _on_remove_item(self, path, _checked=False):
         """아이템 파일 제거 (리스트에서만)"""
-        if 0 <= index < len(self.items_list):
-            del self.items_list[index]
-            self._refresh_items_menu()
+        self.items_list[:] = [item for item in self.items_list if item['path'] != path]
+        self._refresh_items_menu()
             
     def _update_ui_state(self, game_active):
         """게임 상태에 따라 UI 활성/비활성 제어"""
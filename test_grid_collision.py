@@ -0,0 +1,56 @@
+import random
+
+import numpy as np
+import pytest
+
+from miro_opengl import _make_grid_blocked, _pack_grid_rows
+
+
+def _naive_blocked(grid, x, z, min_x, min_z, inv_scale, radius):
+    """비트마스크 이전 방식: 반경 3x3 샘플 지점의 셀을 하나씩 조회"""
+    grid_height, grid_width = grid.shape
+    for sz in (z - radius, z, z + radius):
+        for sx in (x - radius, x, x + radius):
+            gx = int((sx - min_x) * inv_scale)
+            gz = int((sz - min_z) * inv_scale)
+            if gx < 0 or gz < 0 or gx >= grid_width or gz >= grid_height:
+                return True
+            if grid[gz, gx] == 1:
+                return True
+    return False
+
+
+# (반경, 셀 크기): 반경이 셀보다 작은 경우부터 딱 한 칸인 경우까지
+CASES = [(0.25, 1.0), (0.25, 0.5), (0.1, 2.0), (0.5, 0.5), (0.3, 0.75), (1.0, 1.0)]
+
+
+@pytest.mark.parametrize("radius, scale", CASES)
+def test_packed_rows_match_naive_lookup(radius, scale):
+    rng = np.random.default_rng(7)
+    random.seed(7)
+    for height, width in ((9, 13), (5, 70), (1, 1)):
+        grid = (rng.random((height, width)) < 0.3).astype(np.int8)
+        min_x, min_z = -3.0, 2.5
+        blocked = _make_grid_blocked(_pack_grid_rows(grid), width, min_x, min_z, 1.0 / scale, radius)
+
+        # 그리드 밖 여백까지 포함해 무작위 지점 비교
+        margin = radius + scale
+        for _ in range(3000):
+            x = random.uniform(min_x - margin, min_x + width * scale + margin)
+            z = random.uniform(min_z - margin, min_z + height * scale + margin)
+            assert blocked(x, z) == _naive_blocked(grid, x, z, min_x, min_z, 1.0 / scale, radius), (x, z)
+
+        # 셀 경계 위의 지점 (가장자리 셀 포함)
+        for gz in range(height + 1):
+            for gx in range(width + 1):
+                x = min_x + gx * scale
+                z = min_z + gz * scale
+                for dx, dz in ((0.0, 0.0), (radius, 0.0), (0.0, -radius), (-radius, radius)):
+                    assert blocked(x + dx, z + dz) == _naive_blocked(
+                        grid, x + dx, z + dz, min_x, min_z, 1.0 / scale, radius), (x + dx, z + dz)
+
+
+def test_radius_larger_than_cell_is_rejected():
+    grid = np.zeros((3, 3), dtype=np.int8)
+    with pytest.raises(ValueError):
+        _make_grid_blocked(_pack_grid_rows(grid), 3, 0.0, 0.0, 1.0 / 0.5, 0.6)
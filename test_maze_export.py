@@ -1,5 +1,17 @@
 import maze_generator
 import os
+import random
+import hashlib
+
+# export_to_dat 출력 고정용 기준값: (가로, 세로, 높이 변화, 벽 두께, 벽 높이, 시드) → 출력 파일 SHA-256
+# 값은 블록 단위 % 포맷으로 바꾸기 전(줄마다 f-string으로 쓰던) 내보내기 코드로 만든 파일에서 구함
+EXPORT_BASELINE = [
+    ((7, 5, False, 1.0, 1.0, 1), "a180d654c9bb7fd2c459c88e967abf972e0e7cfe70ace975892b25382a1f022e"),
+    ((15, 15, True, 1.0, 1.0, 2), "85167c3985cb981b6efa0b5d113ff809ad151693d9f3cfd4821d856daa2bcf6b"),
+    ((15, 11, False, 0.5, 1.5, 3), "edef1b908593c0923f3ec7b5cc4e9be5fcab932d578ec128a925d2cf8b2d4c25"),
+    ((21, 21, True, 1.0, 2.0, 4), "b297bd4deb2d67800ce61c714049b78e225874bf1c8d03f4f4ee85fe2f5abb08"),
+    ((9, 13, False, 0.3, 0.8, 5), "8258d9aebfd5e6072a75075e21cbd877591f6be1201a23de8ac12fc10f527948"),
+]
 
 def test_export():
     print("Testing Maze Export...")
@@ -36,5 +48,18 @@ def test_export():
     except Exception as e:
         print(f"Test failed: {e}")
 
+def test_export_matches_baseline(tmp_path):
+    """같은 시드/설정이면 내보낸 .dat 파일이 기준 출력과 바이트 단위로 같아야 함"""
+    for (width, height, height_var, thickness, wall_height, seed), expected in EXPORT_BASELINE:
+        random.seed(seed)
+        maze = maze_generator.Maze(width, height, enable_height_variation=height_var)
+        maze.generate()
+
+        filepath = os.path.join(str(tmp_path), f"maze_{seed}.dat")
+        maze.export_to_dat(filepath, wall_thickness=thickness, wall_height=wall_height)
+        with open(filepath, 'rb') as f:
+            digest = hashlib.sha256(f.read()).hexdigest()
+        assert digest == expected, f"export output changed for {width}x{height} (seed {seed})"
+
 if __name__ == "__main__":
     test_export()